@@ -11,5 +11,6 @@ python manage.py collectstatic --no-input
 # Apply ane outstanding database migrations
 python manage.py migrate
 
-# Load fixtures
-python manage.py loaddata data.json
\ No newline at end of file
+# Sync fixtures; unchanged files and objects are skipped by content hash,
+# and derived columns, counters and the search index follow the writes
+python manage.py sync_fixtures data.json
@@ -1,6 +1,13 @@
 from django.contrib import admin, messages
 
-from news.models import Redactor, Topic, Newspaper, Keyword
+from news.models import (
+    Redactor,
+    Topic,
+    Newspaper,
+    Keyword,
+    deferred_newspaper_changes,
+)
+from news.pagination import CachedCountPaginator
 
 
 @admin.register(Redactor)
@@ -18,6 +25,8 @@ class RedactorAdmin(admin.ModelAdmin):
     search_fields = ("username", "first_name", "last_name")
     list_filter = ("years_of_experience", "is_staff", "is_superuser")
     ordering = ("first_name", "last_name")
+    paginator = CachedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Topic)
@@ -49,6 +58,12 @@ class NewspaperAdmin(admin.ModelAdmin):
     list_filter = ("published_date", "topic")
     ordering = ("title", "published_date")
     filter_horizontal = ("publishers", "keywords")
+    paginator = CachedCountPaginator
+    show_full_result_count = False
+
+    def changeform_view(self, *args, **kwargs):
+        with deferred_newspaper_changes():
+            return super().changeform_view(*args, **kwargs)
 
 
 @admin.register(Keyword)
@@ -0,0 +1,231 @@
+"""
+Read-only JSON API for articles, with a streamed NDJSON export.
+"""
+
+import json
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views import View
+
+from news.forms import NewspaperFilterForm
+from news.models import Keyword, Newspaper, Redactor
+from news.pagination import CursorPaginator, InvalidCursor
+
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+EXPORT_CHUNK_SIZE = 500
+
+
+def api_queryset():
+    """
+    Articles with everything the serializer touches fetched up front.
+    """
+    return (
+        Newspaper.objects.select_related("topic")
+        .defer("search_document", "search_vector")
+        .prefetch_related(
+            Prefetch(
+                "publishers",
+                queryset=Redactor.objects.only(
+                    "id", "username", "first_name", "last_name"
+                ),
+            ),
+            Prefetch("keywords", queryset=Keyword.objects.only("id", "name")),
+        )
+    )
+
+
+def serialize_newspaper(newspaper) -> dict:
+    return {
+        "id": newspaper.id,
+        "title": newspaper.title,
+        "published_date": newspaper.published_date,
+        "updated_at": newspaper.updated_at,
+        "revision": newspaper.revision,
+        "topic": {"id": newspaper.topic_id, "name": newspaper.topic.name},
+        "publishers": [
+            {
+                "id": publisher.id,
+                "username": publisher.username,
+                "full_name": publisher.get_full_name(),
+            }
+            for publisher in newspaper.publishers.all()
+        ],
+        "keywords": [
+            {"id": keyword.id, "name": keyword.name}
+            for keyword in newspaper.keywords.all()
+        ],
+        "excerpt": newspaper.excerpt,
+        "content": newspaper.content,
+        "url": reverse("newspaper-detail", args=[newspaper.id]),
+    }
+
+
+class ApiLoginRequiredMixin(LoginRequiredMixin):
+    """
+    Answers anonymous requests with 403, awaiting the user in async views.
+    """
+
+    raise_exception = True
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(
+            request, *args, **kwargs
+        )
+
+
+class FilteredNewspaperApiMixin:
+    def get_filtered_queryset(self):
+        """
+        Returns the filtered articles, or None if the filters are invalid.
+        """
+        self.filter_form = NewspaperFilterForm(self.request.GET)
+        if not self.filter_form.is_valid():
+            return None
+        return self.filter_form.filter_queryset(api_queryset())
+
+    async def aget_filtered_queryset(self):
+        self.filter_form = NewspaperFilterForm(self.request.GET)
+        if not self.filter_form.is_valid():
+            return None
+        return await self.filter_form.afilter_queryset(api_queryset())
+
+    def invalid_filters_response(self):
+        return JsonResponse({"errors": self.filter_form.errors}, status=400)
+
+
+class NewspaperApiListView(
+    ApiLoginRequiredMixin, FilteredNewspaperApiMixin, View
+):
+    cursor_kwarg = "cursor"
+    replica_reads = True
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_filtered_queryset()
+        if queryset is None:
+            return self.invalid_filters_response()
+
+        paginator = CursorPaginator(queryset, self.get_limit(), ("id",))
+        try:
+            page = paginator.page(request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            return self.invalid_cursor_response()
+        return self.page_response(page)
+
+    def invalid_cursor_response(self):
+        return JsonResponse(
+            {"errors": {"cursor": ["Invalid cursor."]}}, status=400
+        )
+
+    def page_response(self, page):
+        return JsonResponse(
+            {
+                "results": [serialize_newspaper(item) for item in page],
+                "next": self.cursor_url(page.next_cursor),
+                "previous": self.cursor_url(page.previous_cursor),
+            }
+        )
+
+    def get_limit(self) -> int:
+        try:
+            limit = int(self.request.GET.get("limit", API_PAGE_SIZE))
+        except ValueError:
+            return API_PAGE_SIZE
+        return min(max(limit, 1), API_MAX_PAGE_SIZE)
+
+    def cursor_url(self, cursor):
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params[self.cursor_kwarg] = cursor
+        return self.request.build_absolute_uri(f"?{params.urlencode()}")
+
+
+class NewspaperApiDetailView(ApiLoginRequiredMixin, View):
+    replica_reads = True
+
+    def get(self, request, pk, *args, **kwargs):
+        newspaper = get_object_or_404(api_queryset(), pk=pk)
+        return JsonResponse(serialize_newspaper(newspaper))
+
+
+class NewspaperExportView(
+    ApiLoginRequiredMixin, FilteredNewspaperApiMixin, View
+):
+    replica_reads = True
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_filtered_queryset()
+        if queryset is None:
+            return self.invalid_filters_response()
+
+        return StreamingHttpResponse(
+            self.stream(queryset.order_by("id")),
+            content_type="application/x-ndjson",
+        )
+
+    @staticmethod
+    def stream(queryset):
+        for newspaper in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield json.dumps(
+                serialize_newspaper(newspaper), cls=DjangoJSONEncoder
+            ) + "\n"
+
+
+class AsyncNewspaperApiListView(NewspaperApiListView):
+    async def get(self, request, *args, **kwargs):
+        queryset = await self.aget_filtered_queryset()
+        if queryset is None:
+            return self.invalid_filters_response()
+
+        paginator = CursorPaginator(queryset, self.get_limit(), ("id",))
+        try:
+            page = await paginator.apage(request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            return self.invalid_cursor_response()
+        return self.page_response(page)
+
+
+class AsyncNewspaperApiDetailView(ApiLoginRequiredMixin, View):
+    replica_reads = True
+
+    async def get(self, request, pk, *args, **kwargs):
+        try:
+            newspaper = await api_queryset().aget(pk=pk)
+        except Newspaper.DoesNotExist:
+            raise Http404("No article found.")
+        return JsonResponse(serialize_newspaper(newspaper))
+
+
+class AsyncNewspaperExportView(NewspaperExportView):
+    async def get(self, request, *args, **kwargs):
+        queryset = await self.aget_filtered_queryset()
+        if queryset is None:
+            return self.invalid_filters_response()
+
+        return StreamingHttpResponse(
+            self.astream(queryset.order_by("id")),
+            content_type="application/x-ndjson",
+        )
+
+    @staticmethod
+    async def astream(queryset):
+        async for newspaper in queryset.aiterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        ):
+            yield json.dumps(
+                serialize_newspaper(newspaper), cls=DjangoJSONEncoder
+            ) + "\n"
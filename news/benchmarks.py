@@ -0,0 +1,142 @@
+"""
+Deterministic synthetic corpus shared by the benchmark commands.
+"""
+
+import json
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+
+from django.core.management import call_command
+
+BENCH_USERNAME = "bench-{seed}-{index}"
+FIRST_NAMES = (
+    "Ada", "Boris", "Chloe", "Dmytro", "Elena", "Farid", "Greta", "Hugo",
+    "Iris", "Jonas", "Kira", "Leon", "Maya", "Nikolai", "Olga", "Pablo",
+)
+LAST_NAMES = (
+    "Adams", "Bondar", "Costa", "Dubois", "Evans", "Fischer", "Garcia",
+    "Horvat", "Ivanova", "Jensen", "Kowalski", "Lopez", "Moreau", "Novak",
+)
+TOPICS = (
+    "Politics", "Economy", "Technology", "Science", "Health", "Sports",
+    "Culture", "Travel", "Education", "Environment", "Business", "World",
+)
+VOCABULARY = (
+    "market", "election", "vote", "city", "council", "energy", "climate",
+    "report", "study", "team", "season", "league", "budget", "tax",
+    "policy", "school", "health", "vaccine", "hospital", "festival",
+    "film", "music", "museum", "startup", "software", "network", "data",
+    "security", "river", "forest", "coast", "storm", "harvest", "price",
+    "trade", "bank", "court", "minister", "reform", "protest", "research",
+    "planet", "mission", "engine", "airport", "railway", "bridge", "port",
+    "village", "region", "border", "summit", "treaty", "growth", "crisis",
+    "record", "final", "coach", "player", "stadium", "award", "review",
+)
+START_DATE = date(2020, 1, 1)
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def corpus_sizes(articles: int) -> dict:
+    return {
+        "articles": articles,
+        "redactors": max(10, articles // 50),
+        "topics": min(200, max(len(TOPICS), articles // 5000)),
+        "keywords": max(50, articles // 10),
+    }
+
+
+def topic_name(index: int) -> str:
+    name = TOPICS[index % len(TOPICS)]
+    if index >= len(TOPICS):
+        name += f" {index // len(TOPICS) + 1}"
+    return name
+
+
+def keyword_name(index: int) -> str:
+    word = VOCABULARY[index % len(VOCABULARY)]
+    if index >= len(VOCABULARY):
+        word += f"-{index // len(VOCABULARY)}"
+    return word
+
+
+def skewed_index(rng: random.Random, size: int) -> int:
+    """
+    Log-uniform pick in range(size): low indexes are the popular ones.
+    """
+    return min(int(size ** rng.random()) - 1, size - 1)
+
+
+def corpus_records(seed: int, sizes: dict):
+    """
+    Yields import_articles records; redactor 0 co-authors the first one.
+    """
+    rng = random.Random(seed)
+    for number in range(sizes["articles"]):
+        publishers = {
+            skewed_index(rng, sizes["redactors"])
+            for _ in range(rng.choices((1, 2, 3), (70, 25, 5))[0])
+        }
+        if number == 0:
+            publishers.add(0)
+        keywords = {
+            skewed_index(rng, sizes["keywords"])
+            for _ in range(rng.randint(0, 6))
+        }
+        yield {
+            "title": (
+                f"{rng.choice(VOCABULARY).capitalize()} "
+                f"{rng.choice(VOCABULARY)} {number}"
+            ),
+            "content": " ".join(
+                rng.choices(VOCABULARY, k=rng.randint(80, 600))
+            ),
+            "topic": topic_name(skewed_index(rng, sizes["topics"])),
+            "published_date": (
+                START_DATE + timedelta(days=rng.randrange(5 * 365))
+            ).isoformat(),
+            "publishers": [
+                BENCH_USERNAME.format(seed=seed, index=index)
+                for index in sorted(publishers)
+            ],
+            "keywords": [keyword_name(index) for index in sorted(keywords)],
+        }
+
+
+def generate_corpus(seed: int, sizes: dict, batch_size: int, stdout) -> None:
+    """
+    Creates the redactors and imports the articles from a temporary file.
+    """
+    from news.models import Redactor
+
+    rng = random.Random(seed)
+    Redactor.objects.bulk_create(
+        [
+            Redactor(
+                username=BENCH_USERNAME.format(seed=seed, index=index),
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                password="!",
+            )
+            for index in range(sizes["redactors"])
+        ],
+        batch_size=batch_size,
+    )
+
+    handle, path = tempfile.mkstemp(suffix=".ndjson")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as output:
+            for record in corpus_records(seed, sizes):
+                output.write(json.dumps(record) + "\n")
+        call_command(
+            "import_articles", path, batch_size=batch_size, stdout=stdout
+        )
+    finally:
+        os.remove(path)
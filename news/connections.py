@@ -0,0 +1,111 @@
+"""
+Per-process database connection reuse statistics.
+"""
+
+import os
+from collections import Counter, defaultdict
+from threading import Lock
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import JsonResponse
+
+_counters = defaultdict(Counter)
+_lock = Lock()
+
+
+def record(alias: str, name: str, amount: int = 1) -> None:
+    with _lock:
+        _counters[alias][name] += amount
+
+
+def reset_stats() -> None:
+    with _lock:
+        _counters.clear()
+
+
+@receiver(connection_created)
+def count_connect(sender, connection, **kwargs):
+    record(connection.alias, "connects")
+
+
+def install_execute_wrapper(connection, wrapper) -> None:
+    """
+    Adds the wrapper to the connection unless it is already installed.
+    """
+    # Pooled connections fire connection_created on every checkout.
+    if wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(wrapper)
+
+
+@receiver(request_started)
+def count_reuse(**kwargs):
+    """
+    Counts the connections still open when a request starts as reused.
+    """
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            record(connection.alias, "reuses")
+
+
+def get_pool(connection):
+    return getattr(connection, "pool", None)
+
+
+def connection_stats() -> dict:
+    """
+    Returns checkout, handshake and wait figures for every alias.
+    """
+    with _lock:
+        counters = {alias: Counter(c) for alias, c in _counters.items()}
+
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        counter = counters.get(alias, Counter())
+        pool = get_pool(connection)
+        settings_dict = connection.settings_dict
+        if pool is not None:
+            # Every checkout from the pool fires connection_created.
+            pool_stats = pool.get_stats()
+            checkouts = counter["connects"]
+            handshakes = pool_stats.get("connections_num", 0)
+            entry = {
+                "mode": "pool",
+                "pool_size": pool_stats.get("pool_size", 0),
+                "pool_available": pool_stats.get("pool_available", 0),
+                "pool_max": pool.max_size,
+                "waits": pool_stats.get("requests_queued", 0),
+                "wait_ms": pool_stats.get("requests_wait_ms", 0),
+                "wait_errors": pool_stats.get("requests_errors", 0),
+            }
+        else:
+            checkouts = counter["connects"] + counter["reuses"]
+            handshakes = counter["connects"]
+            entry = {
+                "mode": (
+                    "persistent" if settings_dict["CONN_MAX_AGE"] != 0
+                    else "per-request"
+                ),
+                "waits": 0,
+                "wait_ms": 0,
+            }
+        stats[alias] = {
+            **entry,
+            "conn_max_age": settings_dict["CONN_MAX_AGE"],
+            "health_checks": settings_dict["CONN_HEALTH_CHECKS"],
+            "checkouts": checkouts,
+            "handshakes": handshakes,
+            "handshakes_avoided": max(checkouts - handshakes, 0),
+        }
+    return stats
+
+
+@staff_member_required
+def connection_stats_view(request):
+    return JsonResponse(
+        {"pid": os.getpid(), "databases": connection_stats()}
+    )
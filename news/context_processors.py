@@ -0,0 +1,8 @@
+from news.topics import topic_navigation as cached_topic_navigation
+
+
+def topic_navigation(request):
+    """
+    Adds the sidebar topics with their article counts to every template.
+    """
+    return {"topic_navigation": cached_topic_navigation()}
@@ -0,0 +1,151 @@
+"""
+RSS and Atom feeds of the latest articles, site-wide and per topic.
+"""
+
+import datetime
+import hashlib
+import json
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import OuterRef, Subquery
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import quote_etag, urlencode
+
+from news.models import Newspaper, Topic
+
+FEED_ITEMS = 20
+
+
+class LatestNewspapersFeed(Feed):
+    title = "VoicePress"
+    description = "The latest articles published on VoicePress."
+    replica_reads = True
+
+    def __call__(self, request, *args, **kwargs):
+        etag = self.etag(kwargs.get("pk"))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self.cached_response(request, etag, *args, **kwargs)
+
+        # Feed sets it from the newest item; see etag().
+        del response["Last-Modified"]
+        response["ETag"] = etag
+        return response
+
+    def cached_response(self, request, etag, *args, **kwargs):
+        key = (
+            f"news:feed:{request.scheme}://{request.get_host()}:"
+            + etag.strip('"')
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        response = super().__call__(request, *args, **kwargs)
+        cache.set(
+            key,
+            (response.content, response["Content-Type"]),
+            getattr(settings, "FEED_CACHE_TIMEOUT", 60 * 60),
+        )
+        return response
+
+    def etag(self, topic_id=None):
+        """
+        Returns the ETag of the feed's current state.
+        """
+        # Only an ETag: the newest updated_at, unlike the count, stays put
+        # when an article is deleted or moved to another topic.
+        # Not topic_navigation(): its cache is local to the writing process.
+        topics = Topic.objects.order_by("id")
+        if topic_id is not None:
+            topics = topics.filter(pk=topic_id)
+        topics = list(
+            topics.annotate(
+                last_modified=Subquery(
+                    Newspaper.objects.filter(topic=OuterRef("pk"))
+                    .order_by("-updated_at")
+                    .values("updated_at")[:1]
+                )
+            ).values_list("id", "name", "newspaper_count", "last_modified")
+        )
+        if topic_id is not None and not topics:
+            raise Http404("No such topic.")
+
+        state = [self.feed_type.__name__, topic_id, topics]
+        digest = hashlib.md5(
+            json.dumps(state, cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+        return quote_etag(digest)
+
+    def link(self):
+        return reverse("index")
+
+    def items(self):
+        return self.latest(Newspaper.objects.all())
+
+    @staticmethod
+    def latest(queryset):
+        return (
+            queryset.select_related("topic")
+            .defer("content", "search_document", "search_vector")
+            .order_by("-published_date", "-id")[:FEED_ITEMS]
+        )
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.excerpt
+
+    def item_link(self, item):
+        return reverse("newspaper-detail", args=[item.pk])
+
+    def item_pubdate(self, item):
+        return datetime.datetime.combine(
+            item.published_date,
+            datetime.time(),
+            tzinfo=datetime.timezone.utc,
+        )
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_categories(self, item):
+        return [item.topic.name]
+
+
+class LatestNewspapersAtomFeed(LatestNewspapersFeed):
+    feed_type = Atom1Feed
+    subtitle = LatestNewspapersFeed.description
+
+
+class TopicNewspapersFeed(LatestNewspapersFeed):
+    def get_object(self, request, pk):
+        return get_object_or_404(Topic, pk=pk)
+
+    def title(self, obj):
+        return f"VoicePress: {obj.name}"
+
+    def description(self, obj):
+        return f"The latest {obj.name} articles published on VoicePress."
+
+    def link(self, obj):
+        return f"{reverse('index')}?{urlencode({'category': obj.name})}"
+
+    def items(self, obj):
+        return self.latest(Newspaper.objects.filter(topic=obj))
+
+
+class TopicNewspapersAtomFeed(TopicNewspapersFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
@@ -1,8 +1,62 @@
 from django.contrib.auth.forms import UserCreationForm
-from news.models import Newspaper, Redactor
+from django.urls import reverse_lazy
+from news.models import Newspaper, Redactor, deferred_newspaper_changes
+from news.search import normalize_query, search_newspapers
+from news.topics import topic_ids
 from django import forms
 
 
+class PublisherAutocompleteWidget(forms.SelectMultiple):
+    """
+    Multiple select that renders only the selected redactors.
+    """
+
+    class Media:
+        js = ("js/publisher_autocomplete.js",)
+
+    def __init__(self, attrs=None):
+        super().__init__(
+            attrs={
+                "class": "form-control",
+                "data-autocomplete-url": reverse_lazy(
+                    "publisher-autocomplete"
+                ),
+                **(attrs or {}),
+            }
+        )
+
+    def optgroups(self, name, value, attrs=None):
+        selected_ids = [pk for pk in value if str(pk).isdigit()]
+        if not selected_ids:
+            return []
+
+        redactors = self.choices.queryset.filter(pk__in=selected_ids)
+        return [
+            (
+                None,
+                [
+                    self.create_option(
+                        name,
+                        redactor.pk,
+                        publisher_label(redactor),
+                        True,
+                        index,
+                        attrs=attrs,
+                    )
+                ],
+                index,
+            )
+            for index, redactor in enumerate(redactors)
+        ]
+
+
+def publisher_label(redactor) -> str:
+    full_name = redactor.get_full_name()
+    if full_name:
+        return f"{redactor.username} ({full_name})"
+    return redactor.username
+
+
 class RedactorCreationForm(UserCreationForm):
     class Meta:
         model = Redactor
@@ -18,35 +72,25 @@ class NewspaperForm(forms.ModelForm):
     )
     publishers = forms.ModelMultipleChoiceField(
         queryset=Redactor.objects.all(),
-        widget=forms.SelectMultiple(attrs={"class": "form-control"}),
+        widget=PublisherAutocompleteWidget(),
         required=False,
         help_text="Add other authors if needed",
     )
 
     class Meta:
         model = Newspaper
-        fields = ["title", "content", "topic", "publishers", "keywords"]
+        fields = ["title", "content", "topic", "publishers"]
 
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop("user", None)
         super().__init__(*args, **kwargs)
+        self.creating = self.instance._state.adding
 
         if self.instance and self.instance.pk:
             self.initial["keywords"] = ", ".join(
                 keyword.name for keyword in self.instance.keywords.all()
             )
 
-    def clean_title(self):
-        title = self.cleaned_data.get("title")
-        if self.instance and self.instance.title == title:
-            return title
-
-        if Newspaper.objects.filter(title=title).exists():
-            raise forms.ValidationError(
-                "An article with this title already exists."
-            )
-        return title
-
     def clean_keywords(self):
         keywords = self.cleaned_data["keywords"]
         keyword_list = [kw.strip() for kw in keywords.split(",") if kw.strip()]
@@ -59,6 +103,31 @@ class NewspaperForm(forms.ModelForm):
             publishers.append(self.user)
         return publishers
 
+    def save(self, commit=True):
+        """
+        Writes only the columns and relations that changed.
+        """
+        if not commit:
+            return super().save(commit)
+        with deferred_newspaper_changes():
+            if self.creating:
+                return super().save(commit)
+
+            changed_columns = [
+                name for name in self.changed_data
+                if name in ("title", "content", "topic")
+            ]
+            if changed_columns:
+                self.instance.save(update_fields=changed_columns)
+            self._save_m2m()
+        return self.instance
+
+    def _save_m2m(self):
+        if self.creating or "publishers" in self.changed_data:
+            super()._save_m2m()
+        if self.creating or "keywords" in self.changed_data:
+            self.instance.set_keywords(self.cleaned_data.get("keywords", []))
+
 
 class RedactorUpdateForm(forms.ModelForm):
     class Meta:
@@ -79,7 +148,11 @@ class RedactorUpdateForm(forms.ModelForm):
         return email
 
 
-class SearchForm(forms.ModelForm):
+class SearchForm(forms.Form):
+    """
+    Search box of the index page.
+    """
+
     query = forms.CharField(
         label="Search",
         widget=forms.TextInput(
@@ -91,6 +164,61 @@ class SearchForm(forms.ModelForm):
         required=False,
     )
 
-    class Meta:
-        model = Newspaper
-        fields = ["query"]
+
+class NewspaperFilterForm(forms.Form):
+    """
+    Article list filters shared by the index page and the API.
+    """
+
+    category = forms.CharField(required=False)
+    query = forms.CharField(required=False)
+    date_from = forms.DateField(required=False)
+    date_to = forms.DateField(required=False)
+
+    def filter_queryset(self, queryset):
+        """
+        Applies the valid filters to the queryset; invalid ones are ignored.
+        """
+        self.is_valid()
+        category = self.cleaned_data.get("category")
+        topic_id = topic_ids.get(category) if category else None
+        return self._apply_filters(queryset, topic_id)
+
+    async def afilter_queryset(self, queryset):
+        """
+        Async variant of ``filter_queryset()``.
+        """
+        self.is_valid()
+        category = self.cleaned_data.get("category")
+        topic_id = await topic_ids.aget(category) if category else None
+        return self._apply_filters(queryset, topic_id)
+
+    def count_key(self) -> tuple:
+        """
+        Identifies the filtered result set for cached counts.
+        """
+        return (
+            (self.data.get("category") or "").casefold(),
+            normalize_query(self.data.get("query", "")),
+            self.data.get("date_from", ""),
+            self.data.get("date_to", ""),
+        )
+
+    def _apply_filters(self, queryset, topic_id):
+        data = self.cleaned_data
+        query = normalize_query(data.get("query") or "")
+
+        if data.get("category"):
+            if topic_id is None:
+                return queryset.none()
+            queryset = queryset.filter(topic_id=topic_id)
+
+        if data.get("date_from"):
+            queryset = queryset.filter(published_date__gte=data["date_from"])
+        if data.get("date_to"):
+            queryset = queryset.filter(published_date__lte=data["date_to"])
+
+        if query:
+            queryset = search_newspapers(queryset, query)
+
+        return queryset
@@ -0,0 +1,46 @@
+"""
+Cache of rendered article cards, keyed by article id and revision.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+CARD_TEMPLATE = "pages/newspaper_card.html"
+
+
+def render_newspaper_cards(newspapers) -> list:
+    """
+    Returns (newspaper, html) pairs, rendering only uncached cards.
+    """
+    newspapers = list(newspapers)
+    timeout = getattr(settings, "NEWSPAPER_CARD_CACHE_TIMEOUT", 60 * 60 * 24)
+
+    card_keys = {
+        newspaper.pk: f"news:card:{newspaper.pk}:{newspaper.revision}"
+        for newspaper in newspapers
+    }
+    cards = cache.get_many(card_keys.values())
+
+    missing = [
+        newspaper
+        for newspaper in newspapers
+        if card_keys[newspaper.pk] not in cards
+    ]
+    if missing:
+        prefetch_related_objects(missing, "publishers")
+        rendered = {
+            card_keys[newspaper.pk]: render_to_string(
+                CARD_TEMPLATE, {"newspaper": newspaper}
+            )
+            for newspaper in missing
+        }
+        cache.set_many(rendered, timeout)
+        cards.update(rendered)
+
+    return [
+        (newspaper, mark_safe(cards[card_keys[newspaper.pk]]))
+        for newspaper in newspapers
+    ]
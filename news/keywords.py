@@ -0,0 +1,140 @@
+"""
+Batched keyword resolution and keyword usage counters.
+"""
+
+from collections import defaultdict
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+
+TOP_KEYWORDS_CACHE_KEY = "news:top-keywords"
+
+
+def clean_keyword_names(names: Iterable[str]) -> list:
+    """
+    Strips names and drops blanks and duplicates, keeping the order.
+    """
+    return list(dict.fromkeys(name.strip() for name in names if name.strip()))
+
+
+def resolve_keyword_ids(
+    names: Iterable[str], using: str = DEFAULT_DB_ALIAS
+) -> dict:
+    """
+    Returns a name -> id mapping, creating the missing keywords in bulk.
+    """
+    from news.models import Keyword
+
+    names = clean_keyword_names(names)
+    if not names:
+        return {}
+
+    keywords = Keyword.objects.using(using)
+    found = dict(keywords.filter(name__in=names).values_list("name", "id"))
+    new_names = [name for name in names if name not in found]
+    if new_names:
+        keywords.bulk_create(
+            [Keyword(name=name) for name in new_names], ignore_conflicts=True
+        )
+        found.update(
+            keywords.filter(name__in=new_names).values_list("name", "id")
+        )
+    return {name: found[name] for name in names}
+
+
+def set_newspaper_keywords(newspaper, names: Iterable[str]) -> None:
+    """
+    Replaces the newspaper's keywords with the given names.
+    """
+    using = newspaper._state.db or DEFAULT_DB_ALIAS
+    newspaper.keywords.set(resolve_keyword_ids(names, using=using).values())
+
+
+def adjust_keyword_counts(deltas: dict, using: str) -> None:
+    """
+    Applies {keyword_id: delta} changes to the usage counters.
+    """
+    from news.models import Keyword
+
+    keyword_ids_by_delta = defaultdict(list)
+    for keyword_id, delta in deltas.items():
+        if delta:
+            keyword_ids_by_delta[delta].append(keyword_id)
+    if not keyword_ids_by_delta:
+        return
+
+    Keyword.objects.using(using).filter(
+        pk__in=[pk for pks in keyword_ids_by_delta.values() for pk in pks]
+    ).update(
+        usage_count=Greatest(
+            F("usage_count")
+            + Case(
+                *[
+                    When(pk__in=pks, then=Value(delta))
+                    for delta, pks in keyword_ids_by_delta.items()
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+    )
+
+
+def recount_keyword_usage(keywords) -> int:
+    """
+    Recounts the given keywords, writing only the counters that drifted.
+    """
+    from news.models import Newspaper
+
+    usage_count = Coalesce(
+        Subquery(
+            Newspaper.keywords.through.objects.using(keywords.db)
+            .filter(keyword_id=OuterRef("pk"))
+            .order_by()
+            .values("keyword_id")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+    return keywords.exclude(usage_count=usage_count).update(
+        usage_count=usage_count
+    )
+
+
+def top_keywords(limit: int = 30) -> list:
+    """
+    Returns the most used keywords with a Bootstrap fs-* size for each.
+    """
+    from news.models import Keyword
+
+    key = f"{TOP_KEYWORDS_CACHE_KEY}:{limit}"
+    keywords = cache.get(key)
+    if keywords is None:
+        keywords = list(
+            Keyword.objects.filter(usage_count__gt=0)
+            .order_by("-usage_count", "name")
+            .values("id", "name", "usage_count")[:limit]
+        )
+        if keywords:
+            most_used = keywords[0]["usage_count"]
+            for keyword in keywords:
+                keyword["size"] = 6 - round(
+                    4 * keyword["usage_count"] / most_used
+                )
+        cache.set(key, keywords, settings.TOP_KEYWORDS_CACHE_TIMEOUT)
+    return keywords
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from news.models import Newspaper
+
+
+class Command(BaseCommand):
+    help = "Recomputes the stored excerpt and word count of every newspaper."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of newspapers updated per batch.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        newspapers = Newspaper.objects.order_by("id").only("id", "content")
+
+        batch = []
+        updated = 0
+        for newspaper in newspapers.iterator(chunk_size=batch_size):
+            newspaper.refresh_excerpt()
+            batch.append(newspaper)
+            if len(batch) == batch_size:
+                updated += self._flush(batch)
+                batch = []
+        updated += self._flush(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled {updated} excerpts.")
+        )
+
+    def _flush(self, batch) -> int:
+        Newspaper.objects.bulk_update(batch, ["excerpt", "word_count"])
+        return len(batch)
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news.benchmarks import percentile
+
+SYNC_SERVER = [
+    "-m", "gunicorn", "newspaper_agency.wsgi:application",
+    "--worker-class", "sync", "--log-level", "warning",
+]
+ASYNC_SERVER = [
+    "-m", "uvicorn", "newspaper_agency.asgi:application",
+    "--log-level", "warning",
+]
+
+
+async def fetch(host: str, port: int, path: str, cookie: str = "") -> int:
+    """
+    Issues one GET request and returns the response status.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    headers = f"Cookie: {cookie}\r\n" if cookie else ""
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{headers}"
+            f"Connection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        while await reader.read(1 << 16):
+            pass
+    finally:
+        writer.close()
+    return int(status_line.split()[1])
+
+
+async def run_load(
+    host, port, path, requests, concurrency, cookie=""
+) -> dict:
+    """
+    Sends the GET requests from concurrent clients.
+    """
+    latencies, errors = [], 0
+    remaining = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                status = await fetch(host, port, path, cookie)
+            except OSError:
+                status = 0
+            latencies.append(time.perf_counter() - started)
+            if not 200 <= status < 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    return {
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the sync views under gunicorn with their async "
+        "variants under uvicorn at high concurrency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--paths",
+            nargs="+",
+            default=["/"],
+            help="Sync paths to load; the async variant is /async<path>.",
+        )
+        parser.add_argument(
+            "--cookie",
+            default="",
+            help=(
+                "Cookie header to send, e.g. sessionid=<key> for the "
+                "login-only paths such as /api/newspapers/."
+            ),
+        )
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=200)
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8101)
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the results as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        host, port = options["host"], options["port"]
+        workers = str(options["workers"])
+        servers = [
+            (
+                "sync/gunicorn",
+                SYNC_SERVER + [
+                    "--workers", workers, "--bind", f"{host}:{port}",
+                ],
+                "",
+            ),
+            (
+                "async/uvicorn",
+                ASYNC_SERVER + [
+                    "--workers", workers,
+                    "--host", host, "--port", str(port),
+                ],
+                "/async",
+            ),
+        ]
+
+        results = []
+        for name, command, prefix in servers:
+            process = subprocess.Popen(
+                [sys.executable, *command], env=os.environ.copy()
+            )
+            try:
+                self.wait_for_port(host, port)
+                for path in options["paths"]:
+                    result = asyncio.run(
+                        run_load(
+                            host,
+                            port,
+                            prefix + path,
+                            options["requests"],
+                            options["concurrency"],
+                            options["cookie"],
+                        )
+                    )
+                    results.append({"server": name, **result})
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        for result in results:
+            self.stdout.write(
+                f"{result['server']:<14} {result['path']:<28} "
+                f"{result['requests_per_second']:>8} req/s  "
+                f"p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  "
+                f"p99 {result['p99_ms']} ms  errors {result['errors']}"
+            )
+
+    @staticmethod
+    def wait_for_port(host, port, timeout=30) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((host, port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError(f"Server did not start on {host}:{port}.")
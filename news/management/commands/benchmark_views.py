@@ -0,0 +1,324 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from io import StringIO
+from urllib.parse import urlencode
+
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from news.benchmarks import (
+    BENCH_USERNAME,
+    VOCABULARY,
+    corpus_sizes,
+    generate_corpus,
+    percentile,
+)
+from news.models import Keyword, Newspaper, Redactor
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the pages of news/urls.py through the test client on a "
+        "generated corpus and reports latency percentiles, query counts "
+        "and peak memory per route as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--articles",
+            type=int,
+            default=1000,
+            help="Corpus size; redactors, topics and keywords scale with it.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Articles inserted per transaction while generating.",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="JSON report path, or - for standard output.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the test database and its corpus for the next run.",
+        )
+        parser.add_argument(
+            "--no-test-db",
+            action="store_true",
+            help=(
+                "Use the configured database instead of a test database. "
+                "The corpus is added to it unless already present."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        sizes = corpus_sizes(options["articles"])
+
+        old_name = None
+        if not options["no_test_db"]:
+            old_name = connection.creation.create_test_db(
+                verbosity=max(self.verbosity - 1, 0),
+                autoclobber=True,
+                keepdb=options["keepdb"],
+            )
+        try:
+            # Replica aliases would point at real servers.
+            with override_settings(DATABASE_REPLICAS=[]):
+                user = self.ensure_corpus(options["seed"], sizes, options)
+                routes = self.routes(user)
+                results = [
+                    self.measure(user, *route, options) for route in routes
+                ]
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(
+                    old_name,
+                    verbosity=max(self.verbosity - 1, 0),
+                    keepdb=options["keepdb"],
+                )
+
+        report = json.dumps(
+            {
+                "commit": git_commit(),
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "seed": options["seed"],
+                "iterations": options["iterations"],
+                "corpus": sizes,
+                "routes": results,
+            },
+            indent=2,
+        )
+        if options["output"] == "-":
+            self.stdout.write(report)
+        else:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                output.write(report + "\n")
+            self.stderr.write(f"Wrote {options['output']}.")
+
+    def ensure_corpus(self, seed, sizes, options):
+        username = BENCH_USERNAME.format(seed=seed, index=0)
+        user = Redactor.objects.filter(username=username).first()
+        if user is None:
+            if self.verbosity:
+                self.stderr.write(
+                    f"Generating {sizes['articles']} articles..."
+                )
+            started = time.perf_counter()
+            generate_corpus(
+                seed,
+                sizes,
+                options["batch_size"],
+                self.stderr if self.verbosity > 1 else StringIO(),
+            )
+            if self.verbosity:
+                self.stderr.write(
+                    f"Generated in {time.perf_counter() - started:.1f}s."
+                )
+            user = Redactor.objects.get(username=username)
+        elif Newspaper.objects.count() < sizes["articles"]:
+            raise CommandError(
+                "The database holds a smaller corpus for this seed; "
+                "drop it or use another seed."
+            )
+        return user
+
+    def routes(self, user) -> list:
+        """
+        Returns (name, method, path, data) for every benchmarked request.
+        """
+        article = user.redactor_newspapers.order_by("id").first()
+        topic_name = article.topic.name
+        keyword = Keyword.objects.order_by("-usage_count", "id").first()
+        word = VOCABULARY[0]
+        index = reverse("index")
+        article_form = {
+            "title": "Benchmark article",
+            "content": " ".join(VOCABULARY),
+            "topic": article.topic_id,
+            "publishers": [user.pk],
+            "keywords": f"{VOCABULARY[1]}, {VOCABULARY[2]}",
+        }
+        return [
+            ("index", "get", index, None),
+            (
+                "index category",
+                "get",
+                f"{index}?{urlencode({'category': topic_name})}",
+                None,
+            ),
+            (
+                "index query",
+                "get",
+                f"{index}?{urlencode({'query': word})}",
+                None,
+            ),
+            (
+                "index category query",
+                "get",
+                f"{index}?"
+                f"{urlencode({'category': topic_name, 'query': word})}",
+                None,
+            ),
+            (
+                "detail",
+                "get",
+                reverse("newspaper-detail", args=[article.pk]),
+                None,
+            ),
+            (
+                "keyword",
+                "get",
+                reverse("keyword-detail", args=[keyword.pk]),
+                None,
+            ),
+            ("my articles", "get", reverse("my-articles"), None),
+            ("profile", "get", reverse("profile"), None),
+            ("profile edit", "get", reverse("user-update"), None),
+            (
+                "publisher autocomplete",
+                "get",
+                f"{reverse('publisher-autocomplete')}?q=a",
+                None,
+            ),
+            ("api list", "get", reverse("api-newspaper-list"), None),
+            (
+                "api detail",
+                "get",
+                reverse("api-newspaper-detail", args=[article.pk]),
+                None,
+            ),
+            (
+                "api export category",
+                "get",
+                f"{reverse('api-newspaper-export')}?"
+                f"{urlencode({'category': topic_name})}",
+                None,
+            ),
+            ("feed", "get", reverse("feed-rss"), None),
+            (
+                "topic feed",
+                "get",
+                reverse("topic-feed-atom", args=[article.topic_id]),
+                None,
+            ),
+            ("async index", "get", reverse("async-index"), None),
+            (
+                "async detail",
+                "get",
+                reverse("async-newspaper-detail", args=[article.pk]),
+                None,
+            ),
+            ("create form", "get", reverse("newspaper-create"), None),
+            ("create", "post", reverse("newspaper-create"), article_form),
+            (
+                "update form",
+                "get",
+                reverse("newspaper-update", args=[article.pk]),
+                None,
+            ),
+            (
+                "update",
+                "post",
+                reverse("newspaper-update", args=[article.pk]),
+                {**article_form, "title": article.title},
+            ),
+            (
+                "delete form",
+                "get",
+                reverse("newspaper-delete", args=[article.pk]),
+                None,
+            ),
+            (
+                "delete",
+                "post",
+                reverse("newspaper-delete", args=[article.pk]),
+                {},
+            ),
+        ]
+
+    def measure(self, user, name, method, path, data, options) -> dict:
+        client = Client(SERVER_NAME="localhost")
+        client.force_login(user)
+
+        def request():
+            with transaction.atomic():
+                response = getattr(client, method)(path, data)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                if method != "get":
+                    transaction.set_rollback(True)
+            return response
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            request()
+        cold_queries = len(captured)
+        for _ in range(options["warmup"]):
+            request()
+
+        timings = []
+        for _ in range(options["iterations"]):
+            started = time.perf_counter()
+            response = request()
+            timings.append(time.perf_counter() - started)
+
+        with CaptureQueriesContext(connection) as captured:
+            request()
+        queries = len(captured)
+        tracemalloc.start()
+        try:
+            request()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        if self.verbosity > 1:
+            self.stderr.write(
+                f"{name}: p50 {percentile(timings, 0.5) * 1000:.1f} ms"
+            )
+        return {
+            "name": name,
+            "method": method.upper(),
+            "path": path,
+            "status": response.status_code,
+            "p50_ms": round(percentile(timings, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(timings, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(timings, 0.99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(timings) * 1000, 2),
+            "queries": queries,
+            "cold_queries": cold_queries,
+            "peak_memory_kb": round(peak / 1024, 1),
+        }
@@ -0,0 +1,76 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def connections_per_process(connection, threads: int) -> int:
+    """
+    Upper bound of server connections one worker process holds.
+    """
+    pool = connection.settings_dict["OPTIONS"].get("pool")
+    if pool:
+        return pool.get("max_size", 4) if isinstance(pool, dict) else 4
+    return threads
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the connections gunicorn workers may hold with the "
+        "PostgreSQL connection limit of every database alias."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=int(os.getenv("WEB_CONCURRENCY", 1)),
+            help="Worker processes per instance (default WEB_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Threads per worker process.",
+        )
+        parser.add_argument(
+            "--instances",
+            type=int,
+            default=1,
+            help="Application instances sharing the database.",
+        )
+
+    def handle(self, *args, **options):
+        processes = options["workers"] * options["instances"]
+        for alias in connections:
+            connection = connections[alias]
+            per_process = connections_per_process(
+                connection, options["threads"]
+            )
+            needed = per_process * processes
+            line = (
+                f"{alias}: {processes} processes x {per_process} "
+                f"= {needed} connections"
+            )
+            limit = self.available_connections(connection)
+            if limit is None:
+                self.stdout.write(line)
+                continue
+            line += f" of {limit} available"
+            line += f"; at most {limit // per_process} processes fit."
+            style = self.style.SUCCESS if needed <= limit else self.style.ERROR
+            self.stdout.write(style(line))
+
+    @staticmethod
+    def available_connections(connection):
+        """
+        Connection slots on PostgreSQL outside the superuser reserve.
+        """
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('max_connections')::int"
+                " - current_setting('superuser_reserved_connections')::int"
+            )
+            return cursor.fetchone()[0]
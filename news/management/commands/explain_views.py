@@ -0,0 +1,189 @@
+import re
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from news.models import Keyword, Newspaper, Redactor
+
+# Plan lines that mean a full table read or an explicit sort step.
+PLAN_ISSUES = {
+    "postgresql": {
+        "sequential scan": re.compile(r"Seq Scan on (\w+)"),
+        "sort": re.compile(r"(?:^|->\s+)((?:Incremental )?Sort)\b"),
+    },
+    "sqlite": {
+        "sequential scan": re.compile(r"\bSCAN (\w+)$"),
+        "sort": re.compile(r"USE TEMP B-TREE FOR (.+)$"),
+    },
+}
+EXPLAIN_PREFIX = {
+    "postgresql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+def view_requests() -> list:
+    """
+    Returns (name, url) for the pages whose queries are explained.
+    """
+    newspaper = Newspaper.objects.order_by("id").only("id", "topic").first()
+    keyword = Keyword.objects.order_by("id").first()
+    requests = [
+        ("article list", reverse("index")),
+        ("article API", reverse("api-newspaper-list")),
+        ("feed", reverse("feed-rss")),
+        ("my articles", reverse("my-articles")),
+        (
+            "publisher autocomplete",
+            reverse("publisher-autocomplete") + "?q=a",
+        ),
+    ]
+    if newspaper is not None:
+        category = urlencode({"category": newspaper.topic.name})
+        requests += [
+            (
+                "article list by topic",
+                f"{reverse('index')}?{category}",
+            ),
+            (
+                "article detail",
+                reverse("newspaper-detail", args=[newspaper.pk]),
+            ),
+            (
+                "topic feed",
+                reverse("topic-feed-rss", args=[newspaper.topic_id]),
+            ),
+        ]
+    if keyword is not None:
+        requests.append(
+            (
+                "keyword articles",
+                reverse("keyword-detail", args=[keyword.pk]),
+            )
+        )
+    return requests
+
+
+class Command(BaseCommand):
+    help = (
+        "Requests the main pages, runs EXPLAIN on every SELECT they issue "
+        "and flags sequential scans and sorts. Run it against a database "
+        "of realistic size; planners scan small tables sequentially."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--plans",
+            action="store_true",
+            help="Print the plan of every query, not only flagged ones.",
+        )
+        parser.add_argument(
+            "--prefer-indexes",
+            action="store_true",
+            help=(
+                "Disable sequential scans on PostgreSQL so the plans show "
+                "whether an index could serve each query."
+            ),
+        )
+        parser.add_argument(
+            "--fail-on-issues",
+            action="store_true",
+            help="Exit with an error if any query is flagged.",
+        )
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in PLAN_ISSUES:
+            raise CommandError(f"EXPLAIN is not supported on {vendor}.")
+        user = Redactor.objects.order_by("id").first()
+        if user is None:
+            raise CommandError("At least one redactor is required.")
+
+        flagged = 0
+        # Logging in writes a session, so everything is rolled back.
+        dummy_cache = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+            }
+        }
+        try:
+            with override_settings(
+                CACHES=dummy_cache, DATABASE_REPLICAS=[]
+            ), transaction.atomic():
+                if options["prefer_indexes"] and vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+                client = Client(SERVER_NAME="localhost")
+                client.force_login(user)
+                for name, url in view_requests():
+                    flagged += self.explain_view(
+                        client, name, url, vendor, options["plans"]
+                    )
+                raise Rollback
+        except Rollback:
+            pass
+
+        if flagged:
+            message = f"{flagged} queries use sequential scans or sorts."
+            if options["fail_on_issues"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("No flagged queries."))
+
+    def explain_view(self, client, name, url, vendor, show_plans) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+            if hasattr(response, "streaming_content"):
+                b"".join(response.streaming_content)
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{name} ({url}): {response.status_code}, "
+                f"{len(queries)} queries"
+            )
+        )
+
+        flagged = 0
+        for query in queries.captured_queries:
+            sql = query["sql"]
+            if not sql.lstrip().upper().startswith("SELECT"):
+                continue
+            plan = self.explain(vendor, sql)
+            issues = sorted(
+                {
+                    f"{issue} ({match.group(1)})"
+                    for line in plan
+                    for issue, pattern in PLAN_ISSUES[vendor].items()
+                    for match in [pattern.search(line.strip())]
+                    if match
+                }
+            )
+            if issues:
+                flagged += 1
+                self.stdout.write(
+                    self.style.WARNING(f"  {', '.join(issues)}: {sql}")
+                )
+            elif show_plans:
+                self.stdout.write(f"  ok: {sql}")
+            if issues or show_plans:
+                for line in plan:
+                    self.stdout.write(f"      {line}")
+        return flagged
+
+    @staticmethod
+    def explain(vendor, sql) -> list:
+        with connection.cursor() as cursor:
+            cursor.execute(EXPLAIN_PREFIX[vendor] + sql)
+            rows = cursor.fetchall()
+        if vendor == "sqlite":
+            # (id, parent, notused, detail)
+            return [row[-1] for row in rows]
+        return [row[0] for row in rows]
@@ -0,0 +1,291 @@
+import contextlib
+import json
+import sys
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.dateparse import parse_date
+
+from news.keywords import (
+    adjust_keyword_counts,
+    clean_keyword_names,
+    resolve_keyword_ids,
+)
+from news.models import Newspaper, Redactor, Topic
+from news.search import index_new_newspapers, search_document
+from news.topics import adjust_topic_counts, invalidate_topics
+
+READ_SIZE = 1 << 16
+
+
+def iter_records(stream):
+    """
+    Yields the records of a JSON array or of NDJSON lines one at a time.
+    """
+    head = stream.read(1)
+    while head and head.isspace():
+        head = stream.read(1)
+    if head == "[":
+        yield from _iter_array(stream)
+    elif head:
+        yield json.loads(head + stream.readline())
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_array(stream):
+    decoder = json.JSONDecoder()
+    buffer, position = "", 0
+    while True:
+        while position < len(buffer) and (
+            buffer[position].isspace() or buffer[position] == ","
+        ):
+            position += 1
+        if position == len(buffer):
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                raise CommandError("Invalid JSON: unterminated array.")
+            buffer, position = chunk, 0
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            record, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield record
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports articles from NDJSON or a JSON array in batches. "
+        "Each record has a title, content, topic name, optional "
+        "published_date, publisher usernames and keyword names."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="Input file, or - to read from standard input.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of articles inserted per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        self.verbosity = options["verbosity"]
+        self.topic_ids = {}
+        self.publishers = {}
+        self.imported = self.skipped = 0
+        self.started = time.monotonic()
+
+        with self.open_input(options["path"]) as stream:
+            batch = []
+            try:
+                for number, record in enumerate(iter_records(stream), 1):
+                    batch.append(self.parse_record(record, number))
+                    if len(batch) == batch_size:
+                        self.import_batch(batch)
+                        batch = []
+            except json.JSONDecodeError as error:
+                raise CommandError(f"Invalid JSON: {error}")
+            if batch:
+                self.import_batch(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {self.imported} articles, skipped "
+                f"{self.skipped} existing titles ({self.rate():.0f} rows/sec)."
+            )
+        )
+
+    @staticmethod
+    def open_input(path):
+        if path == "-":
+            return contextlib.nullcontext(sys.stdin)
+        try:
+            return open(path, encoding="utf-8")
+        except OSError as error:
+            raise CommandError(f"Cannot read {path}: {error}")
+
+    def rate(self) -> float:
+        return self.imported / max(time.monotonic() - self.started, 1e-9)
+
+    @staticmethod
+    def parse_record(record, number) -> dict:
+        if not isinstance(record, dict):
+            raise CommandError(f"Record {number}: expected an object.")
+        missing = [
+            field for field in ("title", "content", "topic")
+            if not record.get(field)
+        ]
+        if missing:
+            raise CommandError(
+                f"Record {number}: missing {', '.join(missing)}."
+            )
+
+        published_date = None
+        if record.get("published_date"):
+            try:
+                published_date = parse_date(record["published_date"])
+            except (TypeError, ValueError):
+                pass
+            if published_date is None:
+                raise CommandError(f"Record {number}: invalid published_date.")
+
+        return {
+            "number": number,
+            "title": record["title"],
+            "content": record["content"],
+            "topic": record["topic"],
+            "published_date": published_date,
+            "publishers": list(dict.fromkeys(record.get("publishers", []))),
+            "keywords": clean_keyword_names(record.get("keywords", [])),
+        }
+
+    def import_batch(self, rows) -> None:
+        """
+        Inserts one batch of articles and their relations.
+        """
+        with transaction.atomic():
+            existing = set(
+                Newspaper.objects.filter(
+                    title__in={row["title"] for row in rows}
+                ).values_list("title", flat=True)
+            )
+            new_rows = []
+            for row in rows:
+                if row["title"] in existing:
+                    self.skipped += 1
+                    continue
+                existing.add(row["title"])
+                new_rows.append(row)
+            if not new_rows:
+                return
+
+            topic_ids = self.resolve_topics({row["topic"] for row in new_rows})
+            publishers = self.resolve_publishers(new_rows)
+            keyword_ids = resolve_keyword_ids(
+                name for row in new_rows for name in row["keywords"]
+            )
+
+            # Everything derived is set here so each row is written once.
+            newspapers = []
+            for row in new_rows:
+                newspaper = Newspaper(
+                    title=row["title"],
+                    content=row["content"],
+                    topic_id=topic_ids[row["topic"]],
+                    published_date=row["published_date"],
+                    search_document=search_document(
+                        [publishers[name] for name in row["publishers"]],
+                        row["keywords"],
+                        row["content"],
+                    ),
+                )
+                newspaper.refresh_excerpt()
+                newspapers.append(newspaper)
+            Newspaper.objects.bulk_create(newspapers)
+
+            Newspaper.publishers.through.objects.bulk_create(
+                [
+                    Newspaper.publishers.through(
+                        newspaper_id=newspaper.id,
+                        redactor_id=publishers[username].id,
+                    )
+                    for newspaper, row in zip(newspapers, new_rows)
+                    for username in row["publishers"]
+                ]
+            )
+            keyword_links = [
+                Newspaper.keywords.through(
+                    newspaper_id=newspaper.id, keyword_id=keyword_ids[name]
+                )
+                for newspaper, row in zip(newspapers, new_rows)
+                for name in row["keywords"]
+            ]
+            Newspaper.keywords.through.objects.bulk_create(keyword_links)
+
+            adjust_topic_counts(
+                Counter(newspaper.topic_id for newspaper in newspapers),
+                DEFAULT_DB_ALIAS,
+            )
+            adjust_keyword_counts(
+                Counter(link.keyword_id for link in keyword_links),
+                DEFAULT_DB_ALIAS,
+            )
+            index_new_newspapers(newspapers)
+
+        self.imported += len(newspapers)
+        if self.verbosity > 1:
+            self.stdout.write(
+                f"Imported {self.imported} articles "
+                f"({self.rate():.0f} rows/sec)."
+            )
+
+    def resolve_topics(self, names) -> dict:
+        """
+        Returns a name -> id mapping, creating missing topics in bulk.
+        """
+        missing = [name for name in names if name not in self.topic_ids]
+        if not missing:
+            return self.topic_ids
+
+        found = dict(
+            Topic.objects.filter(name__in=missing).values_list("name", "id")
+        )
+        new_names = [name for name in missing if name not in found]
+        if new_names:
+            Topic.objects.bulk_create(
+                [Topic(name=name) for name in new_names],
+                ignore_conflicts=True,
+            )
+            found.update(
+                Topic.objects.filter(name__in=new_names).values_list(
+                    "name", "id"
+                )
+            )
+            invalidate_topics()
+        self.topic_ids.update(found)
+        return self.topic_ids
+
+    def resolve_publishers(self, rows) -> dict:
+        """
+        Returns a username -> Redactor mapping; unknown usernames are an error.
+        """
+        missing = {
+            username
+            for row in rows
+            for username in row["publishers"]
+            if username not in self.publishers
+        }
+        if missing:
+            self.publishers.update(
+                (publisher.username, publisher)
+                for publisher in Redactor.objects.filter(
+                    username__in=missing
+                ).only("id", "username", "first_name", "last_name")
+            )
+        for row in rows:
+            unknown = [
+                username for username in row["publishers"]
+                if username not in self.publishers
+            ]
+            if unknown:
+                raise CommandError(
+                    f"Record {row['number']}: unknown publishers "
+                    f"{', '.join(unknown)}."
+                )
+        return self.publishers
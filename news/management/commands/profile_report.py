@@ -0,0 +1,89 @@
+import pstats
+from io import StringIO
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news.profiling import (
+    PROFILE_HEADER,
+    PROFILE_SUFFIX,
+    profile_dir,
+    profile_token,
+)
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+class Command(BaseCommand):
+    help = (
+        "Sums the profiles saved by ProfilingMiddleware and prints the "
+        "functions that took the most time, per view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--view",
+            action="append",
+            default=[],
+            help="Only report this view name; may be repeated.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=SORT_KEYS,
+            default="cumulative",
+            help="Order functions by total time including callees "
+            "(cumulative), own time (tottime) or calls (ncalls).",
+        )
+        parser.add_argument(
+            "--filter",
+            help=(
+                "Regular expression the file:line(function) entries must "
+                "match, e.g. news/ for the project's own code."
+            ),
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=25,
+            help="Functions listed per view.",
+        )
+        parser.add_argument(
+            "--token",
+            action="store_true",
+            help=(
+                f"Print a value for the {PROFILE_HEADER} request header "
+                "that makes a staff user's request get profiled."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["token"]:
+            self.stdout.write(f"{PROFILE_HEADER}: {profile_token()}")
+            return
+
+        root = profile_dir()
+        directories = sorted(path for path in root.glob("*") if path.is_dir())
+        if options["view"]:
+            directories = [
+                path for path in directories if path.name in options["view"]
+            ]
+        reported = 0
+        for directory in directories:
+            files = sorted(directory.glob(f"*{PROFILE_SUFFIX}"))
+            if not files:
+                continue
+            reported += 1
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"{directory.name}: {len(files)} profiles"
+                )
+            )
+            # OutputWrapper would end each pstats fragment with a newline.
+            buffer = StringIO()
+            stats = pstats.Stats(*map(str, files), stream=buffer)
+            restrictions = [options["filter"]] if options["filter"] else []
+            stats.sort_stats(options["sort"]).print_stats(
+                *restrictions, options["limit"]
+            )
+            self.stdout.write(buffer.getvalue(), ending="")
+        if not reported:
+            raise CommandError(f"No profiles found in {root}.")
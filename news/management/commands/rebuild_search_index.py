@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from news.models import Newspaper
+from news.search import INDEX_BATCH_SIZE, update_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text search index for all newspapers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=INDEX_BATCH_SIZE,
+            help="Number of newspapers indexed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = Newspaper.objects.order_by("id").values_list("id", flat=True)
+
+        batch = []
+        indexed = 0
+        for newspaper_id in ids.iterator(chunk_size=batch_size):
+            batch.append(newspaper_id)
+            if len(batch) == batch_size:
+                update_search_index(batch)
+                indexed += len(batch)
+                batch = []
+        update_search_index(batch)
+        indexed += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} newspapers.")
+        )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from news.keywords import recount_keyword_usage
+from news.models import Keyword, Topic
+from news.topics import invalidate_topics, recount_topics
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes keyword usage and topic article counters "
+        "to repair drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of keywords recounted per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        keyword_ids = Keyword.objects.order_by("id").values_list(
+            "id", flat=True
+        )
+        last_id = 0
+        reconciled = 0
+        while True:
+            batch = list(keyword_ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            reconciled += recount_keyword_usage(
+                Keyword.objects.filter(id__gte=batch[0], id__lte=batch[-1])
+            )
+            last_id = batch[-1]
+
+        topics = recount_topics(Topic.objects.all())
+        invalidate_topics()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Repaired {reconciled} keywords and {topics} topics."
+            )
+        )
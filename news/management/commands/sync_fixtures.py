@@ -0,0 +1,303 @@
+import hashlib
+import json
+from collections import defaultdict
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from news.keywords import recount_keyword_usage
+from news.models import (
+    FixtureFile,
+    FixtureObject,
+    Keyword,
+    Newspaper,
+    Redactor,
+    Topic,
+    touch_newspapers,
+)
+from news.search import update_search_index
+from news.topics import invalidate_topics, recount_topics
+
+
+def object_digest(obj: dict) -> str:
+    payload = json.dumps(
+        [obj["model"].lower(), obj["pk"], obj.get("fields", {})],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Command(BaseCommand):
+    help = (
+        "Applies JSON fixtures idempotently. Unchanged files and objects "
+        "are skipped by content hash; changed objects are bulk upserted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="JSON fixture files.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows written per bulk statement.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Compare every object even if the file hash is unchanged.",
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        for path in options["paths"]:
+            try:
+                with open(path, "rb") as fixture:
+                    content = fixture.read()
+            except OSError as error:
+                raise CommandError(f"Cannot read {path}: {error}")
+
+            digest = hashlib.sha256(content).hexdigest()
+            if not options["force"] and FixtureFile.objects.filter(
+                path=path, digest=digest
+            ).exists():
+                self.stdout.write(f"{path}: unchanged, skipped.")
+                continue
+
+            try:
+                objects = json.loads(content)
+            except ValueError as error:
+                raise CommandError(f"Invalid JSON in {path}: {error}")
+
+            with transaction.atomic():
+                written, total = self.sync_objects(objects)
+                FixtureFile.objects.update_or_create(
+                    path=path, defaults={"digest": digest}
+                )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{path}: wrote {written} of {total} objects."
+                )
+            )
+
+    def sync_objects(self, objects) -> tuple:
+        """
+        Writes the changed objects and returns (written, total) counts.
+        """
+        by_model = defaultdict(dict)
+        for obj in objects:
+            if obj.get("pk") is None:
+                raise CommandError(
+                    "Fixture objects without a primary key are not supported."
+                )
+            by_model[obj["model"].lower()][str(obj["pk"])] = obj
+
+        changed = {}
+        digests = []
+        for label, model_objects in by_model.items():
+            stored = {}
+            pks = list(model_objects)
+            for start in range(0, len(pks), self.batch_size):
+                stored.update(
+                    FixtureObject.objects.filter(
+                        model=label,
+                        object_pk__in=pks[start:start + self.batch_size],
+                    ).values_list("object_pk", "digest")
+                )
+            for pk, obj in model_objects.items():
+                digest = object_digest(obj)
+                if stored.get(pk) != digest:
+                    changed.setdefault(label, []).append(obj)
+                    digests.append(
+                        FixtureObject(model=label, object_pk=pk, digest=digest)
+                    )
+
+        if not changed:
+            return 0, len(objects)
+
+        deserialized = {
+            label: list(serializers.deserialize("python", model_objects))
+            for label, model_objects in changed.items()
+        }
+        newspaper_ids = [
+            item.object.pk for item in deserialized.get("news.newspaper", [])
+        ]
+        # Counters of the topics and keywords the articles are leaving.
+        previous_links = self.counted_links(newspaper_ids)
+        for label, items in deserialized.items():
+            self.upsert(
+                apps.get_model(label),
+                [item.object for item in items],
+                {
+                    field
+                    for obj in changed[label]
+                    for field in obj.get("fields", {})
+                },
+            )
+        for label, items in deserialized.items():
+            self.replace_m2m(apps.get_model(label), items)
+
+        FixtureObject.objects.bulk_create(
+            digests,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=["model", "object_pk"],
+            update_fields=["digest"],
+        )
+        self.refresh_derived_data(
+            {
+                apps.get_model(label): [item.object.pk for item in items]
+                for label, items in deserialized.items()
+            },
+            previous_links,
+        )
+        return len(digests), len(objects)
+
+    def upsert(self, model, instances, field_names) -> None:
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if field.name in field_names and not field.primary_key
+        ]
+        if model is Newspaper:
+            for instance in instances:
+                instance.refresh_excerpt()
+            fields += [
+                model._meta.get_field("excerpt"),
+                model._meta.get_field("word_count"),
+            ]
+
+        # bulk_create() overrides the fixture's auto_now(_add) values.
+        stamped = [
+            field for field in fields
+            if getattr(field, "auto_now", False)
+            or getattr(field, "auto_now_add", False)
+        ]
+        stamped_values = [
+            [getattr(instance, field.attname) for field in stamped]
+            for instance in instances
+        ]
+
+        model.objects.bulk_create(
+            instances,
+            batch_size=self.batch_size,
+            update_conflicts=bool(fields),
+            unique_fields=[model._meta.pk.name] if fields else None,
+            update_fields=[field.name for field in fields] or None,
+            ignore_conflicts=not fields,
+        )
+
+        if stamped:
+            for instance, values in zip(instances, stamped_values):
+                for field, value in zip(stamped, values):
+                    setattr(instance, field.attname, value)
+            model.objects.bulk_update(
+                instances,
+                [field.name for field in stamped],
+                batch_size=self.batch_size,
+            )
+
+        connection = connections[DEFAULT_DB_ALIAS]
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), [model])
+        if sequence_sql:
+            with connection.cursor() as cursor:
+                for sql in sequence_sql:
+                    cursor.execute(sql)
+
+    def replace_m2m(self, model, items) -> None:
+        """
+        Replaces the relations listed in the fixture in bulk.
+        """
+        for field in model._meta.many_to_many:
+            owners = [item for item in items if field.name in item.m2m_data]
+            if not owners:
+                continue
+            through = field.remote_field.through
+            source = field.m2m_field_name()
+            target = field.m2m_reverse_field_name()
+            through.objects.filter(
+                **{f"{source}__in": [item.object.pk for item in owners]}
+            ).delete()
+            through.objects.bulk_create(
+                [
+                    through(
+                        **{
+                            f"{source}_id": item.object.pk,
+                            f"{target}_id": target_pk,
+                        }
+                    )
+                    for item in owners
+                    for target_pk in item.m2m_data[field.name]
+                ],
+                batch_size=self.batch_size,
+            )
+
+    def counted_links(self, newspaper_ids) -> tuple:
+        """
+        Returns the (topic_ids, keyword_ids) of the given newspapers.
+        """
+        topic_ids, keyword_ids = set(), set()
+        for start in range(0, len(newspaper_ids), self.batch_size):
+            batch = newspaper_ids[start:start + self.batch_size]
+            topic_ids.update(
+                Newspaper.objects.filter(pk__in=batch).values_list(
+                    "topic_id", flat=True
+                )
+            )
+            keyword_ids.update(
+                Newspaper.keywords.through.objects.filter(
+                    newspaper_id__in=batch
+                ).values_list("keyword_id", flat=True)
+            )
+        return topic_ids, keyword_ids
+
+    def refresh_derived_data(self, changed_pks, previous_links) -> None:
+        """
+        Does the work of the model signals that bulk writes bypass.
+        """
+        newspaper_ids = set(changed_pks.get(Newspaper, []))
+        links = {
+            Redactor: (Newspaper.publishers.through, "redactor_id"),
+            Keyword: (Newspaper.keywords.through, "keyword_id"),
+        }
+        for model, (through, column) in links.items():
+            if changed_pks.get(model):
+                newspaper_ids.update(
+                    through.objects.filter(
+                        **{f"{column}__in": changed_pks[model]}
+                    ).values_list("newspaper_id", flat=True)
+                )
+        if changed_pks.get(Topic):
+            newspaper_ids.update(
+                Newspaper.objects.filter(
+                    topic_id__in=changed_pks[Topic]
+                ).values_list("id", flat=True)
+            )
+
+        if newspaper_ids:
+            touch_newspapers(newspaper_ids)
+            update_search_index(newspaper_ids)
+
+        topic_ids, keyword_ids = self.counted_links(
+            changed_pks.get(Newspaper, [])
+        )
+        topic_ids |= previous_links[0] | set(changed_pks.get(Topic, []))
+        keyword_ids |= previous_links[1] | set(changed_pks.get(Keyword, []))
+        recounted_topics = self.recount(recount_topics, Topic, topic_ids)
+        self.recount(recount_keyword_usage, Keyword, keyword_ids)
+        if recounted_topics or changed_pks.get(Topic):
+            invalidate_topics()
+
+    def recount(self, recount, model, ids) -> int:
+        ids = sorted(ids)
+        return sum(
+            recount(
+                model.objects.filter(
+                    pk__in=ids[start:start + self.batch_size]
+                )
+            )
+            for start in range(0, len(ids), self.batch_size)
+        )
@@ -0,0 +1,333 @@
+"""
+Per-request query, template and cache metrics, exported for Prometheus.
+"""
+
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.template.backends.django import DjangoTemplates, Template
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+
+from news.connections import connection_stats, install_execute_wrapper
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+UNRESOLVED_VIEW = "unresolved"
+CONNECTION_COUNTERS = (
+    "checkouts", "handshakes", "handshakes_avoided", "waits",
+)
+
+
+@dataclass
+class RequestMetrics:
+    started: float
+    path: str = ""
+    view_name: str = UNRESOLVED_VIEW
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    template_seconds: float = 0.0
+    rendering: bool = False
+    counting_many: bool = False
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+_current = ContextVar("news_request_metrics", default=None)
+
+
+def current_metrics():
+    """
+    Returns the metrics of the current request, or None.
+    """
+    return _current.get()
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def samples(self):
+        """
+        Yields (upper bound, cumulative count) pairs, ending with +Inf.
+        """
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            yield bound, total
+
+
+class Registry:
+    """
+    Per-view histograms and counters of a process.
+    """
+
+    histograms = {
+        "news_request_duration_seconds": (
+            "Total request time.", DURATION_BUCKETS
+        ),
+        "news_db_duration_seconds": (
+            "Time spent in SQL queries per request.", DURATION_BUCKETS
+        ),
+        "news_db_queries": ("SQL queries per request.", QUERY_BUCKETS),
+        "news_template_duration_seconds": (
+            "Template render time per request.", DURATION_BUCKETS
+        ),
+    }
+    counters = {
+        "news_cache_hits_total": "Cache lookups that found a value.",
+        "news_cache_misses_total": "Cache lookups that found nothing.",
+    }
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {name: {} for name in self.histograms}
+            self._counters = {
+                name: defaultdict(int) for name in self.counters
+            }
+
+    def record(self, view: str, metrics: RequestMetrics, total: float):
+        values = {
+            "news_request_duration_seconds": total,
+            "news_db_duration_seconds": metrics.db_seconds,
+            "news_db_queries": metrics.db_queries,
+            "news_template_duration_seconds": metrics.template_seconds,
+        }
+        with self._lock:
+            for name, value in values.items():
+                histogram = self._histograms[name].get(view)
+                if histogram is None:
+                    histogram = self._histograms[name][view] = Histogram(
+                        self.histograms[name][1]
+                    )
+                histogram.observe(value)
+            self._counters["news_cache_hits_total"][view] += (
+                metrics.cache_hits
+            )
+            self._counters["news_cache_misses_total"][view] += (
+                metrics.cache_misses
+            )
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (help_text, _) in self.histograms.items():
+                lines += [
+                    f"# HELP {name} {help_text}",
+                    f"# TYPE {name} histogram",
+                ]
+                for view, histogram in sorted(
+                    self._histograms[name].items()
+                ):
+                    label = f'view="{escape_label(view)}"'
+                    lines += [
+                        f'{name}_bucket{{{label},le="{bound}"}} {count}'
+                        for bound, count in histogram.samples()
+                    ]
+                    lines += [
+                        f"{name}_sum{{{label}}} {histogram.sum}",
+                        f"{name}_count{{{label}}} {histogram.count}",
+                    ]
+            for name, help_text in self.counters.items():
+                lines += [
+                    f"# HELP {name} {help_text}",
+                    f"# TYPE {name} counter",
+                ]
+                lines += [
+                    f'{name}{{view="{escape_label(view)}"}} {value}'
+                    for view, value in sorted(self._counters[name].items())
+                ]
+        return "\n".join(lines) + "\n"
+
+
+def escape_label(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+registry = Registry()
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_seconds += time.perf_counter() - started
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    install_execute_wrapper(connection, record_query)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        # Templates rendered inside another render are already timed.
+        if metrics is None or metrics.rendering:
+            return super().render(context, request)
+        metrics.rendering = True
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_seconds += time.perf_counter() - started
+            metrics.rendering = False
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    DjangoTemplates backend whose templates report their render time.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+    """
+    Counts hits and misses of get() and get_many() on a cache backend.
+    """
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        metrics = _current.get()
+        if metrics is not None and not metrics.counting_many:
+            if value is _MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        metrics = _current.get()
+        if metrics is None or metrics.counting_many:
+            return super().get_many(keys, version)
+        keys = list(keys)
+        metrics.counting_many = True
+        try:
+            values = super().get_many(keys, version)
+        finally:
+            metrics.counting_many = False
+        metrics.cache_hits += len(values)
+        metrics.cache_misses += len(set(keys)) - len(values)
+        return values
+
+
+_instrumented_backends = {}
+
+
+def instrumented_cache(location, params):
+    """
+    Builds the WRAPPED_BACKEND cache class with CacheMetricsMixin applied.
+    """
+    backend = import_string(
+        params.get(
+            "WRAPPED_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        )
+    )
+    if backend not in _instrumented_backends:
+        _instrumented_backends[backend] = type(
+            f"Instrumented{backend.__name__}", (CacheMetricsMixin, backend), {}
+        )
+    return _instrumented_backends[backend](location, params)
+
+
+def server_timing(metrics: RequestMetrics, total: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={metrics.db_seconds * 1000:.1f};'
+            f'desc="{metrics.db_queries} queries"',
+            f"tpl;dur={metrics.template_seconds * 1000:.1f}",
+            f'cache;desc="hits={metrics.cache_hits} '
+            f'misses={metrics.cache_misses}"',
+            f"total;dur={total * 1000:.1f}",
+        ]
+    )
+
+
+class RequestMetricsMiddleware(MiddlewareMixin):
+    """
+    Records the cost of each request; put it first in MIDDLEWARE.
+    """
+
+    def process_request(self, request):
+        _current.set(
+            RequestMetrics(started=time.perf_counter(), path=request.path)
+        )
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.view_name = request.resolver_match.view_name
+
+    def process_response(self, request, response):
+        metrics = _current.get()
+        if metrics is None:
+            return response
+        _current.set(None)
+        total = time.perf_counter() - metrics.started
+        registry.record(metrics.view_name, metrics, total)
+        if getattr(settings, "SERVER_TIMING_HEADER", True):
+            response["Server-Timing"] = server_timing(metrics, total)
+        return response
+
+
+def render_connection_stats() -> str:
+    """
+    Renders the news.connections counters in Prometheus format.
+    """
+    stats = connection_stats()
+    lines = []
+    for key in CONNECTION_COUNTERS:
+        name = f"news_db_connection_{key}_total"
+        lines.append(f"# TYPE {name} counter")
+        lines += [
+            f'{name}{{alias="{escape_label(alias)}"}} {entry[key]}'
+            for alias, entry in sorted(stats.items())
+        ]
+    return "\n".join(lines) + "\n"
+
+
+@staff_member_required
+def metrics_view(request):
+    return HttpResponse(
+        registry.render() + render_connection_stats(),
+        content_type="text/plain; version=0.0.4",
+    )
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+
+from news.routers import PIN_COOKIE, begin_request, current_state, replicas
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Routes reads of replica_reads views to replicas unless recently pinned.
+    """
+
+    def process_request(self, request):
+        begin_request()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = current_state()
+        if state is None:
+            return
+        view = getattr(view_func, "view_class", view_func)
+        state.replica_reads = (
+            request.method in SAFE_METHODS
+            and PIN_COOKIE not in request.COOKIES
+            and getattr(view, "replica_reads", False)
+        )
+
+    def process_response(self, request, response):
+        state = current_state()
+        if not replicas() or state is None:
+            return response
+        if state.wrote or request.method not in SAFE_METHODS:
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=getattr(settings, "REPLICA_PIN_SECONDS", 5),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,97 @@
+# Generated by Django 5.1.1 on 2026-10-18 12:52
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX news_newspaper_search_vector_gin "
+            "ON news_newspaper USING gin (search_vector)"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE news_newspaper_fts USING fts5("
+            "title, document, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "DROP INDEX IF EXISTS news_newspaper_search_vector_gin"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS news_newspaper_fts")
+
+
+def index_existing_newspapers(apps, schema_editor):
+    Newspaper = apps.get_model("news", "Newspaper")
+    manager = Newspaper.objects.db_manager(schema_editor.connection.alias)
+    newspapers = (
+        manager.order_by("id")
+        .only("id", "title", "content")
+        .prefetch_related("publishers", "keywords")
+    )
+    batch = []
+    for newspaper in newspapers.iterator(chunk_size=BATCH_SIZE):
+        authors = " ".join(
+            f"{publisher.first_name} {publisher.last_name} "
+            f"{publisher.username}"
+            for publisher in newspaper.publishers.all()
+        )
+        keywords = " ".join(
+            keyword.name for keyword in newspaper.keywords.all()
+        )
+        newspaper.search_document = "\n".join(
+            [authors, keywords, newspaper.content]
+        )
+        batch.append(newspaper)
+        if len(batch) == BATCH_SIZE:
+            manager.bulk_update(batch, ["search_document"])
+            batch = []
+    manager.bulk_update(batch, ["search_document"])
+
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        manager.update(
+            search_vector=SearchVector("title", weight="A", config="english")
+            + SearchVector("search_document", weight="B", config="english")
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "INSERT INTO news_newspaper_fts (rowid, title, document) "
+            "SELECT id, title, search_document FROM news_newspaper"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0004_alter_redactor_groups_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newspaper",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(
+            index_existing_newspapers, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-18 12:57
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+# news.models.EXCERPT_WORDS when the excerpts were introduced.
+EXCERPT_WORDS = 20
+BATCH_SIZE = 500
+
+
+def backfill_excerpts(apps, schema_editor):
+    Newspaper = apps.get_model("news", "Newspaper")
+    manager = Newspaper.objects.db_manager(schema_editor.connection.alias)
+    newspapers = manager.order_by("id").only("id", "content")
+    batch = []
+    for newspaper in newspapers.iterator(chunk_size=BATCH_SIZE):
+        newspaper.excerpt = Truncator(newspaper.content).words(EXCERPT_WORDS)
+        newspaper.word_count = len(newspaper.content.split())
+        batch.append(newspaper)
+        if len(batch) == BATCH_SIZE:
+            manager.bulk_update(batch, ["excerpt", "word_count"])
+            batch = []
+    manager.bulk_update(batch, ["excerpt", "word_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0005_newspaper_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newspaper",
+            name="excerpt",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="word_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
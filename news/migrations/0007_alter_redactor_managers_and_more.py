@@ -0,0 +1,28 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:01
+
+import news.models
+from django.db import migrations
+
+from news.search import (
+    create_search_delete_trigger,
+    drop_search_delete_trigger,
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0006_newspaper_excerpt"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="redactor",
+            managers=[
+                ("objects", news.models.RedactorManager()),
+            ],
+        ),
+        migrations.RunPython(
+            create_search_delete_trigger, drop_search_delete_trigger
+        ),
+    ]
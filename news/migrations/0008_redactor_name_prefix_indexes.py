@@ -0,0 +1,33 @@
+from django.db import migrations
+
+PREFIX_INDEXED_COLUMNS = ("username", "first_name", "last_name")
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in PREFIX_INDEXED_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX news_redactor_{column}_prefix "
+            f"ON news_redactor (UPPER({column}::text) text_pattern_ops)"
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in PREFIX_INDEXED_COLUMNS:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS news_redactor_{column}_prefix"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0007_alter_redactor_managers_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
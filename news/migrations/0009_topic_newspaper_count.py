@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:04
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_topic_newspapers(apps, schema_editor):
+    Topic = apps.get_model("news", "Topic")
+    Newspaper = apps.get_model("news", "Newspaper")
+    counts = (
+        Newspaper.objects.filter(topic=OuterRef("pk"))
+        .order_by()
+        .values("topic")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Topic.objects.update(newspaper_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0008_redactor_name_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="topic",
+            name="newspaper_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            count_topic_newspapers, migrations.RunPython.noop
+        ),
+    ]
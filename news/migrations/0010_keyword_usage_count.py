@@ -0,0 +1,35 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:07
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_keyword_usage(apps, schema_editor):
+    Keyword = apps.get_model("news", "Keyword")
+    Newspaper = apps.get_model("news", "Newspaper")
+    links = Newspaper.keywords.through.objects
+    counts = (
+        links.filter(keyword_id=OuterRef("pk"))
+        .order_by()
+        .values("keyword_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Keyword.objects.update(usage_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0009_topic_newspaper_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="keyword",
+            name="usage_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(count_keyword_usage, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:12
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast
+
+from news.search import create_search_delete_trigger
+
+
+def stamp_published_date(apps, schema_editor):
+    Newspaper = apps.get_model("news", "Newspaper")
+    Newspaper.objects.update(
+        updated_at=Cast(F("published_date"), models.DateTimeField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0010_keyword_usage_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop, create_search_delete_trigger
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.RunPython(
+            create_search_delete_trigger, migrations.RunPython.noop
+        ),
+        migrations.RunPython(
+            stamp_published_date, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["topic", "updated_at"],
+                name="news_newspaper_topic_upd_idx",
+            ),
+        ),
+    ]
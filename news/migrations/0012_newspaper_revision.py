@@ -0,0 +1,26 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:14
+
+from django.db import migrations, models
+
+from news.search import create_search_delete_trigger
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0011_newspaper_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop, create_search_delete_trigger
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="revision",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(
+            create_search_delete_trigger, migrations.RunPython.noop
+        ),
+    ]
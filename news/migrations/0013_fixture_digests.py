@@ -0,0 +1,55 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0012_newspaper_revision"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FixtureFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("path", models.CharField(max_length=255, unique=True)),
+                ("digest", models.CharField(max_length=64)),
+                ("synced_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="FixtureObject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100)),
+                ("object_pk", models.CharField(max_length=64)),
+                ("digest", models.CharField(max_length=64)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("model", "object_pk"),
+                        name="news_fixtureobject_model_pk_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
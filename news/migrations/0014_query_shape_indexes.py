@@ -0,0 +1,77 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """
+    Builds the index without locking writes to the table on PostgreSQL
+    and falls back to a plain AddIndex on the other backends.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        else:
+            migrations.AddIndex.database_forwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        else:
+            migrations.AddIndex.database_backwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("news", "0013_fixture_digests"),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyOnPostgres(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["title", "published_date", "id"],
+                name="news_newspaper_order_idx",
+            ),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["topic", "title", "published_date", "id"],
+                name="news_newspaper_topic_order_idx",
+            ),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["published_date", "id"], name="news_newspaper_pub_id_idx"
+            ),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["topic", "published_date", "id"],
+                name="news_newspaper_topic_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="redactor",
+            index=models.Index(
+                fields=["first_name", "last_name", "id"],
+                name="news_redactor_name_order_idx",
+            ),
+        ),
+    ]
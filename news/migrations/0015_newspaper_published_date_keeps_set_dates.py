@@ -0,0 +1,27 @@
+# Generated by Django 5.1.1 on 2026-10-18 15:46
+
+import news.models
+from django.db import migrations
+
+from news.search import create_search_delete_trigger
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0014_query_shape_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop, create_search_delete_trigger
+        ),
+        migrations.AlterField(
+            model_name="newspaper",
+            name="published_date",
+            field=news.models.CreationDateField(auto_now_add=True),
+        ),
+        migrations.RunPython(
+            create_search_delete_trigger, migrations.RunPython.noop
+        ),
+    ]
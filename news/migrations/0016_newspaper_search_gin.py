@@ -0,0 +1,45 @@
+# Generated by Django 5.1.1 on 2026-10-18 15:48
+
+import news.models
+from django.db import migrations
+
+# 0005 created the index with raw SQL under a name longer than Django
+# allows; renaming it hands it over to the model state without a rebuild.
+OLD_NAME = "news_newspaper_search_vector_gin"
+NEW_NAME = "news_newspaper_search_gin"
+
+
+def rename_search_index(old_name, new_name):
+    def rename(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f"ALTER INDEX IF EXISTS {old_name} RENAME TO {new_name}"
+            )
+
+    return rename
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0015_newspaper_published_date_keeps_set_dates"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(
+                    rename_search_index(OLD_NAME, NEW_NAME),
+                    rename_search_index(NEW_NAME, OLD_NAME),
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="newspaper",
+                    index=news.models.PostgresGinIndex(
+                        fields=["search_vector"], name=NEW_NAME
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,9 +1,127 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import NoReturn
-from django.db import models, transaction
-from django.contrib.auth.models import AbstractUser
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.contrib.auth.models import AbstractUser, UserManager
 from django.core.exceptions import ValidationError
-from django.db.models.signals import pre_delete
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Count, Exists, F, OuterRef
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from news.keywords import (
+    adjust_keyword_counts,
+    set_newspaper_keywords,
+)
+from news.search import (
+    deferred_search_index,
+    reindex_newspapers,
+    update_search_index,
+)
+from news.topics import adjust_topic_counts, invalidate_topics
+
+
+def delete_orphaned_newspapers(redactor_ids, using) -> list:
+    """
+    Deletes newspapers left without publishers, returns co-authored ids.
+    """
+    publishers = Newspaper.publishers.through.objects.using(using)
+    newspapers = (
+        Newspaper.objects.using(using)
+        .filter(
+            pk__in=publishers.filter(redactor_id__in=redactor_ids).values(
+                "newspaper_id"
+            )
+        )
+        .annotate(
+            has_other_publishers=Exists(
+                publishers.filter(newspaper_id=OuterRef("pk")).exclude(
+                    redactor_id__in=redactor_ids
+                )
+            )
+        )
+        .order_by()
+        .values_list("id", "has_other_publishers")
+    )
+
+    orphaned_ids, coauthored_ids = [], []
+    for newspaper_id, has_other_publishers in newspapers:
+        if has_other_publishers:
+            coauthored_ids.append(newspaper_id)
+        else:
+            orphaned_ids.append(newspaper_id)
+
+    if orphaned_ids:
+        Newspaper.objects.using(using).filter(pk__in=orphaned_ids).delete()
+    return coauthored_ids
+
+
+_pending_touches = ContextVar("news_pending_touches", default=None)
+
+
+def touch_newspapers(newspaper_ids, using=DEFAULT_DB_ALIAS) -> None:
+    """
+    Bumps the revisions of newspapers whose related data changed.
+    """
+    newspaper_ids = list(newspaper_ids)
+    pending = _pending_touches.get()
+    if pending is not None:
+        pending["touched"].setdefault(using, set()).update(newspaper_ids)
+        return
+    if not newspaper_ids:
+        return
+    Newspaper.objects.using(using).filter(pk__in=newspaper_ids).update(
+        revision=F("revision") + 1, updated_at=timezone.now()
+    )
+
+
+@contextmanager
+def deferred_newspaper_changes():
+    """
+    Bumps each newspaper touched in the block once, unless it was saved.
+    """
+    if _pending_touches.get() is not None:
+        yield
+        return
+    pending = {"touched": {}, "saved": {}}
+    token = _pending_touches.set(pending)
+    try:
+        with deferred_search_index():
+            yield
+    finally:
+        _pending_touches.reset(token)
+    for using, newspaper_ids in pending["touched"].items():
+        touch_newspapers(
+            newspaper_ids - pending["saved"].get(using, set()), using=using
+        )
+
+
+class RedactorQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Deletes the newspapers of all deleted redactors at once.
+        """
+        with transaction.atomic(using=self.db):
+            coauthored_ids = delete_orphaned_newspapers(
+                list(self.values_list("pk", flat=True)), self.db
+            )
+            result = super().delete()
+        update_search_index(coauthored_ids, using=self.db)
+        touch_newspapers(coauthored_ids, using=self.db)
+        return result
+
+
+class RedactorManager(UserManager.from_queryset(RedactorQuerySet)):
+    pass
 
 
 class Redactor(AbstractUser):
@@ -12,6 +130,8 @@ class Redactor(AbstractUser):
     Added field years_of_experience to store the editor's experience.
     """
 
+    objects = RedactorManager()
+
     years_of_experience = models.PositiveIntegerField(null=True, blank=True)
     groups = models.ManyToManyField(
         "auth.Group",
@@ -30,20 +150,81 @@ class Redactor(AbstractUser):
 
     class Meta:
         ordering = ["first_name", "last_name"]
+        indexes = [
+            models.Index(
+                fields=["first_name", "last_name", "id"],
+                name="news_redactor_name_order_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.username
 
 
 @receiver(pre_delete, sender=Redactor)
-def delete_related_newspapers(sender, instance, **kwargs):
+def delete_related_newspapers(sender, instance, using, origin=None, **kwargs):
     """
     Signal to delete all newspapers associated
     with the redactor before the redactor is deleted.
     """
-    for newspaper in instance.redactor_newspapers.all():
-        if newspaper.publishers.count() == 1:
-            newspaper.delete()
+    if isinstance(origin, RedactorQuerySet):
+        return
+    instance._search_reindex_ids = delete_orphaned_newspapers(
+        [instance.pk], using
+    )
+
+
+@receiver(post_delete, sender=Redactor)
+def reindex_coauthored_newspapers(sender, instance, using, **kwargs):
+    """
+    Signal to refresh the newspapers the deleted redactor co-authored.
+    """
+    newspaper_ids = getattr(instance, "_search_reindex_ids", [])
+    update_search_index(newspaper_ids, using=using)
+    touch_newspapers(newspaper_ids, using=using)
+
+
+REDACTOR_SEARCH_FIELDS = ("username", "first_name", "last_name")
+
+
+@receiver(pre_save, sender=Redactor)
+def detect_name_change(sender, instance, update_fields, **kwargs):
+    """
+    Signal to remember which of a redactor's names are about to change.
+    """
+    instance._changed_names = set()
+    if instance.pk is None or (
+        update_fields is not None
+        and not set(REDACTOR_SEARCH_FIELDS) & set(update_fields)
+    ):
+        return
+    stored = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(*REDACTOR_SEARCH_FIELDS)
+        .first()
+    )
+    if stored is not None:
+        instance._changed_names = {
+            name
+            for name, value in zip(REDACTOR_SEARCH_FIELDS, stored)
+            if getattr(instance, name) != value
+        }
+
+
+@receiver(post_save, sender=Redactor)
+def refresh_newspapers_on_name_change(sender, instance, using, **kwargs):
+    """
+    Signal to refresh the newspapers of a renamed redactor.
+    """
+    changed_names = getattr(instance, "_changed_names", set())
+    if not changed_names:
+        return
+    newspaper_ids = list(
+        instance.redactor_newspapers.values_list("id", flat=True)
+    )
+    if "username" in changed_names:
+        touch_newspapers(newspaper_ids, using=using)
+    reindex_newspapers(newspaper_ids, using=using)
 
 
 class Topic(models.Model):
@@ -52,6 +233,7 @@ class Topic(models.Model):
     """
 
     name = models.CharField(max_length=120, unique=True)
+    newspaper_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["name"]
@@ -60,6 +242,112 @@ class Topic(models.Model):
         return self.name
 
 
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def refresh_topic_lookups(sender, instance, **kwargs):
+    """
+    Signal to drop cached topic navigation and name -> id lookups.
+    """
+    invalidate_topics()
+
+
+@receiver(pre_delete, sender=Topic)
+def remember_topic_keyword_links(sender, instance, using, **kwargs):
+    """
+    Signal to remember the keyword links of a topic's newspapers at once.
+    """
+    instance._keyword_deltas = {
+        keyword_id: -count
+        for keyword_id, count in Newspaper.keywords.through.objects
+        .using(using)
+        .filter(newspaper__topic_id=instance.pk)
+        .values("keyword_id")
+        .annotate(count=Count("pk"))
+        .values_list("keyword_id", "count")
+    }
+
+
+@receiver(post_delete, sender=Topic)
+def count_deleted_topic_keyword_links(sender, instance, using, **kwargs):
+    """
+    Signal to apply the keyword usage changes of a deleted topic.
+    """
+    adjust_keyword_counts(instance.__dict__.pop("_keyword_deltas", {}), using)
+
+
+@receiver(post_save, sender=Topic)
+def touch_newspapers_on_topic_change(
+    sender, instance, created, using, **kwargs
+):
+    """
+    Signal to bump the revisions of a renamed topic's newspapers.
+    """
+    if not created:
+        touch_newspapers(
+            instance.topic_newspapers.values_list("id", flat=True),
+            using=using,
+        )
+
+
+EXCERPT_WORDS = 20
+
+
+class PostgresGinIndex(GinIndex):
+    """
+    GIN index that other backends, which have no GIN, leave out.
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor != "postgresql":
+            return ""
+        return super().create_sql(model, schema_editor, using, **kwargs)
+
+    def remove_sql(self, model, schema_editor, **kwargs):
+        if schema_editor.connection.vendor != "postgresql":
+            return ""
+        return super().remove_sql(model, schema_editor, **kwargs)
+
+
+class CreationDateField(models.DateField):
+    """
+    auto_now_add date field that keeps a date set before the insert.
+    """
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if add and value is not None:
+            return value
+        return super().pre_save(model_instance, add)
+
+
+class NewspaperQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Updates the topic and keyword counters in bulk.
+        """
+        with transaction.atomic(using=self.db):
+            topic_deltas = {
+                topic_id: -count
+                for topic_id, count in self.order_by()
+                .values("topic_id")
+                .annotate(count=Count("pk"))
+                .values_list("topic_id", "count")
+            }
+            keyword_deltas = {
+                keyword_id: -count
+                for keyword_id, count in Newspaper.keywords.through.objects
+                .using(self.db)
+                .filter(newspaper_id__in=self.order_by().values("pk"))
+                .values("keyword_id")
+                .annotate(count=Count("pk"))
+                .values_list("keyword_id", "count")
+            }
+            result = super().delete()
+            adjust_topic_counts(topic_deltas, self.db)
+            adjust_keyword_counts(keyword_deltas, self.db)
+        return result
+
+
 class Newspaper(models.Model):
     """
     Model representing an article.
@@ -67,7 +355,7 @@ class Newspaper(models.Model):
 
     title = models.CharField(max_length=120)
     content = models.TextField()
-    published_date = models.DateField(auto_now_add=True)
+    published_date = CreationDateField(auto_now_add=True)
     topic = models.ForeignKey(
         Topic, on_delete=models.CASCADE, related_name="topic_newspapers"
     )
@@ -80,40 +368,257 @@ class Newspaper(models.Model):
         blank=True,
         related_name="keyword_newspapers",
     )
+    excerpt = models.TextField(blank=True, default="", editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    search_document = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    revision = models.PositiveIntegerField(default=1, editable=False)
+
+    objects = NewspaperQuerySet.as_manager()
 
     class Meta:
         ordering = ["title", "published_date"]
+        indexes = [
+            models.Index(
+                fields=["topic", "updated_at"],
+                name="news_newspaper_topic_upd_idx",
+            ),
+            models.Index(
+                fields=["title", "published_date", "id"],
+                name="news_newspaper_order_idx",
+            ),
+            models.Index(
+                fields=["topic", "title", "published_date", "id"],
+                name="news_newspaper_topic_order_idx",
+            ),
+            models.Index(
+                fields=["published_date", "id"],
+                name="news_newspaper_pub_id_idx",
+            ),
+            models.Index(
+                fields=["topic", "published_date", "id"],
+                name="news_newspaper_topic_pub_idx",
+            ),
+            PostgresGinIndex(
+                fields=["search_vector"], name="news_newspaper_search_gin"
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_topic_id = instance.__dict__.get("topic_id")
+        return instance
 
     def clean(self) -> NoReturn:
+        """
+        Checks that no other article has the same title.
+        """
         super().clean()
 
-        if Newspaper.objects.filter(title=self.title).exists():
-            raise ValidationError("An article with this title already exists.")
+        if (
+            Newspaper.objects.filter(title=self.title)
+            .exclude(pk=self.pk)
+            .exists()
+        ):
+            raise ValidationError(
+                {"title": "An article with this title already exists."}
+            )
+
+    def refresh_excerpt(self) -> NoReturn:
+        self.excerpt = Truncator(self.content).words(EXCERPT_WORDS)
+        self.word_count = len(self.content.split())
 
     def save(self, *args, **kwargs) -> NoReturn:
         """
-        Overrides the save method to handle keywords.
+        Overrides the save method to refresh the excerpt and the revision.
         """
+        update_fields = kwargs.get("update_fields")
+        if "content" not in self.get_deferred_fields() and (
+            update_fields is None or "content" in update_fields
+        ):
+            self.refresh_excerpt()
+            if update_fields is not None:
+                update_fields = {*update_fields, "excerpt", "word_count"}
+        bump_revision = not self._state.adding
+        if bump_revision:
+            self.revision = F("revision") + 1
+        if update_fields:
+            kwargs["update_fields"] = {
+                *update_fields, "updated_at", "revision"
+            }
         super().save(*args, **kwargs)
+        if bump_revision:
+            del self.revision
+        pending = _pending_touches.get()
+        if pending is not None:
+            pending["saved"].setdefault(self._state.db, set()).add(self.pk)
+
+    def set_keywords(self, names) -> NoReturn:
+        """
+        Replaces the keywords by name, creating missing ones in bulk.
+        """
+        set_newspaper_keywords(self, names)
+
+
+@receiver(pre_save, sender=Newspaper)
+def remember_previous_topic(sender, instance, update_fields, **kwargs):
+    """
+    Signal to remember the topic a newspaper had before it is saved.
+    """
+    if instance._state.adding or (
+        update_fields is not None and "topic" not in update_fields
+    ):
+        instance._previous_topic_id = instance.topic_id
+    elif getattr(instance, "_loaded_topic_id", None) is not None:
+        instance._previous_topic_id = instance._loaded_topic_id
+    else:
+        instance._previous_topic_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("topic_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Newspaper)
+def count_saved_newspaper(sender, instance, created, using, **kwargs):
+    """
+    Signal to update topic article counts on create and topic change.
+    """
+    previous_topic_id = getattr(instance, "_previous_topic_id", None)
+    if created:
+        adjust_topic_counts({instance.topic_id: 1}, using)
+    elif previous_topic_id != instance.topic_id:
+        adjust_topic_counts(
+            {previous_topic_id: -1, instance.topic_id: 1}, using
+        )
+    instance._loaded_topic_id = instance.topic_id
+
+
+def deleted_in_bulk(origin) -> bool:
+    """
+    Tells whether a newspaper delete is counted by its queryset or topic.
+    """
+    return isinstance(origin, NewspaperQuerySet) or (
+        getattr(origin, "model", type(origin)) is Topic
+    )
+
+
+@receiver(post_delete, sender=Newspaper)
+def count_deleted_newspaper(sender, instance, using, origin=None, **kwargs):
+    """
+    Signal to update the topic article count when a newspaper is deleted.
+    """
+    if deleted_in_bulk(origin):
+        return
+    adjust_topic_counts({instance.topic_id: -1}, using)
+
+
+@receiver(pre_delete, sender=Newspaper)
+def remember_deleted_keyword_links(
+    sender, instance, using, origin=None, **kwargs
+):
+    """
+    Signal to remember the keywords of a newspaper about to be deleted.
+    """
+    if deleted_in_bulk(origin):
+        return
+    instance._keyword_deltas = dict.fromkeys(
+        sender.keywords.through.objects.using(using)
+        .filter(newspaper_id=instance.pk)
+        .values_list("keyword_id", flat=True),
+        -1,
+    )
 
-        keyword_names = [keyword.name for keyword in self.keywords.all()]
 
-        with transaction.atomic():
-            existing_keywords = Keyword.objects.filter(name__in=keyword_names)
-            existing_keyword_names = set(
-                existing_keywords.values_list("name", flat=True)
+@receiver(post_delete, sender=Newspaper)
+def count_deleted_keyword_links(
+    sender, instance, using, origin=None, **kwargs
+):
+    """
+    Signal to apply the keyword usage changes of a deleted newspaper.
+    """
+    if deleted_in_bulk(origin):
+        return
+    adjust_keyword_counts(instance.__dict__.pop("_keyword_deltas", {}), using)
+
+
+@receiver(m2m_changed, sender=Newspaper.keywords.through)
+def count_keyword_usage(
+    sender, instance, action, reverse, pk_set, using, **kwargs
+):
+    """
+    Signal to keep Keyword.usage_count in step with keyword links.
+    """
+    if action == "post_add":
+        if reverse:
+            adjust_keyword_counts({instance.pk: len(pk_set)}, using)
+        else:
+            adjust_keyword_counts(dict.fromkeys(pk_set, 1), using)
+        return
+
+    if action in ("pre_remove", "pre_clear"):
+        if reverse:
+            links = sender.objects.using(using).filter(keyword_id=instance.pk)
+            if action == "pre_remove":
+                links = links.filter(newspaper_id__in=pk_set)
+            instance._keyword_deltas = {instance.pk: -links.count()}
+        else:
+            links = sender.objects.using(using).filter(
+                newspaper_id=instance.pk
+            )
+            if action == "pre_remove":
+                links = links.filter(keyword_id__in=pk_set)
+            instance._keyword_deltas = dict.fromkeys(
+                links.values_list("keyword_id", flat=True), -1
             )
+    elif action in ("post_remove", "post_clear"):
+        adjust_keyword_counts(
+            instance.__dict__.pop("_keyword_deltas", {}), using
+        )
+
+
+@receiver(post_save, sender=Newspaper)
+def reindex_saved_newspaper(
+    sender, instance, created, update_fields, using, **kwargs
+):
+    """
+    Signal to reindex a newspaper whose title or content may have changed.
+    """
+    if created or update_fields is None or (
+        {"title", "content"} & set(update_fields)
+    ):
+        reindex_newspapers([instance.pk], using=using)
+
 
-            new_keywords = [
-                Keyword(name=name)
-                for name in keyword_names
-                if name not in existing_keyword_names
-            ]
-            if new_keywords:
-                Keyword.objects.bulk_create(new_keywords)
+@receiver(m2m_changed, sender=Newspaper.publishers.through)
+@receiver(m2m_changed, sender=Newspaper.keywords.through)
+def touch_newspapers_on_m2m_change(
+    sender, instance, action, reverse, pk_set, using, **kwargs
+):
+    """
+    Signal to refresh newspapers whose publishers or keywords changed.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            touch_newspapers([instance.pk], using=using)
+            reindex_newspapers([instance.pk], using=using)
+        return
 
-            all_keywords = Keyword.objects.filter(name__in=keyword_names)
-            self.keywords.set(all_keywords)
+    if action == "pre_clear":
+        instance._cleared_newspaper_ids = list(
+            sender.objects.using(using)
+            .filter(**{instance._meta.model_name: instance.pk})
+            .values_list("newspaper_id", flat=True)
+        )
+    elif action == "post_clear":
+        newspaper_ids = getattr(instance, "_cleared_newspaper_ids", [])
+        touch_newspapers(newspaper_ids, using=using)
+        reindex_newspapers(newspaper_ids, using=using)
+    elif action in ("post_add", "post_remove"):
+        touch_newspapers(pk_set, using=using)
+        reindex_newspapers(pk_set, using=using)
 
 
 class Keyword(models.Model):
@@ -123,9 +628,93 @@ class Keyword(models.Model):
     """
 
     name = models.CharField(max_length=120, unique=True)
+    usage_count = models.PositiveIntegerField(
+        default=0, db_index=True, editable=False
+    )
 
     class Meta:
         ordering = ["name"]
 
     def __str__(self) -> str:
         return self.name
+
+
+@receiver(pre_save, sender=Keyword)
+def detect_keyword_rename(sender, instance, update_fields, **kwargs):
+    """
+    Signal to remember whether a keyword's name is about to change.
+    """
+    instance._renamed = (
+        instance.pk is not None
+        and (update_fields is None or "name" in update_fields)
+        and sender.objects.filter(pk=instance.pk)
+        .exclude(name=instance.name)
+        .exists()
+    )
+
+
+@receiver(post_save, sender=Keyword)
+def refresh_newspapers_on_keyword_rename(sender, instance, using, **kwargs):
+    """
+    Signal to refresh the newspapers of a renamed keyword.
+    """
+    if getattr(instance, "_renamed", False):
+        newspaper_ids = list(
+            instance.keyword_newspapers.values_list("id", flat=True)
+        )
+        touch_newspapers(newspaper_ids, using=using)
+        reindex_newspapers(newspaper_ids, using=using)
+
+
+@receiver(pre_delete, sender=Keyword)
+def remember_keyword_newspapers(sender, instance, using, **kwargs):
+    """
+    Signal to remember the newspapers of a keyword about to be deleted.
+    """
+    instance._newspaper_ids = list(
+        instance.keyword_newspapers.using(using).values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Keyword)
+def refresh_newspapers_on_keyword_delete(sender, instance, using, **kwargs):
+    """
+    Signal to drop a deleted keyword from its newspapers' documents.
+    """
+    newspaper_ids = instance.__dict__.pop("_newspaper_ids", [])
+    touch_newspapers(newspaper_ids, using=using)
+    reindex_newspapers(newspaper_ids, using=using)
+
+
+class FixtureFile(models.Model):
+    """
+    Content hash of a fixture file the last time sync_fixtures applied it.
+    """
+
+    path = models.CharField(max_length=255, unique=True)
+    digest = models.CharField(max_length=64)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return self.path
+
+
+class FixtureObject(models.Model):
+    """
+    Content hash of a single fixture object as last written by sync_fixtures.
+    """
+
+    model = models.CharField(max_length=100)
+    object_pk = models.CharField(max_length=64)
+    digest = models.CharField(max_length=64)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "object_pk"],
+                name="news_fixtureobject_model_pk_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model}:{self.object_pk}"
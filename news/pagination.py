@@ -0,0 +1,291 @@
+"""
+Keyset and cached-count pagination for list views and admin changelists.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+CURSOR_SALT = "news.pagination.cursor"
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    is_cursor_page = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if not self._has_next:
+            return None
+        return self.paginator.encode_cursor(NEXT, self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not self._has_previous:
+            return None
+        return self.paginator.encode_cursor(PREVIOUS, self.object_list[0])
+
+
+class CursorPaginator:
+    """
+    Paginates a queryset by an ordering key ending in a unique field.
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int, ordering):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+
+    def page(self, cursor=None) -> CursorPage:
+        direction, queryset = self._page_queryset(cursor)
+        return self._build_page(direction, list(queryset))
+
+    async def apage(self, cursor=None) -> CursorPage:
+        direction, queryset = self._page_queryset(cursor)
+        return self._build_page(direction, [row async for row in queryset])
+
+    def _page_queryset(self, cursor):
+        """
+        Returns the page direction and a queryset of its rows plus one.
+        """
+        if not cursor:
+            return None, self.queryset.order_by(*self.ordering)[
+                :self.per_page + 1
+            ]
+
+        direction, values = self.decode_cursor(cursor)
+        if direction == NEXT:
+            return direction, (
+                self.queryset.filter(self._keyset_filter(values, "gt"))
+                .order_by(*self.ordering)[:self.per_page + 1]
+            )
+        return direction, (
+            self.queryset.filter(self._keyset_filter(values, "lt"))
+            .order_by(*[f"-{field}" for field in self.ordering])
+            [:self.per_page + 1]
+        )
+
+    def _build_page(self, direction, rows) -> CursorPage:
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if direction == PREVIOUS:
+            rows.reverse()
+            return CursorPage(rows, self, True, has_more)
+        return CursorPage(rows, self, has_more, direction == NEXT)
+
+    def encode_cursor(self, direction: str, obj) -> str:
+        values = [getattr(obj, field) for field in self.ordering]
+        return signing.dumps(
+            [direction, values],
+            salt=CURSOR_SALT,
+            serializer=_CursorSerializer,
+            compress=True,
+        )
+
+    def decode_cursor(self, cursor: str):
+        try:
+            direction, values = signing.loads(
+                cursor, salt=CURSOR_SALT, serializer=_CursorSerializer
+            )
+        except (signing.BadSignature, TypeError, ValueError):
+            raise InvalidCursor("Invalid cursor.")
+        if direction not in (NEXT, PREVIOUS) or (
+            len(values) != len(self.ordering)
+        ):
+            raise InvalidCursor("Invalid cursor.")
+
+        model_fields = self.queryset.model._meta
+        try:
+            values = [
+                model_fields.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise InvalidCursor("Invalid cursor.")
+        return direction, values
+
+    def _keyset_filter(self, values, lookup: str) -> Q:
+        """
+        Expands (a, b) > (x, y) into a >= x AND (a > x OR (a = x AND b > y)).
+        """
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            step = Q(**{f"{field}__{lookup}": values[index]})
+            for previous, value in zip(self.ordering[:index], values):
+                step &= Q(**{previous: value})
+            condition |= step
+        # The leading a >= x lets the database seek the index to the cursor.
+        return Q(**{f"{self.ordering[0]}__{lookup}e": values[0]}) & condition
+
+
+class CursorPaginationMixin:
+    """
+    Keyset pagination for ListView, except for explicitly ordered querysets.
+    """
+
+    cursor_ordering = ("title", "published_date", "id")
+    cursor_kwarg = "cursor"
+
+    def paginate_queryset(self, queryset, page_size):
+        if queryset.query.order_by:
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(queryset, page_size, self.cursor_ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404("Invalid cursor.")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the count, or estimates it for large admin tables.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        orphans=0,
+        allow_empty_first_page=True,
+        count_key=None,
+    ):
+        super().__init__(
+            object_list, per_page, orphans, allow_empty_first_page
+        )
+        self.count_key = count_key
+
+    @cached_property
+    def count(self) -> int:
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        if self.object_list.query.is_empty():
+            return 0
+
+        estimate = self._estimated_count()
+        if estimate is not None:
+            return estimate
+
+        key = self._cache_key()
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(
+                key,
+                count,
+                getattr(settings, "PAGINATOR_COUNT_CACHE_TIMEOUT", 60),
+            )
+        return count
+
+    async def acount(self) -> int:
+        """
+        Async variant of count, without the admin-only estimate.
+        """
+        if "count" in self.__dict__:
+            return self.count
+        if not isinstance(self.object_list, QuerySet):
+            count = len(self.object_list)
+        elif self.object_list.query.is_empty():
+            count = 0
+        else:
+            key = self._cache_key()
+            count = await cache.aget(key)
+            if count is None:
+                count = await self.object_list.acount()
+                await cache.aset(
+                    key,
+                    count,
+                    getattr(settings, "PAGINATOR_COUNT_CACHE_TIMEOUT", 60),
+                )
+        self.__dict__["count"] = count
+        return count
+
+    async def apage(self, number):
+        """
+        Async variant of ``page()``.
+        """
+        await self.acount()
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        rows = [row async for row in self.object_list[bottom:top]]
+        return self._get_page(rows, number, self)
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        if (
+            connections[queryset.db].vendor != "postgresql"
+            or queryset.query.where
+            or queryset.query.distinct
+        ):
+            return None
+
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        threshold = getattr(settings, "PAGINATOR_ESTIMATE_THRESHOLD", 100000)
+        if row is None or row[0] < threshold:
+            return None
+        return row[0]
+
+    def _cache_key(self) -> str:
+        queryset = self.object_list
+        if self.count_key is None:
+            sql, params = queryset.query.sql_with_params()
+            source = f"{sql}{params!r}"
+        else:
+            source = repr(self.count_key)
+        digest = hashlib.md5(
+            f"{queryset.db}:{queryset.model._meta.label}:{source}".encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"news:count:{digest}"
+
+
+class _CursorSerializer:
+    def dumps(self, obj):
+        return DjangoJSONEncoder(separators=(",", ":")).encode(obj).encode()
+
+    def loads(self, data):
+        return signing.JSONSerializer().loads(data)
@@ -0,0 +1,165 @@
+"""
+Sampling profiler for production requests.
+"""
+
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+from django.urls import Resolver404, resolve
+
+from news.metrics import UNRESOLVED_VIEW
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_SUFFIX = ".prof"
+_SALT = "news.profiling"
+_TOKEN_VALUE = "profile"
+
+_profiling = threading.Lock()
+
+
+def profile_token() -> str:
+    return signing.TimestampSigner(salt=_SALT).sign(_TOKEN_VALUE)
+
+
+def valid_token(token: str) -> bool:
+    try:
+        value = signing.TimestampSigner(salt=_SALT).unsign(
+            token, max_age=getattr(settings, "PROFILE_TOKEN_MAX_AGE", 3600)
+        )
+    except signing.BadSignature:
+        return False
+    return value == _TOKEN_VALUE
+
+
+def profile_dir() -> Path:
+    return Path(getattr(settings, "PROFILE_DIR", "profiles"))
+
+
+def view_directory(view_name: str) -> Path:
+    return profile_dir() / re.sub(r"[^\w.-]", "_", view_name)
+
+
+def save_profile(profiler, view_name: str) -> Path:
+    """
+    Writes the profile and keeps only the newest PROFILE_KEEP of the view.
+    """
+    directory = view_directory(view_name)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / (
+        f"{time.time_ns()}-{os.getpid()}-{threading.get_ident()}"
+        f"{PROFILE_SUFFIX}"
+    )
+    # Written under another name first so readers never see half a file.
+    partial = path.with_suffix(".tmp")
+    profiler.dump_stats(partial)
+    os.replace(partial, path)
+
+    keep = getattr(settings, "PROFILE_KEEP", 50)
+    profiles = sorted(directory.glob(f"*{PROFILE_SUFFIX}"))
+    for old in profiles[: max(len(profiles) - keep, 0)]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+class ProfilingMiddleware:
+    """
+    Profiles sampled requests and staff requests sending an X-Profile token.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def sampled(self, request, user) -> bool:
+        token = request.headers.get(PROFILE_HEADER)
+        if token:
+            return user.is_staff and valid_token(token)
+        rate = getattr(settings, "PROFILE_SAMPLE_RATE", 0)
+        return rate > 0 and random.randrange(rate) == 0
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.sampled(request, request.user):
+            return self.get_response(request)
+        return self.profile(request, lambda: self.get_response(request))
+
+    async def __acall__(self, request):
+        user = request.user
+        if PROFILE_HEADER in request.headers:
+            user = await request.auser()
+        if not self.sampled(request, user):
+            return await self.get_response(request)
+        try:
+            match = resolve(
+                request.path_info, getattr(request, "urlconf", None)
+            )
+        except Resolver404:
+            return await self.get_response(request)
+        if iscoroutinefunction(match.func):
+            return await self.aprofile(request)
+        # Sync views run in a worker thread, which cProfile only sees
+        # when it is enabled there; process_view does that.
+        request._profile_view = True
+        return await self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not request.__dict__.pop("_profile_view", False):
+            return None
+
+        def call_view():
+            response = view_func(request, *view_args, **view_kwargs)
+            if callable(getattr(response, "render", None)):
+                response = response.render()
+            return response
+
+        return self.profile(request, call_view)
+
+    def profile(self, request, call):
+        # One profile per process: cProfile hooks are per thread and a
+        # second enable() may silently replace the first.
+        if not _profiling.acquire(blocking=False):
+            return call()
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                response = call()
+            finally:
+                profiler.disable()
+        finally:
+            _profiling.release()
+        self.save(profiler, request)
+        return response
+
+    async def aprofile(self, request):
+        if not _profiling.acquire(blocking=False):
+            return await self.get_response(request)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+        finally:
+            _profiling.release()
+        self.save(profiler, request)
+        return response
+
+    @staticmethod
+    def save(profiler, request) -> None:
+        match = request.resolver_match
+        save_profile(profiler, match.view_name if match else UNRESOLVED_VIEW)
@@ -0,0 +1,86 @@
+"""
+Primary/replica database routing for views with replica_reads = True.
+"""
+
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS
+from django.dispatch import receiver
+
+PIN_COOKIE = "db_primary_pin"
+# Rows read right after they are written, e.g. a new session.
+PRIMARY_ONLY_APPS = {"sessions", "auth", "admin", "contenttypes"}
+# Writes that do not pin the session to the primary.
+UNPINNED_WRITE_APPS = {"sessions"}
+
+
+@dataclass
+class RoutingState:
+    replica_reads: bool = False
+    wrote: bool = False
+    # One replica per request, so its reads share one replication lag.
+    replica: Optional[str] = None
+
+
+_routing = ContextVar("news_db_routing", default=None)
+
+
+def begin_request() -> RoutingState:
+    state = RoutingState()
+    _routing.set(state)
+    return state
+
+
+def current_state():
+    return _routing.get()
+
+
+@receiver(request_finished)
+def end_request(**kwargs):
+    _routing.set(None)
+
+
+def replicas() -> list:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        aliases = replicas()
+        if (
+            state is None
+            or not state.replica_reads
+            or state.wrote
+            or not aliases
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or model._meta.label == settings.AUTH_USER_MODEL
+        ):
+            return DEFAULT_DB_ALIAS
+        if state.replica not in aliases:
+            state.replica = random.choice(aliases)
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None and (
+            model._meta.app_label not in UNPINNED_WRITE_APPS
+        ):
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replicas():
+            return False
+        return None
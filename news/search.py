@@ -0,0 +1,252 @@
+"""
+Full-text search over newspapers: tsvector on PostgreSQL, FTS5 on SQLite.
+"""
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F, FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+SEARCH_CONFIG = "english"
+FTS_TABLE = "news_newspaper_fts"
+FTS_DELETE_TRIGGER = "news_newspaper_fts_delete"
+INDEX_BATCH_SIZE = 500
+
+_pending = ContextVar("news_search_pending", default=None)
+
+
+def build_search_document(newspaper) -> str:
+    """
+    Returns the searchable text of an article, title excluded.
+    """
+    return search_document(
+        newspaper.publishers.all(),
+        [keyword.name for keyword in newspaper.keywords.all()],
+        newspaper.content,
+    )
+
+
+def search_document(publishers, keyword_names, content) -> str:
+    authors = " ".join(
+        f"{publisher.first_name} {publisher.last_name} {publisher.username}"
+        for publisher in publishers
+    )
+    return "\n".join([authors, " ".join(keyword_names), content])
+
+
+def update_search_index(
+    newspaper_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Rebuilds the search document and the index of the given articles.
+    """
+    from news.models import Newspaper
+
+    ids = list(newspaper_ids)
+    for start in range(0, len(ids), INDEX_BATCH_SIZE):
+        batch = ids[start:start + INDEX_BATCH_SIZE]
+        newspapers = list(
+            Newspaper.objects.using(using)
+            .filter(pk__in=batch)
+            .only("id", "title", "content")
+            .prefetch_related("publishers", "keywords")
+        )
+        for newspaper in newspapers:
+            newspaper.search_document = build_search_document(newspaper)
+        Newspaper.objects.using(using).bulk_update(
+            newspapers, ["search_document"]
+        )
+        _refresh_backend_index(newspapers, using)
+
+
+def index_new_newspapers(
+    newspapers: list, using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Indexes inserted articles whose search_document is already set.
+    """
+    for start in range(0, len(newspapers), INDEX_BATCH_SIZE):
+        _refresh_backend_index(
+            newspapers[start:start + INDEX_BATCH_SIZE], using
+        )
+
+
+def reindex_newspapers(
+    newspaper_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Reindexes the articles now or at the end of deferred_search_index().
+    """
+    pending = _pending.get()
+    if pending is None:
+        update_search_index(newspaper_ids, using=using)
+    else:
+        pending.setdefault(using, set()).update(newspaper_ids)
+
+
+@contextmanager
+def deferred_search_index():
+    """
+    Reindexes each article changed inside the block once, at its end.
+    """
+    if _pending.get() is not None:
+        yield
+        return
+    pending = {}
+    token = _pending.set(pending)
+    try:
+        yield
+    finally:
+        _pending.reset(token)
+    for using, ids in pending.items():
+        update_search_index(sorted(ids), using=using)
+
+
+def remove_from_search_index(
+    newspaper_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Drops articles from the SQLite FTS5 table.
+    """
+    ids = list(newspaper_ids)
+    if not ids or connections[using].vendor != "sqlite":
+        return
+    with connections[using].cursor() as cursor:
+        for start in range(0, len(ids), INDEX_BATCH_SIZE):
+            batch = ids[start:start + INDEX_BATCH_SIZE]
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN "
+                f"({', '.join(['%s'] * len(batch))})",
+                batch,
+            )
+
+
+def create_search_delete_trigger(apps, schema_editor) -> None:
+    """
+    Removes the FTS5 row of every deleted article on SQLite.
+    """
+    # SQLite drops the trigger whenever a migration rebuilds
+    # news_newspaper, so those migrations re-create it around the rebuild.
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_DELETE_TRIGGER} "
+            f"AFTER DELETE ON news_newspaper BEGIN "
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = old.id; END"
+        )
+
+
+def drop_search_delete_trigger(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_DELETE_TRIGGER}")
+
+
+def search_newspapers(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filters the queryset to articles matching the query, by relevance.
+    """
+    vendor = connections[queryset.db].vendor
+
+    if vendor == "postgresql":
+        expression = tsquery_prefix_expression(query)
+        if not expression:
+            return queryset.none()
+        search_query = SearchQuery(
+            expression, config=SEARCH_CONFIG, search_type="raw"
+        )
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "id")
+        )
+
+    if vendor == "sqlite":
+        match = fts5_match_expression(query)
+        if not match:
+            return queryset.none()
+        table = queryset.model._meta.db_table
+        return (
+            queryset.filter(
+                id__in=RawSQL(
+                    f"SELECT rowid FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH %s",
+                    (match,),
+                )
+            )
+            .annotate(
+                rank=RawSQL(
+                    f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+                    (match,),
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-rank", "id")
+        )
+
+    return queryset.filter(
+        Q(title__icontains=query)
+        | Q(publishers__first_name__icontains=query)
+        | Q(publishers__last_name__icontains=query)
+        | Q(keywords__name__icontains=query)
+    ).distinct()
+
+
+def normalize_query(query: str) -> str:
+    """
+    Collapses whitespace and case so equivalent searches share cache keys.
+    """
+    return " ".join(query.split()).casefold()
+
+
+def fts5_match_expression(query: str) -> str:
+    """
+    Turns user input into an FTS5 expression of quoted prefix terms.
+    """
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", query))
+
+
+def tsquery_prefix_expression(query: str) -> str:
+    """
+    Turns user input into a tsquery of quoted prefix terms, like FTS5's.
+    """
+    return " & ".join(f"'{term}':*" for term in re.findall(r"\w+", query))
+
+
+def _refresh_backend_index(newspapers: list, using: str) -> None:
+    from news.models import Newspaper
+
+    if not newspapers:
+        return
+    vendor = connections[using].vendor
+
+    if vendor == "postgresql":
+        Newspaper.objects.using(using).filter(
+            pk__in=[newspaper.pk for newspaper in newspapers]
+        ).update(
+            search_vector=SearchVector(
+                "title", weight="A", config=SEARCH_CONFIG
+            )
+            + SearchVector("search_document", weight="B", config=SEARCH_CONFIG)
+        )
+    elif vendor == "sqlite":
+        remove_from_search_index(
+            [newspaper.pk for newspaper in newspapers], using=using
+        )
+        with connections[using].cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, document) "
+                "VALUES (%s, %s, %s)",
+                [
+                    (newspaper.pk, newspaper.title, newspaper.search_document)
+                    for newspaper in newspapers
+                ],
+            )
@@ -0,0 +1,143 @@
+"""
+Log of queries slower than SLOW_QUERY_MS, with parameter types only.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from itertools import groupby
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.shortcuts import render
+
+from news.connections import install_execute_wrapper
+from news.metrics import current_metrics
+
+logger = logging.getLogger(__name__)
+
+NEWS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Frames of the query wrappers themselves are not call sites.
+WRAPPER_FILES = {
+    os.path.join(NEWS_DIR, "metrics.py"),
+    os.path.join(NEWS_DIR, "slow_queries.py"),
+}
+
+_lock = Lock()
+_entries = deque(maxlen=getattr(settings, "SLOW_QUERY_BUFFER", 200))
+
+
+def slow_queries() -> list:
+    """
+    Returns the buffered entries, newest first.
+    """
+    with _lock:
+        return list(reversed(_entries))
+
+
+def clear_slow_queries() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def add_entry(entry: dict) -> None:
+    global _entries
+    size = getattr(settings, "SLOW_QUERY_BUFFER", 200)
+    with _lock:
+        if _entries.maxlen != size:
+            _entries = deque(_entries, maxlen=size)
+        _entries.append(entry)
+
+
+def params_shape(params, many: bool):
+    """
+    Describes parameters by type, folding repeats, e.g. (int*3, str).
+    """
+    if params is None:
+        return None
+    if many:
+        if not isinstance(params, (list, tuple)):
+            return "batch"
+        if not params:
+            return "0 rows"
+        return f"{len(params)} rows x {params_shape(params[0], False)}"
+    if isinstance(params, dict):
+        names = ", ".join(
+            f"{key}: {type(value).__name__}" for key, value in params.items()
+        )
+        return f"{{{names}}}"
+    names = ", ".join(
+        name if count == 1 else f"{name}*{count}"
+        for name, count in (
+            (name, len(list(run)))
+            for name, run in groupby(type(value).__name__ for value in params)
+        )
+    )
+    return f"({names})"
+
+
+def call_site():
+    """
+    Returns the innermost call site in the news package, or None.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(NEWS_DIR + os.sep)
+            and filename not in WRAPPER_FILES
+        ):
+            path = os.path.relpath(filename, os.path.dirname(NEWS_DIR))
+            return f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def log_slow_query(execute, sql, params, many, context):
+    threshold = getattr(settings, "SLOW_QUERY_MS", 200)
+    if threshold <= 0:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = (time.perf_counter() - started) * 1000
+        if duration >= threshold:
+            metrics = current_metrics()
+            entry = {
+                "time": datetime.now(timezone.utc).isoformat(),
+                "duration_ms": round(duration, 1),
+                "alias": context["connection"].alias,
+                "sql": sql,
+                "params": params_shape(params, many),
+                "view": metrics.view_name if metrics else None,
+                "path": metrics.path if metrics else None,
+                "call_site": call_site(),
+            }
+            add_entry(entry)
+            logger.warning("slow query %s", json.dumps(entry))
+
+
+@receiver(connection_created)
+def install_slow_query_log(sender, connection, **kwargs):
+    install_execute_wrapper(connection, log_slow_query)
+
+
+@staff_member_required
+def slow_queries_view(request):
+    return render(
+        request,
+        "pages/slow_queries.html",
+        {
+            "entries": slow_queries(),
+            "threshold": getattr(settings, "SLOW_QUERY_MS", 200),
+            "buffer_size": getattr(settings, "SLOW_QUERY_BUFFER", 200),
+        },
+    )
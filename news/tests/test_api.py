@@ -0,0 +1,194 @@
+import datetime
+import json
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from news.models import Redactor, Newspaper, Topic, Keyword
+from news.topics import topic_ids
+
+
+class NewspaperApiTest(TestCase):
+    def setUp(self):
+        topic_ids.invalidate()
+        self.tech = Topic.objects.create(name="Tech")
+        self.art = Topic.objects.create(name="Art")
+        self.author = Redactor.objects.create_user(
+            username="writer",
+            password="password123",
+            first_name="Ada",
+            last_name="Lovelace",
+        )
+        self.keyword = Keyword.objects.create(name="ai")
+        self.newspapers = []
+        for index in range(5):
+            newspaper = Newspaper.objects.create(
+                title=f"Tech News {index}",
+                content=f"Tech content {index}",
+                topic=self.tech,
+            )
+            newspaper.publishers.add(self.author)
+            newspaper.keywords.add(self.keyword)
+            self.newspapers.append(newspaper)
+        self.painting = Newspaper.objects.create(
+            title="Painting", content="Art content", topic=self.art
+        )
+        self.client.force_login(self.author)
+        self.async_client.force_login(self.author)
+
+    def export(self, **params):
+        response = self.client.get(reverse("api-newspaper-export"), params)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        return [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+    def test_detail_includes_relations(self):
+        newspaper = self.newspapers[0]
+        response = self.client.get(
+            reverse("api-newspaper-detail", args=[newspaper.pk])
+        )
+        data = response.json()
+        self.assertEqual(data["title"], newspaper.title)
+        self.assertEqual(data["topic"], {"id": self.tech.id, "name": "Tech"})
+        self.assertEqual(
+            data["publishers"],
+            [
+                {
+                    "id": self.author.id,
+                    "username": "writer",
+                    "full_name": "Ada Lovelace",
+                }
+            ],
+        )
+        self.assertEqual(
+            data["keywords"], [{"id": self.keyword.id, "name": "ai"}]
+        )
+
+    def test_anonymous_requests_are_forbidden(self):
+        self.client.logout()
+        for url in [
+            reverse("api-newspaper-list"),
+            reverse("api-newspaper-detail", args=[self.painting.pk]),
+            reverse("api-newspaper-export"),
+        ]:
+            with self.subTest(url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 403)
+                self.assertNotContains(
+                    response, "Art content", status_code=403
+                )
+
+    def test_detail_missing_article(self):
+        response = self.client.get(
+            reverse("api-newspaper-detail", args=[0])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_follows_cursor(self):
+        response = self.client.get(
+            reverse("api-newspaper-list"), {"limit": 4}
+        )
+        first = response.json()
+        self.assertEqual(len(first["results"]), 4)
+        self.assertIsNone(first["previous"])
+
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(
+            [item["id"] for item in first["results"] + second["results"]],
+            [newspaper.id for newspaper in self.newspapers + [self.painting]],
+        )
+        self.assertIsNone(second["next"])
+
+    def test_list_filters_by_category(self):
+        response = self.client.get(
+            reverse("api-newspaper-list"), {"category": "art"}
+        )
+        self.assertEqual(
+            [item["id"] for item in response.json()["results"]],
+            [self.painting.id],
+        )
+
+    def test_invalid_filters_are_rejected(self):
+        response = self.client.get(
+            reverse("api-newspaper-list"), {"date_from": "yesterday"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("date_from", response.json()["errors"])
+
+        response = self.client.get(
+            reverse("api-newspaper-list"), {"cursor": "bogus"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_streams_every_article(self):
+        rows = self.export()
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[0]["publishers"][0]["username"], "writer")
+
+    def test_export_filters_by_date_range(self):
+        Newspaper.objects.filter(pk=self.painting.pk).update(
+            published_date=datetime.date(2020, 1, 1)
+        )
+        rows = self.export(date_to="2020-12-31")
+        self.assertEqual([row["id"] for row in rows], [self.painting.id])
+        rows = self.export(date_from="2021-01-01", category="tech")
+        self.assertEqual(len(rows), 5)
+
+    def test_export_prefetches_per_chunk(self):
+        # The session and user, one streamed select, then two prefetch
+        # queries per chunk of two.
+        with mock.patch("news.api.EXPORT_CHUNK_SIZE", 2):
+            with self.assertNumQueries(9):
+                rows = self.export()
+        self.assertEqual(len(rows), 6)
+
+
+class AsyncNewspaperApiTest(NewspaperApiTest):
+    """
+    Runs the async endpoints against the same data.
+    """
+
+    async def test_async_list_matches_sync_list(self):
+        sync = (await self.async_client.get(
+            reverse("api-newspaper-list"), {"category": "tech"}
+        )).json()
+        response = await self.async_client.get(
+            reverse("async-api-newspaper-list"), {"category": "tech"}
+        )
+        self.assertEqual(response.json()["results"], sync["results"])
+
+    async def test_async_detail(self):
+        response = await self.async_client.get(
+            reverse("async-api-newspaper-detail", args=[self.painting.pk])
+        )
+        self.assertEqual(response.json()["title"], "Painting")
+        response = await self.async_client.get(
+            reverse("async-api-newspaper-detail", args=[0])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_async_anonymous_requests_are_forbidden(self):
+        await self.async_client.alogout()
+        for url in [
+            reverse("async-api-newspaper-list"),
+            reverse("async-api-newspaper-detail", args=[self.painting.pk]),
+            reverse("async-api-newspaper-export"),
+        ]:
+            with self.subTest(url):
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 403)
+
+    async def test_async_export_streams_every_article(self):
+        response = await self.async_client.get(
+            reverse("async-api-newspaper-export")
+        )
+        lines = b"".join(
+            [chunk async for chunk in response.streaming_content]
+        ).splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(
+            json.loads(lines[0])["publishers"][0]["username"], "writer"
+        )
@@ -0,0 +1,54 @@
+import json
+from io import StringIO
+from itertools import islice
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from news.benchmarks import corpus_records, corpus_sizes
+from news.models import Newspaper, Redactor
+
+
+class CorpusTest(TestCase):
+    def test_records_are_deterministic(self):
+        sizes = corpus_sizes(1000)
+        first = list(islice(corpus_records(7, sizes), 50))
+        self.assertEqual(first, list(islice(corpus_records(7, sizes), 50)))
+        self.assertNotEqual(first, list(islice(corpus_records(8, sizes), 50)))
+        self.assertIn("bench-7-0", first[0]["publishers"])
+
+    def test_sizes_scale_with_articles(self):
+        small, large = corpus_sizes(1000), corpus_sizes(1_000_000)
+        self.assertEqual(small["redactors"], 20)
+        self.assertEqual(large["redactors"], 20_000)
+        self.assertEqual(large["topics"], 200)
+
+
+class BenchmarkViewsCommandTest(TestCase):
+    def test_reports_every_route(self):
+        stdout = StringIO()
+        call_command(
+            "benchmark_views",
+            articles=30,
+            iterations=2,
+            warmup=0,
+            no_test_db=True,
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+        report = json.loads(stdout.getvalue())
+
+        self.assertEqual(Newspaper.objects.count(), 30)
+        self.assertEqual(
+            Redactor.objects.filter(username__startswith="bench-0-").count(),
+            10,
+        )
+        routes = {route["name"]: route for route in report["routes"]}
+        self.assertEqual(report["corpus"]["articles"], 30)
+        self.assertEqual(routes["index"]["status"], 200)
+        self.assertEqual(routes["delete"]["status"], 302)
+        self.assertGreater(routes["detail"]["queries"], 0)
+        self.assertGreater(routes["index"]["peak_memory_kb"], 0)
+        for route in report["routes"]:
+            self.assertIn(route["status"], (200, 302), route["name"])
+            self.assertLessEqual(route["p50_ms"], route["p99_ms"])
@@ -0,0 +1,87 @@
+import os
+import runpy
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.db.utils import ConnectionHandler
+from django.db.backends.signals import connection_created
+from django.test import TestCase
+from django.urls import reverse
+
+from news.connections import connection_stats, count_reuse, reset_stats
+from news.metrics import record_query
+from news.models import Redactor
+from news.slow_queries import log_slow_query
+from psycopg_pool import ConnectionPool
+
+
+class ConnectionStatsTest(TestCase):
+    def setUp(self):
+        reset_stats()
+        self.addCleanup(reset_stats)
+
+    def test_reused_connection_avoids_a_handshake(self):
+        connection.ensure_connection()
+        connection_created.send(
+            sender=connection.__class__, connection=connection
+        )
+        count_reuse()
+        count_reuse()
+
+        stats = connection_stats()["default"]
+        self.assertEqual(stats["checkouts"], 3)
+        self.assertEqual(stats["handshakes"], 1)
+        self.assertEqual(stats["handshakes_avoided"], 2)
+        self.assertEqual(stats["waits"], 0)
+
+    def test_checkouts_install_each_wrapper_once(self):
+        connection.ensure_connection()
+        for _ in range(2):
+            connection_created.send(
+                sender=connection.__class__, connection=connection
+            )
+        for wrapper in [record_query, log_slow_query]:
+            self.assertEqual(connection.execute_wrappers.count(wrapper), 1)
+
+    def test_stats_view_is_staff_only(self):
+        url = reverse("db-connection-stats")
+        user = Redactor.objects.create_user(
+            username="editor", password="pass12345"
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        user.is_staff = True
+        user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("default", response.json()["databases"])
+        self.assertGreater(
+            response.json()["databases"]["default"]["checkouts"], 0
+        )
+
+
+class ConnectionBudgetCommandTest(TestCase):
+    def test_reports_connections_per_alias(self):
+        stdout = StringIO()
+        call_command(
+            "connection_budget", workers=3, threads=2, stdout=stdout
+        )
+        self.assertIn("default: 3 processes x 2 = 6 connections", stdout.getvalue())
+
+
+class ConnectionPoolSettingsTest(TestCase):
+    def test_pooled_checkouts_are_health_checked(self):
+        with mock.patch.dict(os.environ, {"DB_POOL_MAX_SIZE": "4"}):
+            databases = runpy.run_path(
+                settings.BASE_DIR / "newspaper_agency" / "settings.py"
+            )["DATABASES"]
+        wrapper = ConnectionHandler(databases)["default"]
+        self.addCleanup(DatabaseWrapper._connection_pools.pop, "default")
+
+        self.assertEqual(wrapper.pool.max_size, 4)
+        self.assertEqual(wrapper.pool._check, ConnectionPool.check_connection)
@@ -0,0 +1,43 @@
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import TestCase
+
+from news.models import Keyword, Newspaper, Redactor, Topic
+
+
+class ExplainViewsCommandTest(TestCase):
+    def setUp(self):
+        redactor = Redactor.objects.create_user(
+            username="writer", password="pass12345"
+        )
+        newspaper = Newspaper.objects.create(
+            title="Election day",
+            content="Polls open at seven",
+            topic=Topic.objects.create(name="Politics"),
+        )
+        newspaper.publishers.add(redactor)
+        newspaper.keywords.add(Keyword.objects.create(name="vote"))
+
+    def explain(self) -> str:
+        stdout = StringIO()
+        call_command("explain_views", "--plans", stdout=stdout)
+        return stdout.getvalue()
+
+    def test_list_queries_are_served_by_indexes(self):
+        output = self.explain()
+        self.assertIn("article list by topic (/?category=Politics): 200", output)
+        self.assertIn("USING INDEX news_newspaper_order_idx", output)
+        self.assertIn("USING INDEX news_newspaper_topic_order_idx", output)
+        self.assertIn("USING INDEX news_newspaper_topic_pub_idx", output)
+        self.assertIn(
+            "SEARCH news_newspaper_publishers USING INDEX "
+            "news_newspaper_publishers_redactor_id_",
+            output,
+        )
+
+    def test_pages_are_requested_without_side_effects(self):
+        self.explain()
+        self.assertFalse(Session.objects.exists())
+        self.assertIsNone(Redactor.objects.get().last_login)
@@ -0,0 +1,119 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+
+from news.models import Newspaper, Topic
+
+
+class NewspaperFeedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tech = Topic.objects.create(name="Tech")
+        self.art = Topic.objects.create(name="Art")
+        self.newspaper = Newspaper.objects.create(
+            title="Tech News", content="Tech content", topic=self.tech
+        )
+        self.painting = Newspaper.objects.create(
+            title="Painting", content="Art content", topic=self.art
+        )
+
+    def tech_feed_url(self, kind="rss"):
+        return reverse(f"topic-feed-{kind}", args=[self.tech.pk])
+
+    def test_global_feed_lists_all_topics(self):
+        response = self.client.get(reverse("feed-rss"))
+        self.assertContains(response, "Tech News")
+        self.assertContains(response, "Painting")
+        self.assertTrue(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_topic_feed_lists_only_its_articles(self):
+        response = self.client.get(self.tech_feed_url("atom"))
+        self.assertContains(response, "Tech News")
+        self.assertNotContains(response, "Painting")
+        self.assertEqual(
+            response["Content-Type"], "application/atom+xml; charset=utf-8"
+        )
+
+    def test_unknown_topic(self):
+        response = self.client.get(reverse("topic-feed-rss", args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_unchanged_feed_is_not_modified(self):
+        etag = self.client.get(self.tech_feed_url())["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.tech_feed_url(), HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_cached_body_is_reused(self):
+        self.client.get(self.tech_feed_url())
+        with self.assertNumQueries(1):
+            response = self.client.get(self.tech_feed_url())
+        self.assertContains(response, "Tech News")
+
+    def test_article_changes_refresh_only_their_topic(self):
+        tech_etag = self.client.get(self.tech_feed_url())["ETag"]
+        art_url = reverse("topic-feed-rss", args=[self.art.pk])
+        art_etag = self.client.get(art_url)["ETag"]
+
+        self.newspaper.title = "Renamed News"
+        self.newspaper.save(update_fields=["title"])
+
+        response = self.client.get(
+            self.tech_feed_url(), HTTP_IF_NONE_MATCH=tech_etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Renamed News")
+        response = self.client.get(art_url, HTTP_IF_NONE_MATCH=art_etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_changes_by_another_process_change_the_etag(self):
+        Newspaper.objects.create(
+            title="Later Tech", content="Tech content", topic=self.tech
+        )
+        etag = self.client.get(self.tech_feed_url())["ETag"]
+        # Another worker's delete updates the count in the database but
+        # not this process's cached topic navigation.
+        Newspaper.objects.filter(pk=self.newspaper.pk)._raw_delete("default")
+        Topic.objects.filter(pk=self.tech.pk).update(newspaper_count=0)
+        response = self.client.get(
+            self.tech_feed_url(), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Tech News")
+
+        topic = Topic.objects.create(name="Science")
+        response = self.client.get(reverse("topic-feed-rss", args=[topic.pk]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_cached_body_is_kept_per_host(self):
+        self.client.get(self.tech_feed_url(), HTTP_HOST="localhost")
+        response = self.client.get(
+            self.tech_feed_url(), HTTP_HOST="127.0.0.1"
+        )
+        self.assertContains(response, "http://127.0.0.1/")
+        self.assertNotContains(response, "http://localhost/")
+
+    def test_deletion_changes_the_etag(self):
+        etag = self.client.get(reverse("feed-rss"))["ETag"]
+        self.painting.delete()
+        response = self.client.get(
+            reverse("feed-rss"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Painting")
+
+    def test_deletion_is_not_hidden_by_if_modified_since(self):
+        latest = Newspaper.objects.create(
+            title="Later Tech", content="Tech content", topic=self.tech
+        )
+        self.client.get(self.tech_feed_url())
+        latest.delete()
+        response = self.client.get(
+            self.tech_feed_url(), HTTP_IF_MODIFIED_SINCE=http_date()
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Later Tech")
@@ -81,6 +81,37 @@ class NewspaperFormTest(TestCase):
         cleaned_publishers = form.clean_publishers()
         self.assertIn(self.user, cleaned_publishers)
 
+    def test_newspaper_form_bumps_revision_once_per_save(self):
+        form_data = {
+            "title": "Another Article",
+            "content": "Content here",
+            "topic": self.topic.id,
+            "keywords": "news, tech",
+            "publishers": [self.user.id],
+        }
+        form = NewspaperForm(data=form_data, user=self.user)
+        self.assertTrue(form.is_valid())
+        newspaper = form.save()
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.revision, 1)
+
+        other = User.objects.create_user(username="other")
+        form_data.update(
+            title="Renamed", keywords="tech, ai", publishers=[other.id]
+        )
+        form = NewspaperForm(data=form_data, instance=newspaper, user=self.user)
+        self.assertTrue(form.is_valid())
+        form.save()
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.revision, 2)
+
+        form_data.update(keywords="ai")
+        form = NewspaperForm(data=form_data, instance=newspaper, user=self.user)
+        self.assertTrue(form.is_valid())
+        form.save()
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.revision, 3)
+
 
 class RedactorUpdateFormTest(TestCase):
     def setUp(self):
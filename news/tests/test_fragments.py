@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase
+from django.urls import reverse
+
+from news.fragments import render_newspaper_cards
+from news.models import Redactor, Newspaper, Topic, Keyword
+
+
+class NewspaperCardCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="Tech")
+        self.author = Redactor.objects.create_user(
+            username="writer", password="password123"
+        )
+        self.newspaper = Newspaper.objects.create(
+            title="Tech News", content="Tech content", topic=self.topic
+        )
+        self.newspaper.publishers.add(self.author)
+
+    def card(self):
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        return render_newspaper_cards([newspaper])[0][1]
+
+    def test_warm_card_skips_rendering_queries(self):
+        self.card()
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        with self.assertNumQueries(0):
+            html = render_newspaper_cards([newspaper])[0][1]
+        self.assertIn("writer", html)
+
+    def test_cold_page_renders_only_missing_cards(self):
+        other = Newspaper.objects.create(
+            title="Other News", content="Content", topic=self.topic
+        )
+        self.card()
+        newspapers = list(Newspaper.objects.order_by("id"))
+        with self.assertNumQueries(1):
+            cards = render_newspaper_cards(newspapers)
+        self.assertEqual([newspaper for newspaper, _ in cards], newspapers)
+        self.assertIn(other.title, cards[1][1])
+
+    def test_content_change_invalidates_card(self):
+        self.card()
+        self.newspaper.content = "Fresh content"
+        self.newspaper.save()
+        self.assertIn("Fresh content", self.card())
+
+    def test_publisher_changes_invalidate_card(self):
+        self.card()
+        coauthor = Redactor.objects.create_user(
+            username="coauthor", password="password123"
+        )
+        coauthor.redactor_newspapers.add(self.newspaper)
+        self.assertIn("coauthor", self.card())
+
+        coauthor.redactor_newspapers.clear()
+        self.assertNotIn("coauthor", self.card())
+
+    def test_keyword_change_invalidates_card(self):
+        self.card()
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        newspaper.keywords.add(Keyword.objects.create(name="ai"))
+        newspaper.refresh_from_db(fields=["revision"])
+        self.assertIsNone(
+            cache.get(f"news:card:{newspaper.pk}:{newspaper.revision}")
+        )
+
+    def test_change_by_another_process_invalidates_card(self):
+        # Another worker's cache is not reachable from here; its change
+        # only shows up as a new revision in the database.
+        self.card()
+        Newspaper.objects.filter(pk=self.newspaper.pk).update(
+            title="Edited elsewhere", revision=F("revision") + 1
+        )
+        self.assertIn("Edited elsewhere", self.card())
+
+    def test_stale_rows_cannot_overwrite_a_newer_card(self):
+        stale = Newspaper.objects.get(pk=self.newspaper.pk)
+        self.newspaper.title = "Fresh title"
+        self.newspaper.save()
+        render_newspaper_cards([stale])
+        self.assertIn("Fresh title", self.card())
+
+    def test_username_change_invalidates_card(self):
+        self.card()
+        self.author.username = "renamed"
+        self.author.save()
+        self.assertIn("renamed", self.card())
+
+    def test_index_renders_cached_cards(self):
+        response = self.client.get(reverse("index"))
+        self.assertContains(response, "Tech News")
+        self.assertContains(response, "writer")
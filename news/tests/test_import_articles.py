@@ -0,0 +1,119 @@
+import datetime
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from news.models import Redactor, Newspaper, Topic, Keyword
+from news.search import search_newspapers
+
+
+class ImportArticlesCommandTest(TestCase):
+    def setUp(self):
+        self.politics = Topic.objects.create(name="Politics")
+        self.author = Redactor.objects.create_user(
+            username="writer", password="password123"
+        )
+        self.records = [
+            {
+                "title": f"Archived {index}",
+                "content": f"Archived content about elections {index}",
+                "topic": "Politics" if index % 2 else "History",
+                "published_date": "2019-05-0%d" % (index + 1),
+                "publishers": ["writer"],
+                "keywords": ["archive", f"year{index % 2}"],
+            }
+            for index in range(5)
+        ]
+
+    def write_input(self, content):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            stream.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def run_import(self, content, **options):
+        stdout = StringIO()
+        call_command(
+            "import_articles",
+            self.write_input(content),
+            stdout=stdout,
+            **options,
+        )
+        return stdout.getvalue()
+
+    def ndjson(self):
+        return "\n".join(json.dumps(record) for record in self.records)
+
+    def test_imports_ndjson_in_batches(self):
+        output = self.run_import(self.ndjson(), batch_size=2)
+        self.assertIn("Imported 5 articles", output)
+        self.assertIn("rows/sec", output)
+
+        newspaper = Newspaper.objects.get(title="Archived 0")
+        self.assertEqual(newspaper.topic.name, "History")
+        self.assertEqual(newspaper.published_date, datetime.date(2019, 5, 1))
+        self.assertEqual(list(newspaper.publishers.all()), [self.author])
+        self.assertSetEqual(
+            set(newspaper.keywords.values_list("name", flat=True)),
+            {"archive", "year0"},
+        )
+        self.assertTrue(newspaper.excerpt)
+
+    def test_imports_json_array(self):
+        self.run_import(json.dumps(self.records, indent=2))
+        self.assertEqual(Newspaper.objects.count(), 5)
+
+    def test_updates_counters_and_search_index(self):
+        self.run_import(self.ndjson(), batch_size=2)
+        self.politics.refresh_from_db()
+        self.assertEqual(self.politics.newspaper_count, 2)
+        self.assertEqual(
+            Topic.objects.get(name="History").newspaper_count, 3
+        )
+        self.assertEqual(Keyword.objects.get(name="archive").usage_count, 5)
+        self.assertEqual(
+            search_newspapers(Newspaper.objects.all(), "elections").count(),
+            5,
+        )
+
+    def test_articles_are_written_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.run_import(self.ndjson())
+        writes = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith(
+                ('INSERT INTO "news_newspaper"', 'UPDATE "news_newspaper"')
+            )
+        ]
+        self.assertEqual(len(writes), 1)
+        newspaper = Newspaper.objects.get(title="Archived 0")
+        self.assertIn("writer", newspaper.search_document)
+        self.assertIn("year0", newspaper.search_document)
+        self.assertEqual(
+            search_newspapers(Newspaper.objects.all(), "writer").count(), 5
+        )
+
+    def test_rerun_skips_existing_titles(self):
+        self.run_import(self.ndjson())
+        output = self.run_import(self.ndjson())
+        self.assertIn("Imported 0 articles, skipped 5", output)
+        self.assertEqual(Newspaper.objects.count(), 5)
+        self.assertEqual(Keyword.objects.get(name="archive").usage_count, 5)
+
+    def test_unknown_publisher_rolls_back_the_batch(self):
+        self.records[3]["publishers"] = ["ghost"]
+        with self.assertRaisesMessage(CommandError, "Record 4"):
+            self.run_import(self.ndjson(), batch_size=2)
+        self.assertEqual(Newspaper.objects.count(), 2)
+
+    def test_invalid_json(self):
+        with self.assertRaises(CommandError):
+            self.run_import('[{"title": "Broken"')
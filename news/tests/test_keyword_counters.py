@@ -0,0 +1,117 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from news.keywords import top_keywords
+from news.models import Newspaper, Topic, Keyword
+
+
+class KeywordUsageCounterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="Tech")
+        self.ai = Keyword.objects.create(name="ai")
+        self.chips = Keyword.objects.create(name="chips")
+        self.first = Newspaper.objects.create(
+            title="First", content="Content", topic=self.topic
+        )
+        self.second = Newspaper.objects.create(
+            title="Second", content="Content", topic=self.topic
+        )
+
+    def counts(self):
+        return dict(Keyword.objects.values_list("name", "usage_count"))
+
+    def test_forward_add_remove_and_clear(self):
+        self.first.keywords.add(self.ai, self.chips)
+        self.first.keywords.add(self.ai)
+        self.second.keywords.add(self.ai)
+        self.assertEqual(self.counts(), {"ai": 2, "chips": 1})
+
+        self.first.keywords.remove(self.chips, self.chips)
+        self.second.keywords.remove(self.chips)
+        self.assertEqual(self.counts(), {"ai": 2, "chips": 0})
+
+        self.first.keywords.clear()
+        self.assertEqual(self.counts(), {"ai": 1, "chips": 0})
+
+    def test_reverse_add_remove_and_clear(self):
+        self.ai.keyword_newspapers.add(self.first, self.second)
+        self.assertEqual(self.counts(), {"ai": 2, "chips": 0})
+        self.ai.keyword_newspapers.remove(self.first)
+        self.assertEqual(self.counts(), {"ai": 1, "chips": 0})
+        self.ai.keyword_newspapers.clear()
+        self.assertEqual(self.counts(), {"ai": 0, "chips": 0})
+
+    def test_deleting_newspapers_releases_keywords(self):
+        self.first.set_keywords(["ai", "chips"])
+        self.second.set_keywords(["ai"])
+        self.first.delete()
+        self.assertEqual(self.counts(), {"ai": 1, "chips": 0})
+
+        Newspaper.objects.all().delete()
+        self.assertEqual(self.counts(), {"ai": 0, "chips": 0})
+
+    def test_deleting_a_topic_releases_keywords(self):
+        self.first.set_keywords(["ai", "chips"])
+        self.second.set_keywords(["ai"])
+        other = Topic.objects.create(name="Art")
+        Newspaper.objects.create(
+            title="Third", content="Content", topic=other
+        ).set_keywords(["ai"])
+
+        self.topic.delete()
+        self.assertEqual(self.counts(), {"ai": 1, "chips": 0})
+        Topic.objects.all().delete()
+        self.assertEqual(self.counts(), {"ai": 0, "chips": 0})
+
+    def test_topic_delete_queries_do_not_grow_with_articles(self):
+        def delete_topic(name, articles, delete):
+            topic = Topic.objects.create(name=name)
+            for index in range(articles):
+                Newspaper.objects.create(
+                    title=f"{name} {index}", content="Content", topic=topic
+                ).keywords.add(self.ai, self.chips)
+            with CaptureQueriesContext(connection) as queries:
+                delete(topic)
+            return len(queries)
+
+        for delete in [
+            lambda topic: topic.delete(),
+            lambda topic: Topic.objects.filter(pk=topic.pk).delete(),
+        ]:
+            with self.subTest(delete):
+                self.assertEqual(
+                    delete_topic("Small", 2, delete),
+                    delete_topic("Large", 20, delete),
+                )
+        self.assertEqual(self.counts(), {"ai": 0, "chips": 0})
+
+    def test_reconcile_repairs_drift(self):
+        self.first.keywords.add(self.ai, self.chips)
+        Keyword.objects.update(usage_count=42)
+        call_command("reconcile_counters", batch_size=1, stdout=StringIO())
+        self.assertEqual(self.counts(), {"ai": 1, "chips": 1})
+
+    def test_tag_cloud_and_keyword_page(self):
+        self.first.keywords.add(self.ai, self.chips)
+        self.second.keywords.add(self.ai)
+        self.assertEqual(
+            [keyword["name"] for keyword in top_keywords()], ["ai", "chips"]
+        )
+        self.assertEqual(
+            [keyword["name"] for keyword in top_keywords(limit=1)], ["ai"]
+        )
+
+        response = self.client.get(reverse("index"))
+        self.assertContains(response, reverse("keyword-detail", args=[self.ai.pk]))
+
+        response = self.client.get(
+            reverse("keyword-detail", args=[self.chips.pk])
+        )
+        self.assertEqual(list(response.context["newspapers"]), [self.first])
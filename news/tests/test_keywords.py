@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from news.forms import NewspaperForm
+from news.keywords import resolve_keyword_ids
+from news.models import Redactor, Newspaper, Topic, Keyword
+
+
+class ResolveKeywordIdsTest(TestCase):
+    def setUp(self):
+        self.existing = Keyword.objects.create(name="news")
+
+    def test_creates_missing_keywords_in_bulk(self):
+        names = [f"keyword{index}" for index in range(30)] + ["news"]
+        with self.assertNumQueries(3):
+            ids = resolve_keyword_ids(names)
+        self.assertEqual(len(ids), 31)
+        self.assertEqual(ids["news"], self.existing.id)
+        self.assertEqual(Keyword.objects.count(), 31)
+
+    def test_existing_names_take_one_query(self):
+        tech = Keyword.objects.create(name="tech")
+        with self.assertNumQueries(1):
+            ids = resolve_keyword_ids([" news ", "tech", "news", ""])
+        self.assertEqual(ids, {"news": self.existing.id, "tech": tech.id})
+
+    def test_renamed_keyword_is_not_reused(self):
+        resolve_keyword_ids(["news"])
+        self.existing.name = "headlines"
+        self.existing.save()
+        ids = resolve_keyword_ids(["news"])
+        self.assertNotEqual(ids["news"], self.existing.pk)
+
+
+class NewspaperKeywordsTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Tech")
+        self.user = Redactor.objects.create_user(
+            username="testuser", password="password123"
+        )
+
+    def test_set_keywords_replaces_only_the_difference(self):
+        newspaper = Newspaper.objects.create(
+            title="Tech News", content="Content", topic=self.topic
+        )
+        newspaper.set_keywords(["ai", "chips"])
+        newspaper.set_keywords(["chips", "robots"])
+        self.assertSetEqual(
+            set(newspaper.keywords.values_list("name", flat=True)),
+            {"chips", "robots"},
+        )
+
+    def test_form_save_resolves_keywords(self):
+        form = NewspaperForm(
+            data={
+                "title": "Tech News",
+                "content": "Content",
+                "topic": self.topic.id,
+                "keywords": "ai, chips, ai",
+                "publishers": [],
+            },
+            user=self.user,
+        )
+        self.assertTrue(form.is_valid())
+        newspaper = form.save()
+        self.assertSetEqual(
+            set(newspaper.keywords.values_list("name", flat=True)),
+            {"ai", "chips"},
+        )
+        self.assertEqual(list(newspaper.publishers.all()), [self.user])
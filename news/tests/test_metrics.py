@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.core.cache.backends.dummy import DummyCache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from news.metrics import (
+    RequestMetrics,
+    _current,
+    instrumented_cache,
+    registry,
+)
+from news.models import Newspaper, Redactor, Topic
+
+
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.addCleanup(registry.reset)
+        topic = Topic.objects.create(name="Politics")
+        self.newspaper = Newspaper.objects.create(
+            title="Election", content="Polls open", topic=topic
+        )
+        self.user = Redactor.objects.create_user(
+            username="editor", password="pass12345"
+        )
+        self.client.force_login(self.user)
+
+    def test_server_timing_header(self):
+        response = self.client.get(
+            reverse("newspaper-detail", args=[self.newspaper.pk])
+        )
+        entries = {
+            entry.split(";")[0]: entry
+            for entry in response["Server-Timing"].split(", ")
+        }
+        self.assertEqual(set(entries), {"db", "tpl", "cache", "total"})
+        self.assertRegex(entries["db"], r'desc="[1-9]\d* queries"')
+        self.assertRegex(entries["tpl"], r"dur=\d+\.\d")
+
+    @override_settings(SERVER_TIMING_HEADER=False)
+    def test_server_timing_header_can_be_disabled(self):
+        response = self.client.get(reverse("index"))
+        self.assertNotIn("Server-Timing", response)
+
+    def test_records_histograms_per_view(self):
+        self.client.get(reverse("index"))
+        self.client.get(reverse("index"))
+        self.client.get("/no-such-page/")
+
+        output = registry.render()
+        self.assertIn('news_request_duration_seconds_count{view="index"} 2', output)
+        self.assertIn('news_db_queries_bucket{view="index",le="+Inf"} 2', output)
+        self.assertIn(
+            'news_request_duration_seconds_count{view="unresolved"} 1', output
+        )
+
+    def test_counts_cache_hits_and_misses(self):
+        token = _current.set(RequestMetrics(started=0.0))
+        self.addCleanup(_current.reset, token)
+        cache.set("present", 1)
+        cache.get("present")
+        cache.get("absent")
+        cache.get_many(["present", "absent", "other"])
+
+        metrics = _current.get()
+        self.assertEqual((metrics.cache_hits, metrics.cache_misses), (2, 3))
+
+    def test_wraps_the_configured_backend(self):
+        backend = instrumented_cache(
+            "",
+            {"WRAPPED_BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        )
+        self.assertIsInstance(backend, DummyCache)
+        token = _current.set(RequestMetrics(started=0.0))
+        self.addCleanup(_current.reset, token)
+        backend.get("one")
+        backend.get_many(["two", "three"])
+
+        metrics = _current.get()
+        self.assertEqual((metrics.cache_hits, metrics.cache_misses), (0, 3))
+
+    def test_metrics_view_is_staff_only(self):
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get(reverse("index"))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn("# TYPE news_request_duration_seconds histogram", body)
+        self.assertIn('news_cache_hits_total{view="index"}', body)
+        self.assertIn('news_db_connection_checkouts_total{alias="default"}', body)
@@ -1,4 +1,9 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from news.models import Redactor, Newspaper, Topic, Keyword
 
@@ -71,3 +76,165 @@ class NewspaperModelTests(TestCase):
             set(newspaper.keywords.values_list("name", flat=True)),
             {"Football", "Championship"},
         )
+
+
+class NewspaperExcerptTests(TestCase):
+
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Science")
+
+    def test_excerpt_and_word_count_follow_content(self):
+        """
+        Ensure that the stored excerpt is the first 20 words of the content.
+        """
+        words = [f"word{index}" for index in range(30)]
+        newspaper = Newspaper.objects.create(
+            title="Long read", content=" ".join(words), topic=self.topic
+        )
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.excerpt, " ".join(words[:20]) + "…")
+        self.assertEqual(newspaper.word_count, 30)
+
+        newspaper.content = "Short now"
+        newspaper.save(update_fields=["content"])
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.excerpt, "Short now")
+        self.assertEqual(newspaper.word_count, 2)
+
+    def test_backfill_command(self):
+        """
+        Ensure that the backfill command repairs stale excerpts.
+        """
+        newspaper = Newspaper.objects.create(
+            title="Old row", content="Some archived content", topic=self.topic
+        )
+        Newspaper.objects.filter(pk=newspaper.pk).update(
+            excerpt="", word_count=0
+        )
+        call_command("backfill_excerpts", stdout=StringIO())
+        newspaper.refresh_from_db()
+        self.assertEqual(newspaper.excerpt, "Some archived content")
+        self.assertEqual(newspaper.word_count, 3)
+
+
+class NewspaperRevisionTests(TestCase):
+
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Culture")
+        self.redactor = Redactor.objects.create_user(
+            username="critic", password="password123"
+        )
+        self.newspaper = Newspaper.objects.create(
+            title="Review", content="Content", topic=self.topic
+        )
+
+    def revision(self):
+        return Newspaper.objects.get(pk=self.newspaper.pk).revision
+
+    def test_save_bumps_revision(self):
+        """
+        Ensure that every save of an existing article bumps its revision.
+        """
+        self.assertEqual(self.revision(), 1)
+        self.newspaper.content = "Edited"
+        self.newspaper.save(update_fields=["content"])
+        self.assertEqual(self.newspaper.revision, 2)
+        self.newspaper.save()
+        self.assertEqual(self.revision(), 3)
+
+    def test_relation_changes_bump_revision(self):
+        """
+        Ensure that publisher, keyword and topic changes bump the revision
+        from either side of the relation.
+        """
+        self.newspaper.publishers.add(self.redactor)
+        self.assertEqual(self.revision(), 2)
+        self.newspaper.set_keywords(["film"])
+        self.assertEqual(self.revision(), 3)
+        self.redactor.redactor_newspapers.clear()
+        self.assertEqual(self.revision(), 4)
+
+        self.topic.name = "Arts"
+        self.topic.save()
+        self.assertEqual(self.revision(), 5)
+
+    def test_username_change_bumps_revision(self):
+        """
+        Ensure that renaming a publisher bumps the revision of their articles.
+        """
+        self.newspaper.publishers.add(self.redactor)
+        self.redactor.username = "reviewer"
+        self.redactor.save()
+        self.assertEqual(self.revision(), 3)
+
+
+class RedactorCascadeTests(TestCase):
+
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Crime")
+        self.redactor = Redactor.objects.create_user(
+            username="prolific", password="password123"
+        )
+        self.coauthor = Redactor.objects.create_user(
+            username="coauthor", password="password123"
+        )
+        self.shared = Newspaper.objects.create(
+            title="Shared", content="Content", topic=self.topic
+        )
+        self.shared.publishers.add(self.redactor, self.coauthor)
+
+    def add_sole_articles(self, count):
+        for index in range(count):
+            newspaper = Newspaper.objects.create(
+                title=f"Solo {index}", content="Content", topic=self.topic
+            )
+            newspaper.publishers.add(self.redactor)
+
+    def delete_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.redactor.delete()
+        return len(queries.captured_queries)
+
+    def test_delete_keeps_coauthored_newspapers(self):
+        """
+        Ensure that only newspapers without other publishers are deleted.
+        """
+        self.add_sole_articles(3)
+        self.redactor.delete()
+        self.assertEqual(list(Newspaper.objects.all()), [self.shared])
+        self.assertEqual(list(self.shared.publishers.all()), [self.coauthor])
+
+    def test_delete_query_count_does_not_grow_with_articles(self):
+        """
+        Ensure that deleting a redactor costs a fixed number of queries.
+        """
+        self.add_sole_articles(2)
+        few = self.delete_queries()
+
+        self.redactor = Redactor.objects.create_user(
+            username="prolific", password="password123"
+        )
+        self.shared.publishers.add(self.redactor)
+        self.add_sole_articles(40)
+        self.assertEqual(self.delete_queries(), few)
+        self.assertEqual(Newspaper.objects.count(), 1)
+
+    def test_queryset_delete_removes_articles_shared_by_deleted_redactors(self):
+        """
+        Ensure that a bulk delete removes articles all of whose
+        publishers are deleted together.
+        """
+        outsider = Redactor.objects.create_user(
+            username="outsider", password="password123"
+        )
+        kept = Newspaper.objects.create(
+            title="Kept", content="Content", topic=self.topic
+        )
+        kept.publishers.add(self.redactor, outsider)
+
+        Redactor.objects.filter(
+            pk__in=[self.redactor.pk, self.coauthor.pk]
+        ).delete()
+
+        self.assertEqual(list(Newspaper.objects.all()), [kept])
+        self.assertEqual(list(kept.publishers.all()), [outsider])
@@ -0,0 +1,151 @@
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from news.models import Redactor, Newspaper, Topic
+from news.pagination import (
+    CachedCountPaginator,
+    CursorPaginator,
+    InvalidCursor,
+)
+
+
+class CursorPaginatorTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Tech")
+        for index in range(7):
+            Newspaper.objects.create(
+                title=f"Article {index}", content="Content", topic=self.topic
+            )
+        self.paginator = CursorPaginator(
+            Newspaper.objects.all(), 3, ("title", "published_date", "id")
+        )
+
+    def titles(self, page):
+        return [newspaper.title for newspaper in page]
+
+    def test_walks_forward_and_back(self):
+        first = self.paginator.page()
+        self.assertEqual(
+            self.titles(first), ["Article 0", "Article 1", "Article 2"]
+        )
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+        second = self.paginator.page(first.next_cursor)
+        third = self.paginator.page(second.next_cursor)
+        self.assertEqual(self.titles(third), ["Article 6"])
+        self.assertFalse(third.has_next())
+        self.assertIsNone(third.next_cursor)
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual(self.titles(back), self.titles(second))
+        self.assertTrue(back.has_previous())
+        back = self.paginator.page(back.previous_cursor)
+        self.assertEqual(self.titles(back), self.titles(first))
+        self.assertFalse(back.has_previous())
+
+    def test_ties_are_broken_by_id(self):
+        duplicate = Newspaper.objects.create(
+            title="Article 2", content="Content", topic=self.topic
+        )
+        second = self.paginator.page(self.paginator.page().next_cursor)
+        self.assertEqual(second.object_list[0], duplicate)
+
+    def test_tampered_cursor_is_rejected(self):
+        cursor = self.paginator.page().next_cursor
+        with self.assertRaises(InvalidCursor):
+            self.paginator.page(cursor[:-2] + "xx")
+
+    def test_page_does_not_count_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.paginator.page(self.paginator.page().next_cursor)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries.captured_queries)
+        )
+
+    def test_cursor_query_seeks_the_index(self):
+        cursor = self.paginator.page().next_cursor
+        with CaptureQueriesContext(connection) as queries:
+            self.paginator.page(cursor)
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertIn('WHERE ("news_newspaper"."title" >= ', sql)
+        if connection.vendor == "sqlite":
+            with connection.cursor() as db_cursor:
+                db_cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plan = " ".join(row[-1] for row in db_cursor.fetchall())
+            self.assertIn("news_newspaper_order_idx (title>?)", plan)
+
+
+class CursorPaginatedViewsTest(TestCase):
+    def setUp(self):
+        self.user = Redactor.objects.create_user(
+            username="testuser", password="password123"
+        )
+        self.client.login(username="testuser", password="password123")
+        topic = Topic.objects.create(name="Tech")
+        for index in range(12):
+            newspaper = Newspaper.objects.create(
+                title=f"Article {index:02}", content="Content", topic=topic
+            )
+            newspaper.publishers.add(self.user)
+
+    def test_index_next_link_uses_cursor(self):
+        response = self.client.get(reverse("index"))
+        page = response.context["page_obj"]
+        self.assertEqual(len(page), 9)
+        self.assertContains(
+            response, f"?{urlencode({'cursor': page.next_cursor})}"
+        )
+
+        response = self.client.get(
+            reverse("index"), {"cursor": page.next_cursor}
+        )
+        self.assertEqual(len(response.context["page_obj"]), 3)
+
+    def test_my_articles_invalid_cursor_is_404(self):
+        response = self.client.get(reverse("my-articles"), {"cursor": "bad"})
+        self.assertEqual(response.status_code, 404)
+
+
+class CachedCountPaginatorTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="Tech")
+        for index in range(4):
+            Newspaper.objects.create(
+                title=f"Article {index}", content="Content", topic=self.topic
+            )
+
+    def test_count_is_cached_per_key(self):
+        queryset = Newspaper.objects.filter(topic=self.topic)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                CachedCountPaginator(queryset, 2, count_key="tech").count, 4
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                CachedCountPaginator(queryset, 2, count_key="tech").count, 4
+            )
+        with self.assertNumQueries(1):
+            CachedCountPaginator(queryset, 2, count_key="art").count
+
+    def test_default_key_follows_the_query(self):
+        all_newspapers = CachedCountPaginator(Newspaper.objects.all(), 2)
+        filtered = CachedCountPaginator(
+            Newspaper.objects.filter(title="Article 1"), 2
+        )
+        self.assertEqual(all_newspapers.count, 4)
+        self.assertEqual(filtered.count, 1)
+
+    def test_search_results_use_cached_count(self):
+        self.client.get(reverse("index"), {"query": "missing"})
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                reverse("index"), {"query": "  MISSING "}
+            )
+        self.assertEqual(response.context["paginator"].count, 0)
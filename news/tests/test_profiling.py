@@ -0,0 +1,156 @@
+import pstats
+import tempfile
+from io import StringIO
+
+from asgiref.sync import iscoroutinefunction
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from news.models import Redactor
+from news.profiling import (
+    PROFILE_HEADER,
+    ProfilingMiddleware,
+    _profiling,
+    profile_dir,
+    profile_token,
+)
+
+
+class ProfilingTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(PROFILE_DIR=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def log_in(self, is_staff=True):
+        self.client.force_login(
+            Redactor.objects.create_user(username="ops", is_staff=is_staff)
+        )
+
+    def profiles(self, view_name):
+        return sorted((profile_dir() / view_name).glob("*.prof"))
+
+    def view_functions(self, view_name):
+        """
+        Returns the news/views.py functions in the view's only profile.
+        """
+        [path] = self.profiles(view_name)
+        return {
+            function
+            for filename, _, function in pstats.Stats(str(path)).stats
+            if filename.endswith("news/views.py")
+        }
+
+
+class ProfilingMiddlewareTest(ProfilingTestCase):
+    def test_not_profiled_by_default(self):
+        self.client.get(reverse("index"))
+        self.assertEqual(list(profile_dir().glob("*")), [])
+
+    @override_settings(PROFILE_SAMPLE_RATE=1, PROFILE_KEEP=2)
+    def test_sampled_profiles_rotate_per_view(self):
+        for _ in range(3):
+            self.client.get(reverse("index"))
+        self.client.get(reverse("api-newspaper-list"))
+
+        self.assertEqual(len(self.profiles("index")), 2)
+        self.assertEqual(len(self.profiles("api-newspaper-list")), 1)
+
+    @override_settings(PROFILE_SAMPLE_RATE=1)
+    def test_profile_covers_the_view(self):
+        self.client.get(reverse("index"))
+        self.assertIn("get_queryset", self.view_functions("index"))
+
+    @override_settings(PROFILE_SAMPLE_RATE=1)
+    def test_overlapping_requests_are_not_profiled(self):
+        with _profiling:
+            response = self.client.get(reverse("index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(profile_dir().glob("*")), [])
+
+    def test_signed_header_profiles_staff_requests(self):
+        self.client.get(
+            reverse("index"), headers={PROFILE_HEADER: profile_token()}
+        )
+        self.assertEqual(list(profile_dir().glob("*")), [])
+
+        self.log_in()
+        self.client.get(
+            reverse("index"), headers={PROFILE_HEADER: profile_token()}
+        )
+        self.client.get(reverse("index"), headers={PROFILE_HEADER: "forged"})
+        self.assertEqual(len(self.profiles("index")), 1)
+
+    def test_signed_header_is_ignored_for_other_users(self):
+        self.log_in(is_staff=False)
+        self.client.get(
+            reverse("index"), headers={PROFILE_HEADER: profile_token()}
+        )
+        self.assertEqual(list(profile_dir().glob("*")), [])
+
+    def test_async_stack_is_not_adapted(self):
+        async def get_response(request):
+            pass
+
+        self.assertTrue(
+            iscoroutinefunction(ProfilingMiddleware(get_response))
+        )
+
+    @override_settings(PROFILE_SAMPLE_RATE=1)
+    async def test_async_views_are_profiled(self):
+        response = await self.async_client.get(reverse("async-index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("get", self.view_functions("async-index"))
+
+    @override_settings(PROFILE_SAMPLE_RATE=1)
+    async def test_sync_views_are_profiled_in_their_thread(self):
+        response = await self.async_client.get(reverse("index"))
+        self.assertContains(response, "VoicePress")
+        self.assertIn("get_queryset", self.view_functions("index"))
+
+    async def test_signed_header_profiles_async_staff_requests(self):
+        user = await Redactor.objects.acreate(
+            username="ops", is_staff=True
+        )
+        await self.async_client.aforce_login(user)
+        await self.async_client.get(
+            reverse("async-index"), headers={PROFILE_HEADER: profile_token()}
+        )
+        self.assertEqual(len(self.profiles("async-index")), 1)
+
+
+class ProfileReportCommandTest(ProfilingTestCase):
+    @override_settings(PROFILE_SAMPLE_RATE=1)
+    def test_reports_top_functions_per_view(self):
+        self.client.get(reverse("index"))
+        self.client.get(reverse("index"))
+        self.client.get(reverse("api-newspaper-list"))
+
+        stdout = StringIO()
+        call_command(
+            "profile_report",
+            view=["index"],
+            filter=r"news/views\.py",
+            stdout=stdout,
+        )
+        output = stdout.getvalue()
+        self.assertIn("index: 2 profiles", output)
+        self.assertIn("(get_queryset)", output)
+        self.assertNotIn("django/", output)
+        self.assertNotIn("api-newspaper-list", output)
+
+    def test_no_profiles(self):
+        with self.assertRaises(CommandError):
+            call_command("profile_report", stdout=StringIO())
+
+    def test_token_is_accepted_by_the_middleware(self):
+        stdout = StringIO()
+        call_command("profile_report", token=True, stdout=stdout)
+        token = stdout.getvalue().split(": ", 1)[1].strip()
+        self.log_in()
+        self.client.get(reverse("index"), headers={PROFILE_HEADER: token})
+        self.assertEqual(len(self.profiles("index")), 1)
@@ -0,0 +1,254 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from news.forms import NewspaperForm
+from news.models import Keyword, Newspaper, Redactor, Topic
+from news.topics import invalidate_topics
+
+# Maximum queries per request with a cold cache, including the session
+# and user lookups of the logged-in client. Each count must not depend
+# on the number of articles, publishers or keywords involved.
+VIEW_BUDGETS = {
+    "index": 6,
+    "index category": 7,
+    "index query": 7,
+    "detail": 7,
+    "keyword": 6,
+    "my articles": 4,
+    "profile": 3,
+    "profile edit": 4,
+    "publisher autocomplete": 3,
+    "api list": 5,
+    "api detail": 5,
+    "api export": 5,
+    "feed": 3,
+    "topic feed": 4,
+    "async index": 6,
+    "async detail": 8,
+    "create form": 4,
+    "update form": 8,
+    "delete form": 4,
+}
+# Article submissions, which also bump revisions and counters and
+# rebuild the search document of the article.
+SUBMIT_BUDGETS = {
+    "create": 24,
+    "update": 26,
+    "form create": 22,
+    "form update": 24,
+}
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    Runs each request against a small and a larger data set and checks
+    that both stay within the budget with the same number of queries.
+    """
+
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Politics")
+        self.user = Redactor.objects.create_user(
+            username="writer", password="pass12345"
+        )
+        self.keyword = Keyword.objects.create(name="vote")
+        self.client.force_login(self.user)
+        self.articles = 0
+
+    def add_articles(self, count, fan_out=2):
+        """
+        Adds articles by the user, each with ``fan_out`` publishers and
+        keywords.
+        """
+        for _ in range(count):
+            self.articles += 1
+            number = self.articles
+            newspaper = Newspaper.objects.create(
+                title=f"Article {number}",
+                content=f"Election coverage {number}",
+                topic=self.topic,
+            )
+            newspaper.publishers.add(
+                self.user,
+                *[
+                    Redactor.objects.create_user(
+                        username=f"coauthor{number}-{index}"
+                    )
+                    for index in range(fan_out - 1)
+                ],
+            )
+            newspaper.keywords.add(
+                self.keyword,
+                *[
+                    Keyword.objects.create(name=f"keyword{number}-{index}")
+                    for index in range(fan_out - 1)
+                ],
+            )
+
+    def grow(self):
+        """
+        Adds articles and gives the first one more publishers and keywords.
+        """
+        self.add_articles(10)
+        first = Newspaper.objects.order_by("id").first()
+        for index in range(3):
+            name = f"extra{self.articles}-{index}"
+            first.publishers.add(Redactor.objects.create_user(username=name))
+            first.keywords.add(Keyword.objects.create(name=name))
+
+    def capture(self, request) -> list:
+        cache.clear()
+        invalidate_topics()
+        with CaptureQueriesContext(connection) as captured:
+            response = request()
+        if hasattr(response, "status_code"):
+            self.assertLess(response.status_code, 400)
+            if response.streaming:
+                with CaptureQueriesContext(connection) as streamed:
+                    b"".join(response.streaming_content)
+                return [
+                    query["sql"]
+                    for query in captured.captured_queries
+                    + streamed.captured_queries
+                ]
+        return [query["sql"] for query in captured.captured_queries]
+
+    def assertWithinBudget(self, name, budget, queries, growth=None):
+        listing = "\n".join(
+            f"{number}. {sql}" for number, sql in enumerate(queries, 1)
+        )
+        if len(queries) > budget:
+            self.fail(
+                f"{name}: {len(queries)} queries exceed the budget of "
+                f"{budget}:\n{listing}"
+            )
+        if growth is not None and len(growth) != len(queries):
+            self.fail(
+                f"{name}: query count grows with the data "
+                f"({len(queries)} -> {len(growth)}), likely an N+1:\n"
+                + "\n".join(
+                    f"{number}. {sql}"
+                    for number, sql in enumerate(growth, 1)
+                )
+            )
+
+    def assertRowIndependent(self, name, budget, request):
+        small = self.capture(request)
+        self.grow()
+        large = self.capture(request)
+        self.assertWithinBudget(name, budget, small, growth=large)
+
+
+class ViewQueryBudgetTest(QueryBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_articles(2)
+        self.newspaper = Newspaper.objects.order_by("id").first()
+
+    def view_urls(self) -> dict:
+        pk = self.newspaper.pk
+        return {
+            "index": reverse("index"),
+            "index category": f"{reverse('index')}?category=Politics",
+            "index query": f"{reverse('index')}?query=election",
+            "detail": reverse("newspaper-detail", args=[pk]),
+            "keyword": reverse("keyword-detail", args=[self.keyword.pk]),
+            "my articles": reverse("my-articles"),
+            "profile": reverse("profile"),
+            "profile edit": reverse("user-update"),
+            "publisher autocomplete": (
+                f"{reverse('publisher-autocomplete')}?q=co"
+            ),
+            "api list": reverse("api-newspaper-list"),
+            "api detail": reverse("api-newspaper-detail", args=[pk]),
+            "api export": reverse("api-newspaper-export"),
+            "feed": reverse("feed-rss"),
+            "topic feed": reverse("topic-feed-rss", args=[self.topic.pk]),
+            "async index": reverse("async-index"),
+            "async detail": reverse("async-newspaper-detail", args=[pk]),
+            "create form": reverse("newspaper-create"),
+            "update form": reverse("newspaper-update", args=[pk]),
+            "delete form": reverse("newspaper-delete", args=[pk]),
+        }
+
+    def test_budgets_cover_every_view(self):
+        self.assertEqual(set(self.view_urls()), set(VIEW_BUDGETS))
+
+    def test_views_stay_within_budget(self):
+        for name, url in self.view_urls().items():
+            with self.subTest(name):
+                self.assertRowIndependent(
+                    name, VIEW_BUDGETS[name], lambda: self.client.get(url)
+                )
+
+
+class SubmitQueryBudgetTest(QueryBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_articles(1)
+        self.newspaper = Newspaper.objects.get()
+
+    def article_data(self, title, fan_out) -> dict:
+        coauthors = list(
+            Redactor.objects.exclude(pk=self.user.pk).values_list(
+                "pk", flat=True
+            )[:fan_out]
+        )
+        return {
+            "title": title,
+            "content": "Polls open at seven",
+            "topic": self.topic.pk,
+            "publishers": [self.user.pk, *coauthors],
+            "keywords": ", ".join(
+                f"topic{index}" for index in range(fan_out + 1)
+            ),
+        }
+
+    def assertSubmitBudget(self, name, submit):
+        """
+        ``submit(data)`` is measured with one and with five co-authors
+        and keywords.
+        """
+        for index in range(5):
+            Redactor.objects.create_user(username=f"colleague{index}")
+        small_data = self.article_data("First title", 1)
+        large_data = self.article_data("Second title", 5)
+        small = self.capture(lambda: submit(small_data))
+        large = self.capture(lambda: submit(large_data))
+        self.assertWithinBudget(name, SUBMIT_BUDGETS[name], small, large)
+
+    def test_create_view(self):
+        self.assertSubmitBudget(
+            "create",
+            lambda data: self.client.post(reverse("newspaper-create"), data),
+        )
+
+    def test_update_view(self):
+        self.assertSubmitBudget(
+            "update",
+            lambda data: self.client.post(
+                reverse("newspaper-update", args=[self.newspaper.pk]), data
+            ),
+        )
+
+    def test_form_create(self):
+        def submit(data):
+            form = NewspaperForm(data=data, user=self.user)
+            self.assertTrue(form.is_valid(), form.errors)
+            form.save()
+
+        self.assertSubmitBudget("form create", submit)
+
+    def test_form_update(self):
+        def submit(data):
+            form = NewspaperForm(
+                data=data,
+                instance=Newspaper.objects.get(pk=self.newspaper.pk),
+                user=self.user,
+            )
+            self.assertTrue(form.is_valid(), form.errors)
+            form.save()
+
+        self.assertSubmitBudget("form update", submit)
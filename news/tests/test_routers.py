@@ -0,0 +1,99 @@
+from django.contrib.auth.models import Group
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.views import View
+
+from news.middleware import ReplicaRoutingMiddleware
+from news.models import Newspaper, Redactor
+from news.routers import PIN_COOKIE, PrimaryReplicaRouter, end_request
+
+
+class ReplicaView(View):
+    replica_reads = True
+
+
+class PrimaryView(View):
+    pass
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class PrimaryReplicaRoutingTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = PrimaryReplicaRouter()
+        self.middleware = ReplicaRoutingMiddleware(
+            lambda request: HttpResponse()
+        )
+        self.addCleanup(end_request)
+
+    def start(self, request, view=ReplicaView):
+        self.middleware.process_request(request)
+        self.middleware.process_view(request, view.as_view(), (), {})
+
+    def test_opted_in_get_reads_from_replica(self):
+        request = self.factory.get("/")
+        self.start(request)
+        self.assertEqual(self.router.db_for_read(Newspaper), "replica")
+        response = self.middleware.process_response(request, HttpResponse())
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_other_views_read_from_primary(self):
+        self.start(self.factory.get("/"), view=PrimaryView)
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+
+    def test_unsafe_method_reads_from_primary_and_pins(self):
+        request = self.factory.post("/")
+        self.start(request)
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+        response = self.middleware.process_response(request, HttpResponse())
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_write_switches_later_reads_to_primary_and_pins(self):
+        request = self.factory.get("/")
+        self.start(request)
+        self.assertEqual(self.router.db_for_write(Newspaper), "default")
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+        response = self.middleware.process_response(request, HttpResponse())
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_session_write_does_not_pin(self):
+        request = self.factory.get("/")
+        self.start(request)
+        self.router.db_for_write(Session)
+        self.assertEqual(self.router.db_for_read(Newspaper), "replica")
+
+    def test_pinned_session_reads_from_primary(self):
+        request = self.factory.get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        self.start(request)
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+
+    def test_sessions_and_auth_read_from_primary(self):
+        self.start(self.factory.get("/"))
+        self.assertEqual(self.router.db_for_read(Session), "default")
+        self.assertEqual(self.router.db_for_read(Group), "default")
+        self.assertEqual(self.router.db_for_read(Redactor), "default")
+
+    @override_settings(DATABASE_REPLICAS=[f"replica{i}" for i in range(8)])
+    def test_a_request_reads_from_one_replica(self):
+        self.start(self.factory.get("/"))
+        aliases = {self.router.db_for_read(Newspaper) for _ in range(20)}
+        self.assertEqual(len(aliases), 1)
+
+    def test_outside_a_request_everything_uses_primary(self):
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_configured(self):
+        request = self.factory.get("/")
+        self.start(request)
+        self.assertEqual(self.router.db_for_read(Newspaper), "default")
+        response = self.middleware.process_response(
+            request, HttpResponse()
+        )
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_replicas_are_never_migrated(self):
+        self.assertIs(self.router.allow_migrate("replica", "news"), False)
+        self.assertIsNone(self.router.allow_migrate("default", "news"))
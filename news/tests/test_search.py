@@ -0,0 +1,141 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from news.models import Redactor, Newspaper, Topic, Keyword
+from news.search import (
+    FTS_TABLE,
+    fts5_match_expression,
+    search_newspapers,
+    tsquery_prefix_expression,
+    update_search_index,
+)
+
+
+class SearchNewspapersTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="Tech")
+        self.author = Redactor.objects.create_user(
+            username="writer",
+            first_name="Ada",
+            last_name="Lovelace",
+            password="password123",
+        )
+        self.first = Newspaper.objects.create(
+            title="Quantum computing",
+            content="Qubits are getting cheaper.",
+            topic=self.topic,
+        )
+        self.first.publishers.add(self.author)
+        self.first.keywords.add(Keyword.objects.create(name="physics"))
+        self.second = Newspaper.objects.create(
+            title="Gardening weekly",
+            content="Why quantum effects do not matter to tomatoes.",
+            topic=self.topic,
+        )
+        update_search_index([self.first.pk, self.second.pk])
+
+    def search(self, query):
+        return list(search_newspapers(Newspaper.objects.all(), query))
+
+    def test_matches_title_authors_keywords_and_content(self):
+        self.assertEqual(self.search("Lovelace"), [self.first])
+        self.assertEqual(self.search("physics"), [self.first])
+        self.assertEqual(self.search("tomatoes"), [self.second])
+        self.assertEqual(self.search("garden"), [self.second])
+
+    def test_title_matches_rank_first(self):
+        self.assertEqual(self.search("quantum"), [self.first, self.second])
+
+    def test_unmatched_and_empty_queries(self):
+        self.assertEqual(self.search("astronomy"), [])
+        self.assertEqual(self.search('"*'), [])
+
+    def fts_rowids(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid FROM {FTS_TABLE}")
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_deleted_newspaper_leaves_index(self):
+        self.second.delete()
+        self.assertEqual(self.search("tomatoes"), [])
+
+    @skipUnless(connection.vendor == "sqlite", "FTS5 table is SQLite only")
+    def test_delete_view_removes_fts_row(self):
+        self.assertIn(self.first.pk, self.fts_rowids())
+        self.client.force_login(self.author)
+        response = self.client.post(
+            reverse("newspaper-delete", args=[self.first.pk])
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Newspaper.objects.filter(pk=self.first.pk).exists())
+        self.assertNotIn(self.first.pk, self.fts_rowids())
+
+    def test_deleted_coauthor_is_removed_from_document(self):
+        coauthor = Redactor.objects.create_user(
+            username="coauthor", last_name="Babbage", password="password123"
+        )
+        self.first.publishers.add(coauthor)
+        update_search_index([self.first.pk])
+        self.assertEqual(self.search("Babbage"), [self.first])
+
+        coauthor.delete()
+        self.assertEqual(self.search("Babbage"), [])
+        self.assertEqual(self.search("Lovelace"), [self.first])
+
+    def test_signals_keep_documents_current(self):
+        coauthor = Redactor.objects.create_user(
+            username="coauthor", last_name="Babbage", password="password123"
+        )
+        self.first.publishers.add(coauthor)
+        self.assertEqual(self.search("Babbage"), [self.first])
+
+        self.author.username = "countess"
+        self.author.save()
+        self.assertEqual(self.search("countess"), [self.first])
+        self.assertEqual(self.search("writer"), [])
+
+        keyword = Keyword.objects.get(name="physics")
+        keyword.name = "mechanics"
+        keyword.save()
+        self.assertEqual(self.search("mechanics"), [self.first])
+        self.assertEqual(self.search("physics"), [])
+
+        keyword.delete()
+        self.assertEqual(self.search("mechanics"), [])
+
+    def test_profile_edit_reindexes_articles(self):
+        self.client.force_login(self.author)
+        self.client.post(
+            reverse("user-update"),
+            {
+                "first_name": "Augusta",
+                "last_name": "King",
+                "email": "ada@example.com",
+            },
+        )
+        self.assertEqual(self.search("Augusta"), [self.first])
+        self.assertEqual(self.search("Lovelace"), [])
+
+    def test_fts5_match_expression_quotes_terms(self):
+        self.assertEqual(
+            fts5_match_expression('tech "news'), '"tech"* "news"*'
+        )
+
+    def test_tsquery_prefix_expression_quotes_terms(self):
+        self.assertEqual(
+            tsquery_prefix_expression("econ & 'news!"),
+            "'econ':* & 'news':*",
+        )
+        self.assertEqual(tsquery_prefix_expression("&|!"), "")
+
+    def test_partial_words_match(self):
+        self.assertEqual(self.search("Lovel"), [self.first])
+        self.assertEqual(self.search("quan tomat"), [self.second])
+
+    def test_index_view_uses_search(self):
+        response = self.client.get(reverse("index"), {"query": "tomatoes"})
+        self.assertContains(response, self.second.title)
+        self.assertNotContains(response, self.first.title)
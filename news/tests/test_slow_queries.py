@@ -0,0 +1,88 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from news.models import Newspaper, Redactor, Topic
+from news.slow_queries import clear_slow_queries, params_shape, slow_queries
+
+
+class ParamsShapeTest(SimpleTestCase):
+    def test_describes_types_not_values(self):
+        self.assertEqual(params_shape([1, 2, 3, "a"], False), "(int*3, str)")
+        self.assertEqual(
+            params_shape({"id": 1, "name": "x"}, False), "{id: int, name: str}"
+        )
+        self.assertEqual(
+            params_shape([(1, "a"), (2, "b")], True), "2 rows x (int, str)"
+        )
+        self.assertIsNone(params_shape(None, False))
+
+
+@override_settings(SLOW_QUERY_MS=0.0001)
+class SlowQueryLogTest(TestCase):
+    def setUp(self):
+        clear_slow_queries()
+        self.addCleanup(clear_slow_queries)
+        topic = Topic.objects.create(name="Politics")
+        self.user = Redactor.objects.create_user(
+            username="editor", password="pass12345"
+        )
+        newspaper = Newspaper.objects.create(
+            title="Election", content="Polls open", topic=topic
+        )
+        newspaper.publishers.add(self.user)
+        self.client.force_login(self.user)
+        clear_slow_queries()
+
+    def test_records_view_path_and_call_site(self):
+        with self.assertLogs("news.slow_queries", "WARNING") as logs:
+            self.client.get(f"{reverse('index')}?query=election")
+
+        entries = [
+            entry for entry in slow_queries() if entry["view"] == "index"
+        ]
+        self.assertTrue(entries)
+        self.assertEqual(entries[0]["path"], reverse("index"))
+        self.assertTrue(
+            any(
+                (entry["call_site"] or "").startswith("news/")
+                for entry in entries
+            )
+        )
+        self.assertIn('"view": "index"', logs.output[-1])
+
+    def test_attributes_signal_queries_to_the_receiver(self):
+        with self.assertLogs("news.slow_queries", "WARNING"):
+            self.user.delete()
+        call_sites = {entry["call_site"] or "" for entry in slow_queries()}
+        self.assertTrue(
+            any(
+                site.endswith("in delete_orphaned_newspapers")
+                for site in call_sites
+            ),
+            call_sites,
+        )
+        self.assertIsNone(slow_queries()[0]["view"])
+
+    @override_settings(SLOW_QUERY_BUFFER=2)
+    def test_buffer_is_bounded(self):
+        with self.assertLogs("news.slow_queries", "WARNING"):
+            for _ in range(5):
+                Topic.objects.count()
+        self.assertEqual(len(slow_queries()), 2)
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_zero_threshold_turns_the_log_off(self):
+        Topic.objects.count()
+        self.assertEqual(slow_queries(), [])
+
+    def test_page_is_staff_only(self):
+        url = reverse("slow-queries")
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.user.is_staff = True
+        self.user.save()
+        Topic.objects.filter(name__icontains="pol").count()
+        with self.assertLogs("news.slow_queries", "WARNING"):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "LIKE")
@@ -0,0 +1,140 @@
+import datetime
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from news.models import Newspaper, Topic, Keyword, Redactor, FixtureObject
+from news.search import search_newspapers
+
+
+class SyncFixturesCommandTest(TestCase):
+    def setUp(self):
+        self.objects = [
+            {"model": "news.topic", "pk": 1, "fields": {"name": "Politics"}},
+            {"model": "news.keyword", "pk": 1, "fields": {"name": "vote"}},
+            {
+                "model": "news.redactor",
+                "pk": 1,
+                "fields": {
+                    "password": "!",
+                    "username": "writer",
+                    "first_name": "Ada",
+                    "last_name": "",
+                    "email": "writer@example.com",
+                    "is_superuser": False,
+                    "is_staff": False,
+                    "is_active": True,
+                    "date_joined": "2024-09-23T17:49:50.657Z",
+                    "groups": [],
+                    "user_permissions": [],
+                },
+            },
+            {
+                "model": "news.newspaper",
+                "pk": 7,
+                "fields": {
+                    "title": "Election day",
+                    "content": "Polls open at seven",
+                    "published_date": "2024-09-23",
+                    "topic": 1,
+                    "publishers": [1],
+                    "keywords": [1],
+                },
+            },
+        ]
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def sync(self):
+        with open(self.path, "w", encoding="utf-8") as fixture:
+            json.dump(self.objects, fixture)
+        stdout = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command("sync_fixtures", self.path, stdout=stdout)
+        writes = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        return stdout.getvalue(), writes
+
+    def test_first_sync_loads_objects_and_derived_data(self):
+        output, _ = self.sync()
+        self.assertIn("wrote 4 of 4 objects", output)
+
+        newspaper = Newspaper.objects.get(pk=7)
+        self.assertEqual(newspaper.published_date, datetime.date(2024, 9, 23))
+        self.assertEqual(newspaper.excerpt, "Polls open at seven")
+        self.assertEqual(list(newspaper.publishers.all()), [
+            Redactor.objects.get(username="writer")
+        ])
+        self.assertEqual(Topic.objects.get(pk=1).newspaper_count, 1)
+        self.assertEqual(Keyword.objects.get(pk=1).usage_count, 1)
+        self.assertEqual(
+            search_newspapers(Newspaper.objects.all(), "Ada").count(), 1
+        )
+        self.assertEqual(FixtureObject.objects.count(), 4)
+
+    def test_unchanged_file_writes_nothing(self):
+        self.sync()
+        output, writes = self.sync()
+        self.assertIn("unchanged, skipped", output)
+        self.assertEqual(writes, [])
+
+    def test_only_changed_objects_are_written(self):
+        self.sync()
+        revision = Newspaper.objects.get(pk=7).revision
+        Redactor.objects.filter(pk=1).update(first_name="Changed locally")
+        self.objects[3]["fields"]["content"] = "Polls close at nine"
+        output, _ = self.sync()
+        self.assertIn("wrote 1 of 4 objects", output)
+
+        self.assertEqual(
+            Newspaper.objects.get(pk=7).content, "Polls close at nine"
+        )
+        self.assertEqual(
+            Redactor.objects.get(pk=1).first_name, "Changed locally"
+        )
+        self.assertEqual(Newspaper.objects.get(pk=7).revision, revision + 1)
+
+    def test_only_affected_counters_are_recounted(self):
+        self.sync()
+        Topic.objects.create(pk=3, name="Unrelated", newspaper_count=5)
+        self.objects[3]["fields"]["content"] = "Polls close at nine"
+        self.sync()
+        self.assertEqual(Topic.objects.get(pk=3).newspaper_count, 5)
+
+        self.objects.insert(
+            1, {"model": "news.topic", "pk": 2, "fields": {"name": "Local"}}
+        )
+        self.objects[-1]["fields"]["topic"] = 2
+        self.sync()
+        self.assertEqual(
+            dict(Topic.objects.values_list("pk", "newspaper_count")),
+            {1: 0, 2: 1, 3: 5},
+        )
+
+    def test_relations_follow_the_fixture(self):
+        self.sync()
+        self.objects.insert(
+            2, {"model": "news.keyword", "pk": 2, "fields": {"name": "poll"}}
+        )
+        self.objects[-1]["fields"]["keywords"] = [2]
+        self.sync()
+        self.assertEqual(
+            list(Newspaper.objects.get(pk=7).keywords.all()),
+            [Keyword.objects.get(name="poll")],
+        )
+        self.assertEqual(Keyword.objects.get(name="vote").usage_count, 0)
+
+    def test_project_fixture(self):
+        stdout = StringIO()
+        call_command("sync_fixtures", "data.json", stdout=stdout)
+        self.assertEqual(Newspaper.objects.count(), 6)
+        self.assertFalse(Newspaper.objects.filter(excerpt="").exists())
@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from news.models import Newspaper, Topic
+from news.topics import topic_ids
+
+
+class TopicNavigationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        topic_ids.invalidate()
+        self.art = Topic.objects.create(name="Art")
+        self.crime = Topic.objects.create(name="Crime")
+        self.newspaper = Newspaper.objects.create(
+            title="Gallery opening", content="Content", topic=self.art
+        )
+        Newspaper.objects.create(
+            title="Heist", content="Content", topic=self.crime
+        )
+
+    def counts(self):
+        return dict(Topic.objects.values_list("name", "newspaper_count"))
+
+    def test_counts_follow_create_delete_and_topic_change(self):
+        self.assertEqual(self.counts(), {"Art": 1, "Crime": 1})
+
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        newspaper.topic = self.crime
+        newspaper.save()
+        self.assertEqual(self.counts(), {"Art": 0, "Crime": 2})
+
+        newspaper.delete()
+        self.assertEqual(self.counts(), {"Art": 0, "Crime": 1})
+
+    def test_queryset_delete_counts_once_per_topic(self):
+        Newspaper.objects.create(
+            title="Forgery", content="Content", topic=self.crime
+        )
+        Newspaper.objects.all().delete()
+        self.assertEqual(self.counts(), {"Art": 0, "Crime": 0})
+
+    def test_sidebar_is_built_from_topics(self):
+        Topic.objects.create(name="Weather")
+        response = self.client.get(reverse("index"))
+        self.assertContains(response, "?category=Weather")
+        self.assertEqual(
+            [
+                (topic["name"], topic["newspaper_count"])
+                for topic in response.context["topic_navigation"]
+            ],
+            [("Art", 1), ("Crime", 1), ("Weather", 0)],
+        )
+
+    def test_sidebar_is_served_from_cache(self):
+        self.client.get(reverse("index"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("login"))
+
+    def test_category_filters_on_topic_id(self):
+        response = self.client.get(reverse("index"), {"category": "art"})
+        self.assertEqual(
+            list(response.context["newspapers"]), [self.newspaper]
+        )
+        response = self.client.get(reverse("index"), {"category": "Nope"})
+        self.assertEqual(list(response.context["newspapers"]), [])
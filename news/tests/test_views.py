@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from news.models import Redactor, Newspaper, Topic, Keyword
 from news.forms import SearchForm
@@ -131,3 +133,196 @@ class UserArticlesListViewTest(TestCase):
             title="Other's News", content="Content"
         )
         self.newspaper2.publishers.add(self.other_user)
+
+
+class NewspaperInPlaceUpdateTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="password123"
+        )
+        self.client.login(username="testuser", password="password123")
+        self.topic = Topic.objects.create(name="Politics")
+        self.newspaper = Newspaper.objects.create(
+            title="Old Title", content="Old content", topic=self.topic
+        )
+        self.newspaper.publishers.add(self.user)
+        self.newspaper.set_keywords(["news", "vote"])
+        self.url = reverse("newspaper-update", kwargs={"pk": self.newspaper.pk})
+        self.data = {
+            "title": "Old Title",
+            "content": "Old content",
+            "topic": self.topic.id,
+            "keywords": "news, vote",
+            "publishers": [self.user.id],
+        }
+
+    def test_update_keeps_primary_key(self):
+        self.data.update(content="New content", keywords="news, election")
+        response = self.client.post(self.url, self.data)
+        self.assertRedirects(response, reverse("index"))
+
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        self.assertEqual(newspaper.content, "New content")
+        self.assertSetEqual(
+            set(newspaper.keywords.values_list("name", flat=True)),
+            {"news", "election"},
+        )
+        self.assertEqual(list(newspaper.publishers.all()), [self.user])
+
+    def test_unchanged_submit_writes_nothing(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.data)
+        self.assertRedirects(response, reverse("index"))
+        writes = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+            and "django_session" not in query["sql"]
+        ]
+        self.assertEqual(writes, [])
+
+
+class NewspaperDetailConditionalTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="password123"
+        )
+        self.client.login(username="testuser", password="password123")
+        self.topic = Topic.objects.create(name="Politics")
+        self.newspaper = Newspaper.objects.create(
+            title="Title", content="Content", topic=self.topic
+        )
+        self.newspaper.publishers.add(self.user)
+        self.url = reverse("newspaper-detail", kwargs={"pk": self.newspaper.pk})
+
+    def test_unchanged_article_is_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(
+            any(
+                "news_newspaper_publishers" in query["sql"]
+                or "news_keyword" in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
+
+    def test_keyword_change_invalidates_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.newspaper.set_keywords(["vote"])
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "vote")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_topic_counts_change_invalidates_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        Newspaper.objects.create(
+            title="Other", content="Content", topic=self.topic
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_differs_per_user(self):
+        etag = self.client.get(self.url)["ETag"]
+        User.objects.create_user(username="reader", password="password123")
+        self.client.login(username="reader", password="password123")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Edit</a>")
+
+
+class AsyncReadViewsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="password123"
+        )
+        self.topic = Topic.objects.create(name="Politics")
+        self.newspapers = [
+            Newspaper.objects.create(
+                title=f"Title {index}", content="Content", topic=self.topic
+            )
+            for index in range(12)
+        ]
+        self.newspapers[0].publishers.add(self.user)
+
+    async def test_async_index_paginates_by_cursor(self):
+        response = await self.async_client.get(reverse("async-index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Title 0")
+        self.assertNotContains(response, "Title 9")
+        self.assertTrue(response.context["page_obj"].is_cursor_page)
+
+        response = await self.async_client.get(
+            reverse("async-index"),
+            {"cursor": response.context["page_obj"].next_cursor},
+        )
+        self.assertContains(response, "Title 9")
+
+    async def test_async_index_filters_by_category(self):
+        response = await self.async_client.get(
+            reverse("async-index"), {"category": "Sports"}
+        )
+        self.assertContains(response, "No articles available")
+
+    async def test_async_detail_requires_login(self):
+        url = reverse("async-newspaper-detail", args=[self.newspapers[0].pk])
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 302)
+
+    async def test_async_detail_answers_conditional_requests(self):
+        await self.async_client.aforce_login(self.user)
+        url = reverse("async-newspaper-detail", args=[self.newspapers[0].pk])
+        response = await self.async_client.get(url)
+        self.assertContains(response, "Edit</a>")
+        response = await self.async_client.get(
+            url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_async_detail_etag_follows_topic_counts(self):
+        await self.async_client.aforce_login(self.user)
+        url = reverse("async-newspaper-detail", args=[self.newspapers[0].pk])
+        etag = (await self.async_client.get(url))["ETag"]
+        await Newspaper.objects.acreate(
+            title="Other", content="Content", topic=self.topic
+        )
+        response = await self.async_client.get(
+            url, headers={"if-none-match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class PublisherAutocompleteViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="password123"
+        )
+        User.objects.create_user(
+            username="jdoe", first_name="John", last_name="Doe"
+        )
+        User.objects.create_user(username="amartin", last_name="Jordan")
+        User.objects.create_user(username="zed")
+        self.url = reverse("publisher-autocomplete")
+
+    def test_requires_login(self):
+        response = self.client.get(self.url, {"q": "j"})
+        self.assertEqual(response.status_code, 403)
+
+    def test_prefix_matches_username_and_names(self):
+        self.client.login(username="testuser", password="password123")
+        response = self.client.get(self.url, {"q": "J"})
+        self.assertEqual(
+            [result["text"] for result in response.json()["results"]],
+            ["amartin (Jordan)", "jdoe (John Doe)"],
+        )
+        response = self.client.get(self.url, {"q": "oe"})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_form_renders_only_selected_publishers(self):
+        self.client.login(username="testuser", password="password123")
+        response = self.client.get(reverse("newspaper-create"))
+        self.assertContains(response, "data-autocomplete-url")
+        self.assertNotContains(response, "jdoe")
+        self.assertNotContains(response, "zed")
@@ -0,0 +1,125 @@
+"""
+Topic lookups for the sidebar navigation and category filtering.
+"""
+
+import time
+from threading import Lock
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+NAVIGATION_CACHE_KEY = "news:topic-navigation"
+
+
+class TopicIdMap:
+    """
+    Case-insensitive topic name -> id map, reloaded after a TTL.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._ids = {}
+        self._loaded_at = None
+        self._lock = Lock()
+
+    def get(self, name: str) -> Optional[int]:
+        with self._lock:
+            if self._expired():
+                self._load()
+            return self._ids.get(name.casefold())
+
+    async def aget(self, name: str) -> Optional[int]:
+        """
+        Async variant of get().
+        """
+        if self._expired():
+            return await sync_to_async(self.get)(name)
+        return self._ids.get(name.casefold())
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _expired(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.ttl
+        )
+
+    def _load(self) -> None:
+        from news.models import Topic
+
+        self._ids = {
+            name.casefold(): topic_id
+            for name, topic_id in Topic.objects.values_list("name", "id")
+        }
+        self._loaded_at = time.monotonic()
+
+
+topic_ids = TopicIdMap(getattr(settings, "TOPIC_MAP_TTL", 60))
+
+
+def topic_navigation() -> list:
+    """
+    Returns the topics with their article counts, served from the cache.
+    """
+    from news.models import Topic
+
+    topics = cache.get(NAVIGATION_CACHE_KEY)
+    if topics is None:
+        topics = list(Topic.objects.values("id", "name", "newspaper_count"))
+        cache.set(
+            NAVIGATION_CACHE_KEY,
+            topics,
+            getattr(settings, "TOPIC_NAVIGATION_CACHE_TIMEOUT", 60 * 10),
+        )
+    return topics
+
+
+def adjust_topic_counts(deltas: dict, using: str) -> None:
+    """
+    Applies {topic_id: delta} changes to the stored article counts.
+    """
+    from news.models import Topic
+
+    changed = False
+    for topic_id, delta in deltas.items():
+        if topic_id is None or not delta:
+            continue
+        Topic.objects.using(using).filter(pk=topic_id).update(
+            newspaper_count=Greatest(F("newspaper_count") + delta, 0)
+        )
+        changed = True
+    if changed:
+        cache.delete(NAVIGATION_CACHE_KEY)
+
+
+def recount_topics(topics) -> int:
+    """
+    Recounts the given topics, writing only the counts that drifted.
+    """
+    from news.models import Newspaper
+
+    newspaper_count = Coalesce(
+        Subquery(
+            Newspaper.objects.using(topics.db)
+            .filter(topic_id=OuterRef("pk"))
+            .order_by()
+            .values("topic_id")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+    return topics.exclude(newspaper_count=newspaper_count).update(
+        newspaper_count=newspaper_count
+    )
+
+
+def invalidate_topics() -> None:
+    topic_ids.invalidate()
+    cache.delete(NAVIGATION_CACHE_KEY)
@@ -1,6 +1,24 @@
 from django.urls import path, include
 from django.contrib.auth.views import LogoutView
 
+from news.connections import connection_stats_view
+from news.metrics import metrics_view
+from news.slow_queries import slow_queries_view
+from news.feeds import (
+    LatestNewspapersAtomFeed,
+    LatestNewspapersFeed,
+    TopicNewspapersAtomFeed,
+    TopicNewspapersFeed,
+)
+from news.api import (
+    AsyncNewspaperApiDetailView,
+    AsyncNewspaperApiListView,
+    AsyncNewspaperExportView,
+    NewspaperApiDetailView,
+    NewspaperApiListView,
+    NewspaperExportView,
+)
+
 from news.views import (
     RegisterView,
     NewspaperCreateView,
@@ -13,6 +31,10 @@ from news.views import (
     UserUpdateView,
     UserDeleteView,
     UserArticlesListView,
+    PublisherAutocompleteView,
+    KeywordNewspaperListView,
+    AsyncNewspaperListView,
+    AsyncNewspaperDetailView,
 )
 
 urlpatterns = [
@@ -45,6 +67,71 @@ urlpatterns = [
         NewspaperDeleteView.as_view(),
         name="newspaper-delete",
     ),
+    path(
+        "keywords/<int:pk>/",
+        KeywordNewspaperListView.as_view(),
+        name="keyword-detail",
+    ),
+    path(
+        "publishers/autocomplete/",
+        PublisherAutocompleteView.as_view(),
+        name="publisher-autocomplete",
+    ),
+    path(
+        "api/newspapers/",
+        NewspaperApiListView.as_view(),
+        name="api-newspaper-list",
+    ),
+    path(
+        "api/newspapers/<int:pk>/",
+        NewspaperApiDetailView.as_view(),
+        name="api-newspaper-detail",
+    ),
+    path(
+        "api/newspapers/export/",
+        NewspaperExportView.as_view(),
+        name="api-newspaper-export",
+    ),
+    path("feeds/rss/", LatestNewspapersFeed(), name="feed-rss"),
+    path("feeds/atom/", LatestNewspapersAtomFeed(), name="feed-atom"),
+    path(
+        "feeds/topics/<int:pk>/rss/",
+        TopicNewspapersFeed(),
+        name="topic-feed-rss",
+    ),
+    path(
+        "feeds/topics/<int:pk>/atom/",
+        TopicNewspapersAtomFeed(),
+        name="topic-feed-atom",
+    ),
+    path("async/", AsyncNewspaperListView.as_view(), name="async-index"),
+    path(
+        "async/newspaper/<int:pk>/",
+        AsyncNewspaperDetailView.as_view(),
+        name="async-newspaper-detail",
+    ),
+    path(
+        "async/api/newspapers/",
+        AsyncNewspaperApiListView.as_view(),
+        name="async-api-newspaper-list",
+    ),
+    path(
+        "async/api/newspapers/<int:pk>/",
+        AsyncNewspaperApiDetailView.as_view(),
+        name="async-api-newspaper-detail",
+    ),
+    path(
+        "async/api/newspapers/export/",
+        AsyncNewspaperExportView.as_view(),
+        name="async-api-newspaper-export",
+    ),
+    path(
+        "ops/db-connections/",
+        connection_stats_view,
+        name="db-connection-stats",
+    ),
+    path("ops/metrics/", metrics_view, name="metrics"),
+    path("ops/slow-queries/", slow_queries_view, name="slow-queries"),
     path("profile/", ProfileView.as_view(), name="profile"),
     path("profile/edit/", UserUpdateView.as_view(), name="user-update"),
     path("profile/delete/", UserDeleteView.as_view(), name="user-delete"),
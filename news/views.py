@@ -1,7 +1,14 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.core.paginator import InvalidPage
 from django.db.models import Q
-from django.shortcuts import redirect, get_object_or_404
+from django.http import Http404, JsonResponse
+from django.shortcuts import redirect, get_object_or_404, render
 from django.contrib.auth import login, logout
 from django.contrib import messages
+from django.views import View
 from django.views.generic import TemplateView
 from django.views.generic import (
     CreateView,
@@ -11,19 +18,37 @@ from django.views.generic import (
     DetailView,
 )
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
 from django.contrib.auth.mixins import LoginRequiredMixin
 
 from news.forms import (
     RedactorCreationForm,
+    NewspaperFilterForm,
     NewspaperForm,
     RedactorUpdateForm,
     SearchForm,
+    publisher_label,
 )
+from news.keywords import top_keywords
 from news.models import (
     Redactor,
     Newspaper,
     Keyword,
 )
+from news.fragments import render_newspaper_cards
+from news.topics import topic_navigation
+from news.pagination import (
+    CachedCountPaginator,
+    CursorPaginationMixin,
+    CursorPaginator,
+    InvalidCursor,
+)
+
+AUTOCOMPLETE_LIMIT = 20
+LIST_DEFERRED_FIELDS = ("content", "search_document", "search_vector")
 
 
 class RegisterView(CreateView):
@@ -59,20 +84,7 @@ class NewspaperCreateView(LoginRequiredMixin, CreateView):
         return kwargs
 
     def form_valid(self, form):
-        newspaper = form.save(commit=False)
-        newspaper.save()
-
-        keywords = form.cleaned_data.get("keywords", [])
-        if keywords:
-            keyword_objs = [
-                Keyword.objects.get_or_create(
-                    name=keyword
-                )[0] for keyword in keywords
-            ]
-            newspaper.keywords.add(*keyword_objs)
-
-        publishers = form.cleaned_data.get("publishers")
-        newspaper.publishers.set(publishers)
+        form.save()
 
         messages.success(self.request, "Article successfully created!")
         return redirect(self.success_url)
@@ -94,23 +106,8 @@ class NewspaperUpdateView(LoginRequiredMixin, UpdateView):
         return kwargs
 
     def form_valid(self, form):
-        newspaper = form.save(commit=False)
-        new_newspaper = Newspaper.objects.create(
-            title=newspaper.title,
-            content=newspaper.content,
-            topic=newspaper.topic,
-            published_date=newspaper.published_date,
-        )
-
-        keywords = form.cleaned_data.get("keywords", [])
-        for keyword in keywords:
-            keyword_obj, created = Keyword.objects.get_or_create(name=keyword)
-            new_newspaper.keywords.add(keyword_obj)
-
-        publishers = form.cleaned_data.get("publishers")
-        new_newspaper.publishers.set(publishers)
-
-        self.object.delete()
+        if form.has_changed():
+            form.save()
 
         messages.success(self.request, "Статья успешно обновлена!")
         return redirect(self.success_url)
@@ -119,6 +116,33 @@ class NewspaperUpdateView(LoginRequiredMixin, UpdateView):
         return self.render_to_response({"form": form})
 
 
+class PublisherAutocompleteView(LoginRequiredMixin, View):
+    raise_exception = True
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get("q", "").strip()
+        if not term:
+            return JsonResponse({"results": []})
+
+        redactors = (
+            Redactor.objects.filter(
+                Q(username__istartswith=term)
+                | Q(first_name__istartswith=term)
+                | Q(last_name__istartswith=term)
+            )
+            .only("id", "username", "first_name", "last_name")
+            .order_by("username")[:AUTOCOMPLETE_LIMIT]
+        )
+        return JsonResponse(
+            {
+                "results": [
+                    {"id": redactor.pk, "text": publisher_label(redactor)}
+                    for redactor in redactors
+                ]
+            }
+        )
+
+
 class NewspaperDeleteView(LoginRequiredMixin, DeleteView):
     model = Newspaper
     template_name = "forms/delete_forms/newspaper_confirm_delete.html"
@@ -129,53 +153,212 @@ class NewspaperDeleteView(LoginRequiredMixin, DeleteView):
         return queryset.filter(publishers=self.request.user)
 
 
-class NewspaperListView(ListView):
+class NewspaperListView(CursorPaginationMixin, ListView):
     model = Newspaper
     template_name = "pages/index.html"
     context_object_name = "newspapers"
     paginate_by = 9
+    replica_reads = True
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        queryset = queryset.select_related("topic")
-        queryset = queryset.prefetch_related("publishers", "keywords")
-        category = self.request.GET.get("category")
-        query = self.request.GET.get("query")
+        queryset = queryset.defer(*LIST_DEFERRED_FIELDS)
+        return NewspaperFilterForm(self.request.GET).filter_queryset(queryset)
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        return CachedCountPaginator(
+            queryset,
+            per_page,
+            count_key=NewspaperFilterForm(self.request.GET).count_key(),
+            **kwargs,
+        )
 
-        if category:
-            queryset = queryset.filter(topic__name__iexact=category)
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["search_form"] = SearchForm(self.request.GET)
+        context["newspaper_cards"] = render_newspaper_cards(
+            context["newspapers"]
+        )
+        context["top_keywords"] = top_keywords()
+        return context
 
-        if query:
-            queryset = queryset.filter(
-                Q(title__icontains=query)
-                | Q(publishers__first_name__icontains=query)
-                | Q(publishers__last_name__icontains=query)
-                | Q(keywords__name__icontains=query)
-            ).distinct()
 
-        return queryset
+class AsyncNewspaperListView(View):
+    """
+    Async variant of NewspaperListView for ASGI deployments.
+    """
+
+    template_name = NewspaperListView.template_name
+    paginate_by = NewspaperListView.paginate_by
+    replica_reads = True
+
+    async def get(self, request, *args, **kwargs):
+        filter_form = NewspaperFilterForm(request.GET)
+        queryset = await filter_form.afilter_queryset(
+            Newspaper.objects.defer(*LIST_DEFERRED_FIELDS)
+        )
+
+        if queryset.query.order_by:
+            paginator = CachedCountPaginator(
+                queryset, self.paginate_by, count_key=filter_form.count_key()
+            )
+            try:
+                page = await paginator.apage(request.GET.get("page") or 1)
+            except InvalidPage:
+                raise Http404("Invalid page.")
+        else:
+            paginator = CursorPaginator(
+                queryset,
+                self.paginate_by,
+                CursorPaginationMixin.cursor_ordering,
+            )
+            try:
+                page = await paginator.apage(request.GET.get("cursor"))
+            except InvalidCursor:
+                raise Http404("Invalid cursor.")
+
+        return await sync_to_async(self.render_page)(request, paginator, page)
+
+    def render_page(self, request, paginator, page):
+        newspapers = list(page.object_list)
+        return render(
+            request,
+            self.template_name,
+            {
+                "paginator": paginator,
+                "page_obj": page,
+                "is_paginated": page.has_other_pages(),
+                "newspapers": newspapers,
+                "search_form": SearchForm(request.GET),
+                "newspaper_cards": render_newspaper_cards(newspapers),
+                "top_keywords": top_keywords(),
+            },
+        )
+
+
+class KeywordNewspaperListView(CursorPaginationMixin, ListView):
+    model = Newspaper
+    template_name = "pages/keyword_articles.html"
+    context_object_name = "newspapers"
+    paginate_by = 9
+
+    def get_queryset(self):
+        self.keyword = get_object_or_404(Keyword, pk=self.kwargs["pk"])
+        return Newspaper.objects.filter(keywords=self.keyword).defer(
+            *LIST_DEFERRED_FIELDS
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["search_form"] = SearchForm(self.request.GET)
+        context["keyword"] = self.keyword
+        context["newspaper_cards"] = render_newspaper_cards(
+            context["newspapers"]
+        )
         return context
 
 
+def revision_etag(pk, revision, user_pk, navigation) -> str:
+    """
+    Hashes an article revision with the user and the sidebar navigation.
+    """
+    topics = [
+        (topic["id"], topic["name"], topic["newspaper_count"])
+        for topic in navigation
+    ]
+    return hashlib.md5(
+        f"{pk}:{revision}:{user_pk}:{topics}".encode()
+    ).hexdigest()
+
+
+def newspaper_etag(request, pk):
+    """
+    Returns the ETag of an article page for the requesting user.
+    """
+    revision = (
+        Newspaper.objects.filter(pk=pk)
+        .values_list("revision", flat=True)
+        .first()
+    )
+    if revision is None:
+        return None
+    return revision_etag(
+        pk, revision, request.user.pk, topic_navigation()
+    )
+
+
+@method_decorator(condition(etag_func=newspaper_etag), name="get")
 class NewspaperDetailView(LoginRequiredMixin, DetailView):
     model = Newspaper
     template_name = "pages/newspaper_detail.html"
+    replica_reads = True
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("publishers")
+        return (
+            super()
+            .get_queryset()
+            .select_related("topic")
+            .prefetch_related("publishers", "keywords")
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["is_author"] = self.object.publishers.filter(
-            id=self.request.user.id
-        ).exists()
+        context["is_author"] = any(
+            publisher.id == self.request.user.id
+            for publisher in self.object.publishers.all()
+        )
         return context
 
 
+class AsyncNewspaperDetailView(View):
+    """
+    Async variant of NewspaperDetailView for ASGI deployments.
+    """
+
+    template_name = NewspaperDetailView.template_name
+    replica_reads = True
+
+    async def get(self, request, pk, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+
+        revision = await (
+            Newspaper.objects.filter(pk=pk)
+            .values_list("revision", flat=True)
+            .afirst()
+        )
+        if revision is None:
+            raise Http404("No article found.")
+        navigation = await sync_to_async(topic_navigation)()
+        etag = quote_etag(revision_etag(pk, revision, user.pk, navigation))
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            try:
+                newspaper = await (
+                    Newspaper.objects.select_related("topic")
+                    .prefetch_related("publishers", "keywords")
+                    .aget(pk=pk)
+                )
+            except Newspaper.DoesNotExist:
+                raise Http404("No article found.")
+            is_author = any(
+                publisher.id == user.id
+                for publisher in newspaper.publishers.all()
+            )
+            response = await sync_to_async(render)(
+                request,
+                self.template_name,
+                {
+                    "object": newspaper,
+                    "newspaper": newspaper,
+                    "is_author": is_author,
+                },
+            )
+        response["ETag"] = etag
+        return response
+
+
 class ProfileView(LoginRequiredMixin, TemplateView):
     template_name = "pages/profile.html"
 
@@ -216,13 +399,16 @@ class UserDeleteView(LoginRequiredMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-class UserArticlesListView(LoginRequiredMixin, ListView):
+class UserArticlesListView(
+    LoginRequiredMixin, CursorPaginationMixin, ListView
+):
     model = Newspaper
     template_name = "pages/users_articles.html"
     context_object_name = "user_newspapers"
     paginate_by = 5
 
     def get_queryset(self):
+        # Each (newspaper, redactor) link is unique, so no DISTINCT.
         return Newspaper.objects.filter(
             publishers=self.request.user
-        ).distinct()
+        ).defer(*LIST_DEFERRED_FIELDS)
@@ -50,6 +50,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "news.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
@@ -57,15 +58,18 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "news.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # Last, as its process_view may call the view itself.
+    "news.profiling.ProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "newspaper_agency.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "news.metrics.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -74,6 +78,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "news.context_processors.topic_navigation",
             ],
         },
     },
@@ -100,6 +105,121 @@ DATABASES = {
 }
 
 
+# Database connections
+# ASGI executor threads never close their connections, so they only
+# persist under WSGI unless DB_POOL_MAX_SIZE enables psycopg's pool.
+# Django treats each pooled checkout as a new connection and skips its
+# own CONN_HEALTH_CHECKS there; instead it passes the flag on to the
+# pool as ConnectionPool.check_connection, so both paths stay checked.
+
+SERVER_INTERFACE = os.getenv("SERVER_INTERFACE", "wsgi")
+DB_CONN_MAX_AGE = int(
+    os.getenv("DB_CONN_MAX_AGE", 600 if SERVER_INTERFACE == "wsgi" else 0)
+)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 2))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 0))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))
+
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL_MAX_SIZE:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": min(DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE),
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+
+
+# Pagination
+
+PAGINATOR_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("PAGINATOR_COUNT_CACHE_TIMEOUT", 60)
+)
+PAGINATOR_ESTIMATE_THRESHOLD = int(
+    os.getenv("PAGINATOR_ESTIMATE_THRESHOLD", 100000)
+)
+
+
+# Seconds a rendered article card stays in the fragment cache.
+
+NEWSPAPER_CARD_CACHE_TIMEOUT = int(
+    os.getenv("NEWSPAPER_CARD_CACHE_TIMEOUT", 60 * 60 * 24)
+)
+
+
+# Tag cloud cache timeout in seconds
+
+TOP_KEYWORDS_CACHE_TIMEOUT = int(os.getenv("TOP_KEYWORDS_CACHE_TIMEOUT", 60))
+
+
+# Cache
+# LocMemCache is per process; set CACHE_BACKEND to a shared backend
+# when running more than one worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": "news.metrics.instrumented_cache",
+        "WRAPPED_BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
+
+# Request metrics
+
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "1") == "1"
+
+
+# Sampling profiler
+# One in PROFILE_SAMPLE_RATE requests is profiled; 0 turns sampling off.
+
+PROFILE_SAMPLE_RATE = int(os.getenv("PROFILE_SAMPLE_RATE", 0))
+PROFILE_DIR = os.getenv("PROFILE_DIR", BASE_DIR / "profiles")
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", 50))
+PROFILE_TOKEN_MAX_AGE = int(os.getenv("PROFILE_TOKEN_MAX_AGE", 60 * 60))
+
+
+# Slow-query log
+# SLOW_QUERY_MS is in milliseconds; 0 turns the log off.
+
+SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", 200))
+SLOW_QUERY_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER", 200))
+
+
+# Topic navigation and name -> id map lifetimes in seconds
+
+TOPIC_NAVIGATION_CACHE_TIMEOUT = int(
+    os.getenv("TOPIC_NAVIGATION_CACHE_TIMEOUT", 60 * 10)
+)
+TOPIC_MAP_TTL = int(os.getenv("TOPIC_MAP_TTL", 60))
+
+
+# Seconds a rendered RSS/Atom feed body stays cached.
+
+FEED_CACHE_TIMEOUT = int(os.getenv("FEED_CACHE_TIMEOUT", 60 * 60))
+
+
+# Read replicas
+
+DATABASE_REPLICAS = []
+for index, host in enumerate(
+    filter(None, os.getenv("PGREPLICA_HOSTS", "").split(",")), start=1
+):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+
+DATABASE_ROUTERS = ["news.routers.PrimaryReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
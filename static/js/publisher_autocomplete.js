@@ -0,0 +1,43 @@
+// static/js/publisher_autocomplete.js
+// Loads publisher choices on demand instead of rendering every redactor.
+document.querySelectorAll('select[data-autocomplete-url]').forEach(function(select) {
+    var input = document.createElement('input');
+    input.type = 'search';
+    input.className = 'form-control mb-1';
+    input.placeholder = 'Type a name to add an author...';
+    var results = document.createElement('div');
+    results.className = 'list-group mb-2';
+    select.parentNode.insertBefore(input, select);
+    select.parentNode.insertBefore(results, select);
+
+    var timer = null;
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        timer = setTimeout(function() {
+            var term = input.value.trim();
+            results.innerHTML = '';
+            if (!term) {
+                return;
+            }
+            var url = select.dataset.autocompleteUrl + '?q=' + encodeURIComponent(term);
+            fetch(url, {credentials: 'same-origin'})
+                .then(function(response) { return response.json(); })
+                .then(function(data) {
+                    data.results.forEach(function(item) {
+                        var button = document.createElement('button');
+                        button.type = 'button';
+                        button.className = 'list-group-item list-group-item-action';
+                        button.textContent = item.text;
+                        button.addEventListener('click', function() {
+                            if (!select.querySelector('option[value="' + item.id + '"]')) {
+                                select.add(new Option(item.text, item.id, true, true));
+                            }
+                            results.innerHTML = '';
+                            input.value = '';
+                        });
+                        results.appendChild(button);
+                    });
+                });
+        }, 250);
+    });
+});